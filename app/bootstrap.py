@@ -0,0 +1,179 @@
+"""
+One-shot database bootstrap: create tables and load seed data.
+
+Run once per deploy, before the web workers start:
+
+    python -m app.bootstrap
+
+It records what it applied in the schema_version table. Web workers only
+read those rows on startup (`pending_components`), so booting a worker
+never creates tables, counts milestones or parses the seed data, and
+several workers starting together have nothing to race over.
+
+Bump SCHEMA_VERSION when the models change. create_all only adds missing
+tables, so changes to existing tables also go in MIGRATIONS under the new
+version. A database that create_all() built before schema versions were
+recorded counts as version 1 and gets every migration. Seed data needs no
+bump: each seed component stores a checksum of its data and is re-synced,
+writing only the changed rows, whenever the checksum differs.
+"""
+
+import importlib
+from datetime import datetime
+from typing import NamedTuple
+
+from sqlalchemy import inspect, select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from app.database import Base, SessionLocal, engine
+from app.models import SchemaVersion
+
+SCHEMA_VERSION = 7
+MILESTONES_VERSION = 1
+LOCAL_RESOURCES_VERSION = 1
+
+VERSIONS = {
+    "schema": SCHEMA_VERSION,
+    "milestones": MILESTONES_VERSION,
+    "local_resources": LOCAL_RESOURCES_VERSION,
+}
+
+
+class AddColumn(NamedTuple):
+    """ALTER TABLE ... ADD COLUMN, skipped when create_all already made the column."""
+
+    table: str
+    column: str
+    type: str
+
+
+# Steps that bring a database from the previous schema version to this one:
+# AddColumn or a raw SQL statement, which must be safe to re-run
+MIGRATIONS = {
+    2: [AddColumn("schema_version", "checksum", "VARCHAR")],
+    4: [
+        AddColumn("milestone_tracking", "ai_status", "VARCHAR"),
+        "UPDATE milestone_tracking SET ai_status = 'ready' "
+        "WHERE ai_status IS NULL AND ai_response IS NOT NULL",
+        "UPDATE milestone_tracking SET ai_status = 'failed' "
+        "WHERE ai_status IS NULL AND notes IS NOT NULL AND ai_response IS NULL",
+    ],
+    5: [
+        "CREATE INDEX IF NOT EXISTS ix_subscribers_baby_birth_date "
+        "ON subscribers (baby_birth_date)"
+    ],
+    6: [
+        AddColumn("milestones", "slug", "VARCHAR"),
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_milestones_slug ON milestones (slug)",
+    ],
+}
+
+# Databases created by create_all() before schema_version existed have this
+# table but no "schema" row; they are at version 1, not fresh
+BASELINE_TABLE = "subscribers"
+
+# Seed components and the modules providing their seed() and checksum()
+SEEDS = {
+    "milestones": "app.seed.seed_milestones",
+    "local_resources": "app.seed.seed_local_resources",
+}
+
+# Arbitrary key for pg_advisory_lock, so concurrent bootstraps run one at a time
+BOOTSTRAP_LOCK_ID = 7_140_611
+
+
+def _applied_versions(db: Session) -> dict[str, int]:
+    try:
+        return dict(db.execute(select(SchemaVersion.component, SchemaVersion.version)).all())
+    except DBAPIError:
+        # No schema_version table yet
+        db.rollback()
+        return {}
+
+
+def pending_components(db: Session) -> list[str]:
+    """Components whose recorded version is missing or older than this code's."""
+    applied = _applied_versions(db)
+    return [name for name, version in VERSIONS.items() if applied.get(name, 0) < version]
+
+
+def _record(db: Session, component: str, checksum: str | None = None) -> None:
+    row = db.get(SchemaVersion, component) or SchemaVersion(component=component)
+    row.version = VERSIONS[component]
+    row.checksum = checksum
+    row.applied_at = datetime.utcnow()
+    db.add(row)
+    db.commit()
+
+
+def _migrate_schema(db: Session, from_version: int) -> None:
+    if not from_version and inspect(engine).has_table(BASELINE_TABLE):
+        from_version = 1
+    Base.metadata.create_all(bind=engine)
+    if from_version:
+        # A fresh database gets the current schema from create_all directly
+        for version in range(from_version + 1, SCHEMA_VERSION + 1):
+            for step in MIGRATIONS.get(version, []):
+                _apply(db, step)
+    db.commit()
+
+
+def _apply(db: Session, step: "AddColumn | str") -> None:
+    if isinstance(step, AddColumn):
+        columns = inspect(db.connection()).get_columns(step.table)
+        if any(column["name"] == step.column for column in columns):
+            return
+        step = f"ALTER TABLE {step.table} ADD COLUMN {step.column} {step.type}"
+    db.execute(text(step))
+
+
+def bootstrap() -> list[str]:
+    """Apply every pending component; returns the ones applied."""
+    with engine.connect() as lock_conn:
+        if engine.dialect.name == "postgresql":
+            lock_conn.execute(text("SELECT pg_advisory_lock(:id)"), {"id": BOOTSTRAP_LOCK_ID})
+        try:
+            with SessionLocal() as db:
+                applied = []
+                schema_version = _applied_versions(db).get("schema", 0)
+                if schema_version < SCHEMA_VERSION:
+                    _migrate_schema(db, schema_version)
+                    _record(db, "schema")
+                    applied.append("schema")
+
+                for component, module_name in SEEDS.items():
+                    # Seed data is imported here, never by the web workers
+                    module = importlib.import_module(module_name)
+                    checksum = module.checksum()
+                    row = db.get(SchemaVersion, component)
+                    if row and row.version >= VERSIONS[component] and row.checksum == checksum:
+                        continue
+                    module.seed()
+                    _record(db, component, checksum)
+                    applied.append(component)
+                return applied
+        finally:
+            if engine.dialect.name == "postgresql":
+                lock_conn.execute(
+                    text("SELECT pg_advisory_unlock(:id)"), {"id": BOOTSTRAP_LOCK_ID}
+                )
+
+
+def check_bootstrap() -> None:
+    """Fail fast at worker startup when the database needs `python -m app.bootstrap`."""
+    with SessionLocal() as db:
+        pending = pending_components(db)
+    if pending:
+        raise RuntimeError(
+            f"Database is not bootstrapped ({', '.join(pending)} out of date). "
+            "Run `python -m app.bootstrap` before starting the web workers."
+        )
+
+
+if __name__ == "__main__":
+    applied = bootstrap()
+    if applied:
+        print(f"Bootstrapped: {', '.join(applied)}.")
+    else:
+        print("Database is up to date.")
@@ -26,11 +26,81 @@ class Settings:
         "$2b$12$kO8UzrldxQOOazIWrZo5deAB6VjR13A./5PDKb0RN3Mc26.mNoirq",
     )
     DATABASE_URL: str = _get_database_url()
+    # Create tables and seed data on worker startup instead of via
+    # `python -m app.bootstrap`; convenient for local development
+    AUTO_BOOTSTRAP: bool = os.getenv("AUTO_BOOTSTRAP", "false").lower() == "true"
+    # Connection pools per worker process: the async pool serves subscriber
+    # requests, the sync pool admin pages, the outbox and the scheduler
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_SYNC_POOL_SIZE: int = int(os.getenv("DB_SYNC_POOL_SIZE", "3"))
+    DB_SYNC_MAX_OVERFLOW: int = int(os.getenv("DB_SYNC_MAX_OVERFLOW", "2"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    SQLITE_MMAP_BYTES: int = int(os.getenv("SQLITE_MMAP_BYTES", str(256 * 1024 * 1024)))
     RESEND_API_KEY: str = os.getenv("RESEND_API_KEY", "")
     ANTHROPIC_API_KEY: str = os.getenv("ANTHROPIC_API_KEY", "")
     FROM_EMAIL: str = os.getenv("FROM_EMAIL", "hello@newborn-navigator.com")
+    EMAIL_TRANSPORT: str = os.getenv("EMAIL_TRANSPORT", "file")  # file, smtp, resend
+    EMAIL_LOG_SEGMENT_BYTES: int = int(os.getenv("EMAIL_LOG_SEGMENT_BYTES", str(64 * 1024 * 1024)))
+    RESEND_API_URL: str = os.getenv("RESEND_API_URL", "https://api.resend.com")
+    SMTP_HOST: str = os.getenv("SMTP_HOST", "localhost")
+    SMTP_PORT: int = int(os.getenv("SMTP_PORT", "587"))
+    SMTP_USERNAME: str = os.getenv("SMTP_USERNAME", "")
+    SMTP_PASSWORD: str = os.getenv("SMTP_PASSWORD", "")
+    SMTP_STARTTLS: bool = os.getenv("SMTP_STARTTLS", "true").lower() == "true"
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+    PASSWORD_HASH_MAX_PENDING: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "16"))
+    LOGIN_MAX_ATTEMPTS_PER_IP: int = int(os.getenv("LOGIN_MAX_ATTEMPTS_PER_IP", "20"))
+    LOGIN_MAX_ATTEMPTS_PER_USERNAME: int = int(os.getenv("LOGIN_MAX_ATTEMPTS_PER_USERNAME", "10"))
+    LOGIN_THROTTLE_WINDOW_SECONDS: float = float(os.getenv("LOGIN_THROTTLE_WINDOW_SECONDS", "900"))
+    LOGIN_THROTTLE_MAX_KEYS: int = int(os.getenv("LOGIN_THROTTLE_MAX_KEYS", "10000"))
+    LOGIN_USERNAME_MAX_DELAY_SECONDS: float = float(os.getenv("LOGIN_USERNAME_MAX_DELAY_SECONDS", "30"))
+    # Reverse proxies in front of the app that append to X-Forwarded-For
+    # (1 on Render); 0 uses the connecting address as the client IP
+    TRUSTED_PROXY_COUNT: int = int(os.getenv("TRUSTED_PROXY_COUNT", "0"))
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRE_MINUTES: int = 60 * 24  # 24 hours
+    ADMIN_TOKEN_CACHE_SIZE: int = int(os.getenv("ADMIN_TOKEN_CACHE_SIZE", "256"))
+    # How long a cached admin token is trusted before checking for a logout
+    # on another worker again
+    ADMIN_TOKEN_RECHECK_SECONDS: float = float(os.getenv("ADMIN_TOKEN_RECHECK_SECONDS", "30"))
+    BASE_URL: str = os.getenv("BASE_URL", "http://localhost:8000").rstrip("/")
+    # Compiled-template cache written by `python -m app.templating`; empty disables it
+    TEMPLATE_CACHE_DIR: str = os.getenv("TEMPLATE_CACHE_DIR", str(BASE_DIR / ".template_cache"))
+    TEMPLATE_AUTO_RELOAD: bool = os.getenv("TEMPLATE_AUTO_RELOAD", "false").lower() == "true"
+    BROADCAST_BATCH_SIZE: int = int(os.getenv("BROADCAST_BATCH_SIZE", "500"))
+    BROADCAST_CONCURRENCY: int = int(os.getenv("BROADCAST_CONCURRENCY", "20"))
+    OUTBOX_ENABLED: bool = os.getenv("OUTBOX_ENABLED", "true").lower() == "true"
+    OUTBOX_BATCH_SIZE: int = int(os.getenv("OUTBOX_BATCH_SIZE", "100"))
+    OUTBOX_MAX_ATTEMPTS: int = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "5"))
+    OUTBOX_RETRY_BASE_SECONDS: float = float(os.getenv("OUTBOX_RETRY_BASE_SECONDS", "30"))
+    OUTBOX_LEASE_SECONDS: int = int(os.getenv("OUTBOX_LEASE_SECONDS", "300"))
+    OUTBOX_POLL_SECONDS: float = float(os.getenv("OUTBOX_POLL_SECONDS", "5"))
+    SCHEDULER_ENABLED: bool = os.getenv("SCHEDULER_ENABLED", "true").lower() == "true"
+    SCHEDULER_HOUR_UTC: int = int(os.getenv("SCHEDULER_HOUR_UTC", "13"))  # 9am New York
+    SCHEDULER_INTERVAL_SECONDS: int = int(os.getenv("SCHEDULER_INTERVAL_SECONDS", "900"))
+    SUBSCRIBER_CACHE_SIZE: int = int(os.getenv("SUBSCRIBER_CACHE_SIZE", "10000"))
+    SUBSCRIBER_CACHE_TTL_SECONDS: float = float(os.getenv("SUBSCRIBER_CACHE_TTL_SECONDS", "30"))
+    CHAT_PROMPT_CACHE_SIZE: int = int(os.getenv("CHAT_PROMPT_CACHE_SIZE", "2000"))
+    CHAT_TRACKING_HISTORY_LIMIT: int = int(os.getenv("CHAT_TRACKING_HISTORY_LIMIT", "40"))
+    CHAT_WINDOW_MESSAGES: int = int(os.getenv("CHAT_WINDOW_MESSAGES", "8"))
+    CHAT_COMPACT_EVERY: int = int(os.getenv("CHAT_COMPACT_EVERY", "8"))
+    CHAT_SUMMARY_MAX_TOKENS: int = int(os.getenv("CHAT_SUMMARY_MAX_TOKENS", "400"))
+    NOTE_RESPONSE_WORKERS: int = int(os.getenv("NOTE_RESPONSE_WORKERS", "4"))
+    NOTE_RESPONSE_QUEUE_SIZE: int = int(os.getenv("NOTE_RESPONSE_QUEUE_SIZE", "200"))
+    NOTE_RESPONSE_TIMEOUT_SECONDS: float = float(os.getenv("NOTE_RESPONSE_TIMEOUT_SECONDS", "30"))
+    NOTE_CACHE_SIZE: int = int(os.getenv("NOTE_CACHE_SIZE", "5000"))
+    NOTE_CACHE_TTL_SECONDS: float = float(os.getenv("NOTE_CACHE_TTL_SECONDS", "86400"))
+    NOTE_CACHE_SIMILARITY: float = float(os.getenv("NOTE_CACHE_SIMILARITY", "0"))  # 0 = exact matches only
+    # Web worker processes; gunicorn reads it too, and the outbox splits the
+    # provider rate limit between them
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "1"))
+    # Provider rate limit across all web workers
+    EMAIL_RATE_LIMIT: float = float(os.getenv("EMAIL_RATE_LIMIT", "10"))
+    EMAIL_RATE_BURST: float = float(os.getenv("EMAIL_RATE_BURST", "20"))
 
 
 settings = Settings()
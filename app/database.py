@@ -1,17 +1,165 @@
-from sqlalchemy import create_engine
+import threading
+import time
+
+from sqlalchemy import URL, create_engine, event, exc, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from app.config import settings
 
+IS_SQLITE = settings.DATABASE_URL.startswith("sqlite")
+
 # Only use check_same_thread for SQLite
 connect_args = {}
-if settings.DATABASE_URL.startswith("sqlite"):
+if IS_SQLITE:
     connect_args["check_same_thread"] = False
 
-engine = create_engine(settings.DATABASE_URL, connect_args=connect_args)
+
+class PoolStats:
+    """Counters for one connection pool, fed by pool events."""
+
+    def __init__(self):
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.waits += 1
+            self.wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self, pool) -> dict:
+        with self._lock:
+            return {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "overflow": max(pool.overflow(), 0),
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "mean_wait_ms": round(self.wait_seconds / self.waits * 1000, 3) if self.waits else None,
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+            }
+
+
+def _timed_pool(pool_class, stats: PoolStats):
+    """Pool class that records how long each checkout waited, including
+    opening a new connection when the pool has room for one."""
+
+    class TimedPool(pool_class):
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                conn = super()._do_get()
+            except exc.TimeoutError:
+                stats.record_wait(time.perf_counter() - start, timed_out=True)
+                raise
+            stats.record_wait(time.perf_counter() - start)
+            return conn
+
+    return TimedPool
+
+
+def _watch_pool(sync_engine, stats: PoolStats) -> None:
+    def on_connect(dbapi_connection, connection_record):
+        stats.count("connects")
+        if IS_SQLITE:
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute(f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}")
+            cursor.execute(f"PRAGMA mmap_size={settings.SQLITE_MMAP_BYTES}")
+            cursor.close()
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        stats.count("checkouts")
+
+    def on_checkin(dbapi_connection, connection_record):
+        stats.count("checkins")
+
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        stats.count("invalidations")
+
+    event.listen(sync_engine, "connect", on_connect)
+    event.listen(sync_engine, "checkout", on_checkout)
+    event.listen(sync_engine, "checkin", on_checkin)
+    event.listen(sync_engine, "invalidate", on_invalidate)
+
+
+def _pool_options(size: int, overflow: int) -> dict:
+    return {
+        "pool_size": size,
+        "max_overflow": overflow,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+sync_pool_stats = PoolStats()
+engine = create_engine(
+    settings.DATABASE_URL,
+    connect_args=connect_args,
+    poolclass=_timed_pool(QueuePool, sync_pool_stats),
+    **_pool_options(settings.DB_SYNC_POOL_SIZE, settings.DB_SYNC_MAX_OVERFLOW),
+)
+_watch_pool(engine, sync_pool_stats)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+
+def _async_url(url: str) -> URL:
+    """The same database through its asyncio driver (aiosqlite / asyncpg)."""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    url = url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+    if backend == "postgresql" and "sslmode" in url.query:
+        # asyncpg spells libpq's sslmode as ssl
+        url = url.difference_update_query(["sslmode"]).update_query_dict(
+            {"ssl": url.query["sslmode"]}
+        )
+    return url
+
+
+# Request handlers use the async engine so queries never block the event
+# loop; background threads, scripts and the admin pages use the sync one.
+async_pool_stats = PoolStats()
+async_engine = create_async_engine(
+    _async_url(settings.DATABASE_URL),
+    poolclass=_timed_pool(AsyncAdaptedQueuePool, async_pool_stats),
+    **_pool_options(settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW),
+)
+_watch_pool(async_engine.sync_engine, async_pool_stats)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
+
+def pool_metrics() -> dict:
+    return {
+        "async": async_pool_stats.snapshot(async_engine.pool),
+        "sync": sync_pool_stats.snapshot(engine.pool),
+    }
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -22,3 +170,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
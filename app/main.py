@@ -1,25 +1,50 @@
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 from starlette.middleware.sessions import SessionMiddleware
 
+from app.bootstrap import bootstrap, check_bootstrap
 from app.config import settings
-from app.database import Base, engine
+from app.database import async_engine
 from app.routes import auth, admin, public
-
-# Create tables
-Base.metadata.create_all(bind=engine)
-
-# Auto-seed milestone data if empty
-from app.seed.seed_milestones import seed as seed_milestones
-seed_milestones()
-
-app = FastAPI(title="NewbornAI Navigator")
-templates = Jinja2Templates(directory=Path(__file__).parent / "templates")
+from app.services.auth import password_hasher
+from app.services.email_transport import close_transport
+from app.services.milestone_catalog import milestone_catalog
+from app.services.note_responses import note_responder
+from app.services.outbox import outbox_worker
+from app.services.scheduler import daily_scheduler
+from app.templating import precompile, templates
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.AUTO_BOOTSTRAP:
+        bootstrap()
+    else:
+        check_bootstrap()
+    milestone_catalog.load()
+    precompile()
+    note_responder.start()
+    if settings.OUTBOX_ENABLED:
+        outbox_worker.start()
+    if settings.SCHEDULER_ENABLED:
+        daily_scheduler.start()
+    yield
+    if settings.SCHEDULER_ENABLED:
+        await daily_scheduler.stop()
+    if settings.OUTBOX_ENABLED:
+        await outbox_worker.stop()
+    await note_responder.stop()
+    password_hasher.shutdown()
+    await close_transport()
+    await async_engine.dispose()
+
+
+app = FastAPI(title="NewbornAI Navigator", lifespan=lifespan)
 
 # Middleware
 app.add_middleware(SessionMiddleware, secret_key=settings.SECRET_KEY)
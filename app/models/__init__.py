@@ -4,5 +4,10 @@ from app.models.milestone import Milestone
 from app.models.local_resource import LocalResource
 from app.models.milestone_tracking import MilestoneTracking
 from app.models.calendar_event import CalendarEvent
+from app.models.broadcast import Broadcast, OutboxMessage
+from app.models.scheduler_run import SchedulerRun
+from app.models.schema_version import SchemaVersion
+from app.models.chat import ChatConversation, ChatMessage
+from app.models.revoked_token import RevokedToken
 
-__all__ = ["Subscriber", "NewsletterIssue", "ContentSection", "Milestone", "LocalResource", "MilestoneTracking", "CalendarEvent"]
+__all__ = ["Subscriber", "NewsletterIssue", "ContentSection", "Milestone", "LocalResource", "MilestoneTracking", "CalendarEvent", "Broadcast", "OutboxMessage", "SchedulerRun", "SchemaVersion", "ChatConversation", "ChatMessage", "RevokedToken"]
@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, UniqueConstraint, Index
+from app.database import Base
+
+
+class Broadcast(Base):
+    """One admin-initiated run that enqueues an issue for its week's subscribers."""
+
+    __tablename__ = "broadcasts"
+
+    id = Column(Integer, primary_key=True, index=True)
+    newsletter_id = Column(Integer, ForeignKey("newsletter_issues.id"), nullable=False, index=True)
+    status = Column(String, default="pending")  # pending, enqueuing, queued, failed
+    enqueued_count = Column(Integer, default=0)
+    error = Column(Text, nullable=True)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class OutboxMessage(Base):
+    """A newsletter issue queued for delivery to one subscriber.
+
+    Unique per (issue, subscriber), so re-running or resuming a broadcast
+    never enqueues anyone twice.
+    """
+
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        UniqueConstraint("newsletter_id", "subscriber_id", name="uq_outbox_newsletter_subscriber"),
+        Index("ix_outbox_claim", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    newsletter_id = Column(Integer, ForeignKey("newsletter_issues.id"), nullable=False, index=True)
+    subscriber_id = Column(Integer, ForeignKey("subscribers.id"), nullable=False, index=True)
+    broadcast_id = Column(Integer, ForeignKey("broadcasts.id"), nullable=True)
+    status = Column(String, nullable=False, default="pending")  # pending, sending, sent, failed, skipped
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    claimed_by = Column(String, nullable=True)
+    claimed_at = Column(DateTime, nullable=True)
+    provider_id = Column(String, nullable=True)
+    error = Column(Text, nullable=True)
+    sent_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
+from app.database import Base
+
+
+class ChatConversation(Base):
+    """A subscriber's running chat summary: everything up to and including
+    message `summarized_through_id`, compacted into `summary`."""
+
+    __tablename__ = "chat_conversations"
+
+    subscriber_id = Column(Integer, ForeignKey("subscribers.id"), primary_key=True)
+    summary = Column(Text, nullable=True)
+    summarized_through_id = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class ChatMessage(Base):
+    """One chat turn not yet folded into the conversation summary."""
+
+    __tablename__ = "chat_messages"
+    __table_args__ = (
+        Index("ix_chat_messages_subscriber", "subscriber_id", "id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    subscriber_id = Column(Integer, ForeignKey("subscribers.id"), nullable=False)
+    role = Column(String, nullable=False)  # "user" or "assistant"
+    content = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
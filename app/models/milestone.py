@@ -8,6 +8,8 @@ class Milestone(Base):
     __tablename__ = "milestones"
 
     id = Column(Integer, primary_key=True, index=True)
+    # Stable key for the seed data, kept when a title is edited
+    slug = Column(String, nullable=True, unique=True, index=True)
     week_number = Column(Integer, nullable=False, index=True)  # 0-16
     category = Column(
         String, nullable=False
@@ -16,6 +16,7 @@ class MilestoneTracking(Base):
     status = Column(String, nullable=True)  # "achieved" or "concern"; NULL = not tracked
     notes = Column(Text, nullable=True)
     ai_response = Column(Text, nullable=True)  # AI's response to the parent's note
+    ai_status = Column(String, nullable=True)  # "pending", "ready" or "failed"; NULL = no note
     achieved_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -23,6 +23,11 @@ class NewsletterIssue(Base):
         cascade="all, delete-orphan",
         order_by="ContentSection.sort_order",
     )
+    broadcasts = relationship(
+        "Broadcast",
+        cascade="all, delete-orphan",
+        order_by="Broadcast.created_at.desc()",
+    )
 
 
 class ContentSection(Base):
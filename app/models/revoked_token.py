@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, DateTime
+from app.database import Base
+
+
+class RevokedToken(Base):
+    """An admin session logged out before it expired, shared by every worker."""
+
+    __tablename__ = "revoked_tokens"
+
+    token_hash = Column(String, primary_key=True)  # SHA-256 of the JWT
+    expires_at = Column(DateTime, nullable=False, index=True)  # the token's exp
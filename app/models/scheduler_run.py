@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, DateTime, Date, UniqueConstraint
+from app.database import Base
+
+
+class SchedulerRun(Base):
+    """Claims a daily job so only one web worker runs it per day."""
+
+    __tablename__ = "scheduler_runs"
+    __table_args__ = (
+        UniqueConstraint("job", "run_date", name="uq_scheduler_job_date"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    job = Column(String, nullable=False)
+    run_date = Column(Date, nullable=False)
+    enqueued_count = Column(Integer, default=0)
+    started_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
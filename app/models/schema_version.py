@@ -0,0 +1,15 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, DateTime
+from app.database import Base
+
+
+class SchemaVersion(Base):
+    """What `python -m app.bootstrap` last applied, one row per component."""
+
+    __tablename__ = "schema_version"
+
+    component = Column(String, primary_key=True)  # "schema", "milestones", "local_resources"
+    version = Column(Integer, nullable=False)
+    checksum = Column(String, nullable=True)  # seed components: hash of the seed data
+    applied_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -12,7 +12,7 @@ class Subscriber(Base):
     email = Column(String, unique=True, index=True, nullable=False)
     name = Column(String, nullable=True)
     baby_name = Column(String, nullable=True)
-    baby_birth_date = Column(Date, nullable=True)
+    baby_birth_date = Column(Date, nullable=True, index=True)
     baby_due_date = Column(Date, nullable=True)
     neighborhood = Column(String, nullable=True)
     tier = Column(String, default="free")  # free or paid
@@ -1,17 +1,23 @@
-from pathlib import Path
-
-from fastapi import APIRouter, Depends, Form, Query, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, Form, Query, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
-from app.database import get_db
-from app.models import Subscriber, NewsletterIssue, ContentSection, Milestone
-from app.services.auth import get_current_admin
+from app.database import get_db, pool_metrics
+from app.models import Subscriber, NewsletterIssue, ContentSection, OutboxMessage
+from app.services.auth import admin_tokens, get_current_admin, password_hasher
+from app.services.broadcast import enqueue_broadcast, outbox_counts, retry_failed, start_broadcast
+from app.services.chat_history import chat_stats
+from app.services.chat_prompt import prompt_cache
 from app.services.email import send_email
+from app.services.login_throttle import login_throttle
+from app.services.milestone_catalog import milestone_catalog
+from app.services.newsletter_render import recipient_fields, render_cache
+from app.services.note_cache import note_cache
+from app.services.note_responses import note_responder
+from app.services.subscriber_cache import subscriber_cache
+from app.templating import templates
 
 router = APIRouter(prefix="/admin", tags=["admin"])
-templates = Jinja2Templates(directory=Path(__file__).parent.parent / "templates")
 
 SECTION_TYPES = ["greeting", "milestones", "noteworthy", "tips", "qa", "custom"]
 
@@ -129,6 +135,7 @@ async def newsletter_detail(
             "admin": admin,
             "newsletter": newsletter,
             "section_types": SECTION_TYPES,
+            "outbox_counts": outbox_counts(db, newsletter.id),
         },
     )
 
@@ -151,6 +158,7 @@ async def newsletter_edit(
         newsletter.week_number = week_number
         newsletter.status = status
         db.commit()
+        render_cache.invalidate(newsletter_id)
     return RedirectResponse(
         url=f"/admin/newsletters/{newsletter_id}", status_code=303
     )
@@ -164,8 +172,12 @@ async def newsletter_delete(
 ):
     newsletter = db.query(NewsletterIssue).get(newsletter_id)
     if newsletter:
+        db.query(OutboxMessage).filter(
+            OutboxMessage.newsletter_id == newsletter_id
+        ).delete(synchronize_session=False)
         db.delete(newsletter)
         db.commit()
+        render_cache.invalidate(newsletter_id)
     return RedirectResponse(url="/admin/newsletters", status_code=303)
 
 
@@ -193,6 +205,7 @@ async def section_add(
     )
     db.add(section)
     db.commit()
+    render_cache.invalidate(newsletter_id)
     return RedirectResponse(
         url=f"/admin/newsletters/{newsletter_id}", status_code=303
     )
@@ -215,6 +228,7 @@ async def section_edit(
         section.sort_order = sort_order
         section.is_paid_only = is_paid_only
         db.commit()
+        render_cache.invalidate(section.newsletter_id)
         return RedirectResponse(
             url=f"/admin/newsletters/{section.newsletter_id}", status_code=303
         )
@@ -232,6 +246,7 @@ async def section_delete(
         newsletter_id = section.newsletter_id
         db.delete(section)
         db.commit()
+        render_cache.invalidate(newsletter_id)
         return RedirectResponse(
             url=f"/admin/newsletters/{newsletter_id}", status_code=303
         )
@@ -252,18 +267,14 @@ async def preview_email(
     if not newsletter:
         return RedirectResponse(url="/admin/newsletters", status_code=303)
 
-    milestones = (
-        db.query(Milestone)
-        .filter(Milestone.week_number == newsletter.week_number)
-        .order_by(Milestone.category)
-        .all()
-    )
+    milestones = milestone_catalog.for_week(newsletter.week_number)
 
     return templates.TemplateResponse(
         "email/newsletter.html",
         {
             "request": request,
             "newsletter": newsletter,
+            "sections": newsletter.sections,
             "milestones": milestones,
             "subscriber_name": "Preview Parent",
             "baby_name": "Baby",
@@ -286,29 +297,75 @@ async def send_test_email(
     if not newsletter:
         return RedirectResponse(url="/admin/newsletters", status_code=303)
 
-    milestones = (
-        db.query(Milestone)
-        .filter(Milestone.week_number == newsletter.week_number)
-        .order_by(Milestone.category)
-        .all()
+    milestones = milestone_catalog.for_week(newsletter.week_number)
+
+    html_body = render_cache.get(newsletter, milestones, "paid").fill(
+        recipient_fields("Test Parent", "Baby", "#")
     )
 
-    html_body = templates.TemplateResponse(
-        "email/newsletter.html",
+    result = await send_email(to=test_email, subject=newsletter.subject_line, html_body=html_body)
+
+    return templates.TemplateResponse(
+        "admin/newsletter_detail.html",
         {
             "request": request,
+            "admin": admin,
             "newsletter": newsletter,
-            "milestones": milestones,
-            "subscriber_name": "Test Parent",
-            "baby_name": "Baby",
-            "baby_age_weeks": newsletter.week_number,
-            "unsubscribe_url": "#",
-            "is_preview": False,
+            "section_types": SECTION_TYPES,
+            "outbox_counts": outbox_counts(db, newsletter.id),
+            "flash": (
+                f"Test email logged! File: {result['path']}"
+                if "path" in result
+                else f"Test email sent! Id: {result.get('id', 'N/A')}"
+            ),
+        },
+    )
+
+
+@router.post("/newsletters/{newsletter_id}/broadcast")
+async def broadcast_newsletter(
+    request: Request,
+    newsletter_id: int,
+    background_tasks: BackgroundTasks,
+    admin: str = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    newsletter = db.query(NewsletterIssue).get(newsletter_id)
+    if not newsletter:
+        return RedirectResponse(url="/admin/newsletters", status_code=303)
+
+    broadcast = start_broadcast(db, newsletter)
+    if broadcast:
+        background_tasks.add_task(enqueue_broadcast, broadcast.id)
+        flash = f"Broadcast #{broadcast.id} started for week {newsletter.week_number} subscribers."
+    else:
+        flash = "A broadcast for this newsletter is already being queued."
+
+    return templates.TemplateResponse(
+        "admin/newsletter_detail.html",
+        {
+            "request": request,
+            "admin": admin,
+            "newsletter": newsletter,
+            "section_types": SECTION_TYPES,
+            "outbox_counts": outbox_counts(db, newsletter.id),
+            "flash": flash,
         },
-    ).body.decode()
+    )
+
 
-    result = send_email(to=test_email, subject=newsletter.subject_line, html_body=html_body)
+@router.post("/newsletters/{newsletter_id}/broadcast/retry")
+async def broadcast_retry_failed(
+    request: Request,
+    newsletter_id: int,
+    admin: str = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    newsletter = db.query(NewsletterIssue).get(newsletter_id)
+    if not newsletter:
+        return RedirectResponse(url="/admin/newsletters", status_code=303)
 
+    count = retry_failed(db, newsletter_id)
     return templates.TemplateResponse(
         "admin/newsletter_detail.html",
         {
@@ -316,7 +373,8 @@ async def send_test_email(
             "admin": admin,
             "newsletter": newsletter,
             "section_types": SECTION_TYPES,
-            "flash": f"Test email logged! File: {result.get('path', 'N/A')}",
+            "outbox_counts": outbox_counts(db, newsletter.id),
+            "flash": f"Re-queued {count} failed deliveries.",
         },
     )
 
@@ -354,15 +412,8 @@ async def milestone_browser(
     admin: str = Depends(get_current_admin),
     db: Session = Depends(get_db),
 ):
-    milestones = (
-        db.query(Milestone)
-        .filter(Milestone.week_number == week)
-        .order_by(Milestone.category, Milestone.id)
-        .all()
-    )
-    categories = {}
-    for m in milestones:
-        categories.setdefault(m.category, []).append(m)
+    milestones = milestone_catalog.for_week(week)
+    categories = milestone_catalog.categories(week)
 
     return templates.TemplateResponse(
         "admin/milestones.html",
@@ -375,3 +426,22 @@ async def milestone_browser(
             "weeks": list(range(0, 13)),
         },
     )
+
+
+# ── Metrics ──────────────────────────────────────────────────────────────────
+
+
+@router.get("/metrics")
+async def metrics(admin: str = Depends(get_current_admin)):
+    return {
+        "subscriber_cache": subscriber_cache.stats(),
+        "chat_prompt_cache": prompt_cache.stats(),
+        "chat": chat_stats.stats(),
+        "note_responses": note_responder.stats(),
+        "note_reply_cache": note_cache.stats(),
+        "admin_tokens": admin_tokens.stats(),
+        "password_hashing": password_hasher.stats(),
+        "login_throttle": login_throttle.stats(),
+        "render_cache": {"hits": render_cache.hits, "misses": render_cache.misses},
+        "db_pools": pool_metrics(),
+    }
@@ -1,14 +1,14 @@
-from pathlib import Path
+import asyncio
 
 from fastapi import APIRouter, Form, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 
 from app.config import settings
-from app.services.auth import verify_password, create_access_token
+from app.services.auth import admin_tokens, create_access_token, password_hasher
+from app.services.login_throttle import login_throttle
+from app.templating import templates
 
 router = APIRouter(prefix="/auth", tags=["auth"])
-templates = Jinja2Templates(directory=Path(__file__).parent.parent / "templates")
 
 
 @router.get("/login", response_class=HTMLResponse)
@@ -18,14 +18,25 @@ async def login_page(request: Request):
 
 @router.post("/login")
 async def login(request: Request, username: str = Form(...), password: str = Form(...)):
-    if username != settings.ADMIN_USERNAME or not verify_password(
-        password, settings.ADMIN_PASSWORD_HASH
-    ):
+    client_ip = _client_ip(request)
+    verdict = login_throttle.attempt(client_ip, username)
+    if verdict.retry_after:
+        return _too_many_attempts(request, verdict.retry_after)
+    if verdict.delay:
+        await asyncio.sleep(verdict.delay)
+
+    valid = False
+    if username == settings.ADMIN_USERNAME:
+        valid = await password_hasher.verify(password, settings.ADMIN_PASSWORD_HASH)
+        if valid is None:
+            return _too_many_attempts(request, 5)
+    if not valid:
         return templates.TemplateResponse(
             "auth/login.html",
             {"request": request, "error": "Invalid username or password"},
             status_code=401,
         )
+    login_throttle.succeeded(client_ip, username)
 
     token = create_access_token(data={"sub": username})
     response = RedirectResponse(url="/admin", status_code=303)
@@ -39,8 +50,39 @@ async def login(request: Request, username: str = Form(...), password: str = For
     return response
 
 
+def _client_ip(request: Request) -> str:
+    """The client's address, as seen by the outermost trusted proxy.
+
+    Each of the TRUSTED_PROXY_COUNT proxies appends the address it was
+    connected from to X-Forwarded-For, so the client is that many entries
+    from the end; anything further left was sent by the client itself and
+    could be forged.
+    """
+    if settings.TRUSTED_PROXY_COUNT:
+        forwarded = [
+            host.strip()
+            for host in request.headers.get("x-forwarded-for", "").split(",")
+            if host.strip()
+        ]
+        if len(forwarded) >= settings.TRUSTED_PROXY_COUNT:
+            return forwarded[-settings.TRUSTED_PROXY_COUNT]
+    return request.client.host if request.client else "unknown"
+
+
+def _too_many_attempts(request: Request, retry_after: int) -> HTMLResponse:
+    return templates.TemplateResponse(
+        "auth/login.html",
+        {"request": request, "error": "Too many login attempts. Please try again later."},
+        status_code=429,
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
 @router.get("/logout")
-async def logout():
+async def logout(request: Request):
+    token = request.cookies.get("access_token")
+    if token:
+        admin_tokens.revoke(token)
     response = RedirectResponse(url="/auth/login", status_code=303)
     response.delete_cookie("access_token")
     return response
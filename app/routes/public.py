@@ -2,19 +2,37 @@ import calendar
 import json
 import uuid
 from datetime import date, datetime, time, timedelta
-from pathlib import Path
+from time import perf_counter
+from types import SimpleNamespace
 
 from fastapi import APIRouter, Depends, Form, Query, Request
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, StreamingResponse
-from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
-
-from app.database import get_db
-from app.models import Subscriber, Milestone, NewsletterIssue, LocalResource, MilestoneTracking, CalendarEvent
-from app.services.ai_chat import build_system_prompt, stream_chat_response, generate_milestone_response
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from starlette.background import BackgroundTask
+
+from app.config import settings
+from app.database import AsyncSessionLocal, get_async_db
+from app.models import Subscriber, NewsletterIssue, LocalResource, MilestoneTracking, CalendarEvent
+from app.services.ai_chat import stream_chat_response, summary_block
+from app.services.chat_history import (
+    add_message,
+    chat_stats,
+    clear_conversation,
+    compact_after_reply,
+    load_window,
+)
+from app.services.chat_prompt import prompt_cache
+from app.services.milestone_catalog import milestone_catalog
+from app.services.note_cache import note_cache
+from app.services.note_responses import NoteJob, note_responder
+from app.services.progress import progress_from_rows, week_progress
+from app.services.subscriber_cache import subscriber_cache
+from app.services.tracking import note_response, save_notes, set_ai_response, toggle_status
+from app.templating import render_fragment, stream_page, templates
 
 router = APIRouter(tags=["public"])
-templates = Jinja2Templates(directory=Path(__file__).parent.parent / "templates")
 
 
 def _baby_age_weeks(birth_date: date | None) -> int | None:
@@ -41,12 +59,10 @@ async def subscriber_login_page(request: Request):
 async def subscriber_login(
     request: Request,
     email: str = Form(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    subscriber = (
-        db.query(Subscriber)
-        .filter(Subscriber.email == email, Subscriber.is_active == True)
-        .first()
+    subscriber = await db.scalar(
+        select(Subscriber).where(Subscriber.email == email, Subscriber.is_active == True)
     )
     if not subscriber:
         return templates.TemplateResponse(
@@ -73,13 +89,14 @@ async def subscribe(
     baby_name: str = Form(""),
     baby_birth_date: str = Form(""),
     baby_due_date: str = Form(""),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    existing = db.query(Subscriber).filter(Subscriber.email == email).first()
+    existing = await db.scalar(select(Subscriber).where(Subscriber.email == email))
     if existing:
         if not existing.is_active:
             existing.is_active = True
-            db.commit()
+            await db.commit()
+            subscriber_cache.invalidate(existing.unsubscribe_token)
         # Redirect to the correct week based on baby's age
         baby_age = _baby_age_weeks(existing.baby_birth_date)
         week = min(baby_age, 16) if baby_age is not None else 0
@@ -104,8 +121,7 @@ async def subscribe(
         unsubscribe_token=uuid.uuid4().hex,
     )
     db.add(subscriber)
-    db.commit()
-    db.refresh(subscriber)
+    await db.commit()
 
     # Redirect to the correct week based on baby's age
     baby_age = _baby_age_weeks(subscriber.baby_birth_date)
@@ -123,11 +139,9 @@ async def my_updates(
     request: Request,
     token: str,
     week: int | None = Query(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    subscriber = (
-        db.query(Subscriber).filter(Subscriber.unsubscribe_token == token).first()
-    )
+    subscriber = await subscriber_cache.get(db, token)
     if not subscriber:
         return templates.TemplateResponse(
             "error.html",
@@ -144,12 +158,7 @@ async def my_updates(
         week = min(baby_age, 16) if baby_age is not None else 0
 
     # Get milestones for this week
-    milestones = (
-        db.query(Milestone)
-        .filter(Milestone.week_number == week)
-        .order_by(Milestone.category, Milestone.id)
-        .all()
-    )
+    milestones = milestone_catalog.for_week(week)
     categories = {}
     for m in milestones:
         label = (
@@ -159,59 +168,65 @@ async def my_updates(
         )
         categories.setdefault(label, []).append(m)
 
-    # Get matching newsletter issue if one exists
-    newsletter = (
-        db.query(NewsletterIssue)
-        .filter(NewsletterIssue.week_number == week)
-        .order_by(NewsletterIssue.created_at.desc())
-        .first()
-    )
-
-    # Build the list of all available weeks that have newsletters
-    available_issues = (
-        db.query(NewsletterIssue)
-        .filter(NewsletterIssue.status.in_(["sent", "draft", "scheduled"]))
-        .order_by(NewsletterIssue.week_number)
-        .all()
-    )
-
-    # Get tracking data for this subscriber + this week's milestones
     milestone_ids = [m.id for m in milestones]
-    tracking_rows = (
-        db.query(MilestoneTracking)
-        .filter(
-            MilestoneTracking.subscriber_id == subscriber.id,
-            MilestoneTracking.milestone_id.in_(milestone_ids),
-        )
-        .all()
-    ) if milestone_ids else []
-    tracking = {t.milestone_id: t for t in tracking_rows}
-
-    # Progress counts for the progress bar
-    total_count = len(milestones)
-    achieved_count = sum(1 for t in tracking_rows if t.status == "achieved")
-    concern_count = sum(1 for t in tracking_rows if t.status == "concern")
-    untracked_count = total_count - achieved_count - concern_count
-
-    return templates.TemplateResponse(
-        "public/my_updates.html",
-        {
-            "request": request,
-            "subscriber": subscriber,
-            "baby_age": baby_age,
-            "week": week,
-            "milestones": milestones,
-            "categories": categories,
-            "newsletter": newsletter,
-            "available_issues": available_issues,
-            "token": token,
-            "tracking": tracking,
-            "total_count": total_count,
-            "achieved_count": achieved_count,
-            "concern_count": concern_count,
-            "untracked_count": untracked_count,
-            "baby_name": subscriber.baby_name,
-        },
+    page = SimpleNamespace()
+
+    # The page streams: the header goes out straight away, and each later
+    # part once the query it needs has run, each in a short session of its
+    # own so a slow download does not hold a connection.
+    async def load_newsletter():
+        async with AsyncSessionLocal() as db:
+            page.newsletter = await db.scalar(
+                select(NewsletterIssue)
+                .options(selectinload(NewsletterIssue.sections))
+                .where(NewsletterIssue.week_number == week)
+                .order_by(NewsletterIssue.created_at.desc())
+                .limit(1)
+            )
+
+    async def load_tracking():
+        tracking_rows = []
+        if milestone_ids:
+            async with AsyncSessionLocal() as db:
+                tracking_rows = (
+                    await db.scalars(
+                        select(MilestoneTracking).where(
+                            MilestoneTracking.subscriber_id == subscriber.id,
+                            MilestoneTracking.milestone_id.in_(milestone_ids),
+                        )
+                    )
+                ).all()
+        page.tracking = {t.milestone_id: t for t in tracking_rows}
+        page.progress = progress_from_rows(week, tracking_rows)
+
+    async def load_available_issues():
+        # All weeks that have newsletters
+        async with AsyncSessionLocal() as db:
+            page.available_issues = (
+                await db.scalars(
+                    select(NewsletterIssue)
+                    .where(NewsletterIssue.status.in_(["sent", "draft", "scheduled"]))
+                    .order_by(NewsletterIssue.week_number)
+                )
+            ).all()
+
+    return StreamingResponse(
+        stream_page(
+            "public/my_updates.html",
+            {
+                "request": request,
+                "subscriber": subscriber,
+                "baby_age": baby_age,
+                "week": week,
+                "milestones": milestones,
+                "categories": categories,
+                "token": token,
+                "page": page,
+                "baby_name": subscriber.baby_name,
+            },
+            [load_newsletter, load_tracking, load_available_issues],
+        ),
+        media_type="text/html",
     )
 
 
@@ -223,96 +238,32 @@ async def toggle_milestone(
     request: Request,
     token: str,
     milestone_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    subscriber = _get_subscriber_or_404(token, db)
+    subscriber = await _get_subscriber_or_404(token, db)
     if not subscriber:
         return HTMLResponse("Not found", status_code=404)
 
-    milestone = db.query(Milestone).filter(Milestone.id == milestone_id).first()
+    milestone = milestone_catalog.get(milestone_id)
     if not milestone:
         return HTMLResponse("Milestone not found", status_code=404)
 
-    track = (
-        db.query(MilestoneTracking)
-        .filter(
-            MilestoneTracking.subscriber_id == subscriber.id,
-            MilestoneTracking.milestone_id == milestone_id,
-        )
-        .first()
-    )
-
-    if not track:
-        track = MilestoneTracking(
-            subscriber_id=subscriber.id,
-            milestone_id=milestone_id,
-            status="achieved",
-            achieved_at=datetime.utcnow(),
-        )
-        db.add(track)
-    elif track.status == "achieved":
-        track.status = "concern"
-        track.achieved_at = None
-    elif track.status == "concern":
-        track.status = None
-        track.achieved_at = None
-    else:
-        track.status = "achieved"
-        track.achieved_at = datetime.utcnow()
-
-    db.commit()
-    db.refresh(track)
+    tracking = {milestone.id: await toggle_status(db, subscriber.id, milestone_id)}
+    await db.commit()
 
-    # Compute updated progress counts for this week
-    week_milestones = (
-        db.query(Milestone)
-        .filter(Milestone.week_number == milestone.week_number)
-        .all()
-    )
-    week_milestone_ids = [wm.id for wm in week_milestones]
-    week_tracking = (
-        db.query(MilestoneTracking)
-        .filter(
-            MilestoneTracking.subscriber_id == subscriber.id,
-            MilestoneTracking.milestone_id.in_(week_milestone_ids),
-        )
-        .all()
-    )
-    total_count = len(week_milestones)
-    achieved_count = sum(1 for t in week_tracking if t.status == "achieved")
-    concern_count = sum(1 for t in week_tracking if t.status == "concern")
-    untracked_count = total_count - achieved_count - concern_count
+    progress = await week_progress(db, subscriber.id, milestone.week_number)
 
-    tracking = {milestone.id: track}
-    m = milestone
-
-    # Render card with feedback + out-of-band progress bar update
-    card_html = templates.TemplateResponse(
+    # Card with feedback, plus an out-of-band progress bar update
+    card_html = render_fragment(
         "public/partials/milestone_card.html",
-        {"request": request, "m": m, "token": token, "tracking": tracking, "show_feedback": True},
-    ).body.decode()
-
-    progress_html = templates.TemplateResponse(
+        {"m": milestone, "token": token, "tracking": tracking, "show_feedback": True},
+    )
+    progress_html = render_fragment(
         "public/partials/milestone_progress.html",
-        {
-            "request": request,
-            "week": milestone.week_number,
-            "total_count": total_count,
-            "achieved_count": achieved_count,
-            "concern_count": concern_count,
-            "untracked_count": untracked_count,
-            "baby_name": subscriber.baby_name if hasattr(subscriber, "baby_name") else None,
-        },
-    ).body.decode()
-
-    # Use HTMX out-of-band swap to update progress bar alongside the card
-    oob_progress = progress_html.replace(
-        'id="milestone-progress"',
-        'id="milestone-progress" hx-swap-oob="outerHTML"',
-        1,
+        {"week": milestone.week_number, **progress.context(), "baby_name": subscriber.baby_name},
+        oob="outerHTML",
     )
-
-    return HTMLResponse(card_html + oob_progress)
+    return HTMLResponse(card_html + progress_html)
 
 
 @router.post("/my-updates/{token}/track/{milestone_id}/notes", response_class=HTMLResponse)
@@ -321,95 +272,123 @@ async def save_milestone_notes(
     token: str,
     milestone_id: int,
     notes: str = Form(""),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    subscriber = _get_subscriber_or_404(token, db)
+    subscriber = await _get_subscriber_or_404(token, db)
     if not subscriber:
         return HTMLResponse("Not found", status_code=404)
 
-    milestone = db.query(Milestone).filter(Milestone.id == milestone_id).first()
+    milestone = milestone_catalog.get(milestone_id)
     if not milestone:
         return HTMLResponse("Milestone not found", status_code=404)
 
-    track = (
-        db.query(MilestoneTracking)
-        .filter(
-            MilestoneTracking.subscriber_id == subscriber.id,
-            MilestoneTracking.milestone_id == milestone_id,
-        )
-        .first()
-    )
-
-    if not track:
-        track = MilestoneTracking(
-            subscriber_id=subscriber.id,
-            milestone_id=milestone_id,
-            notes=notes.strip() or None,
-        )
-        db.add(track)
-    else:
-        track.notes = notes.strip() or None
-
     note_text = notes.strip()
+    track = await save_notes(db, subscriber.id, milestone_id, note_text or None)
+    await db.commit()
+
     if not note_text:
-        track.ai_response = None
-        db.commit()
         return HTMLResponse(
             '<span class="text-gray-400 text-xs">Note cleared</span>'
         )
 
-    # Generate AI response
+    # A note another parent already wrote gets its reply straight away
     baby_age = _baby_age_weeks(subscriber.baby_birth_date)
-    try:
-        ai_response = await generate_milestone_response(
+    ai_response = note_cache.get(
+        milestone_id, track.status, baby_age, note_text, subscriber.baby_name
+    )
+    if ai_response is not None:
+        ai_status = "ready"
+    elif note_responder.submit(
+        NoteJob(
+            subscriber_id=subscriber.id,
+            milestone_id=milestone_id,
+            note=note_text,
+            status=track.status,
             baby_name=subscriber.baby_name,
             baby_age_weeks=baby_age,
             milestone_title=milestone.title,
             milestone_description=milestone.description,
-            parent_note=note_text,
-            status=track.status,
         )
-        track.ai_response = ai_response
-    except Exception as e:
-        print(f"AI RESPONSE ERROR: {type(e).__name__}: {e}")
-        ai_response = None
-        track.ai_response = None
-
-    db.commit()
-
-    if ai_response:
-        return HTMLResponse(f'''
-            <div class="mt-2 bg-indigo-50 rounded-lg px-3 py-2 border-l-4 border-indigo-400">
-                <p class="text-xs text-indigo-800">{ai_response}</p>
-            </div>
-        ''')
+    ):
+        ai_status = "pending"
     else:
-        return HTMLResponse(
-            '<span class="text-green-600 text-xs font-medium">Saved!</span>'
-        )
+        ai_status = "failed"
+    if ai_status != "pending":
+        await set_ai_response(db, subscriber.id, milestone_id, note_text, ai_response)
+        await db.commit()
+
+    return templates.TemplateResponse(
+        "public/partials/note_response.html",
+        {
+            "request": request,
+            "token": token,
+            "milestone_id": milestone_id,
+            "ai_status": ai_status,
+            "ai_response": ai_response,
+            "saved": True,
+        },
+    )
+
+
+@router.get("/my-updates/{token}/track/{milestone_id}/response", response_class=HTMLResponse)
+async def milestone_note_response(
+    request: Request,
+    token: str,
+    milestone_id: int,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Polled by a pending note until its reply is stored."""
+    subscriber = await _get_subscriber_or_404(token, db)
+    if not subscriber:
+        return HTMLResponse("Not found", status_code=404)
+
+    row = await note_response(db, subscriber.id, milestone_id)
+    if not row or not row.notes:
+        return HTMLResponse("")
+    ai_status = row.ai_status
+    # Past twice the model timeout (allowing for time queued), the worker
+    # holding the job has gone away; stop polling
+    timeout = timedelta(seconds=settings.NOTE_RESPONSE_TIMEOUT_SECONDS * 2)
+    if ai_status == "pending" and row.updated_at < datetime.utcnow() - timeout:
+        ai_status = "failed"
+
+    return templates.TemplateResponse(
+        "public/partials/note_response.html",
+        {
+            "request": request,
+            "token": token,
+            "milestone_id": milestone_id,
+            "ai_status": ai_status,
+            "ai_response": row.ai_response,
+            "saved": True,
+        },
+    )
 
 
 # ── AI Chat ──────────────────────────────────────────────────────────────────
 
 
-@router.post("/my-updates/{token}/chat")
-async def chat(token: str, request: Request, db: Session = Depends(get_db)):
-    subscriber = (
-        db.query(Subscriber).filter(Subscriber.unsubscribe_token == token).first()
+def _sse_error(message: str) -> StreamingResponse:
+    return StreamingResponse(
+        iter([f'data: {json.dumps({"error": message})}\n\n']),
+        media_type="text/event-stream",
     )
+
+
+@router.post("/my-updates/{token}/chat")
+async def chat(token: str, request: Request, db: AsyncSession = Depends(get_async_db)):
+    subscriber = await subscriber_cache.get(db, token)
     if not subscriber:
-        return StreamingResponse(
-            iter([f'data: {json.dumps({"error": "Subscriber not found"})}\n\n']),
-            media_type="text/event-stream",
-        )
+        return _sse_error("Subscriber not found")
 
     body = await request.json()
-    messages = body.get("messages", [])
-    if not messages:
-        return StreamingResponse(
-            iter([f'data: {json.dumps({"error": "No messages provided"})}\n\n']),
-            media_type="text/event-stream",
-        )
+    text = (body.get("message") or "").strip()
+    if not text and body.get("messages"):
+        # Pages loaded before the server kept history post the whole transcript
+        last = body["messages"][-1]
+        text = (last.get("content") or "").strip() if last.get("role") == "user" else ""
+    if not text:
+        return _sse_error("No messages provided")
 
     baby_age = _baby_age_weeks(subscriber.baby_birth_date)
     viewed_week = body.get("week")
@@ -418,70 +397,85 @@ async def chat(token: str, request: Request, db: Session = Depends(get_db)):
     else:
         current_week = min(baby_age, 16) if baby_age is not None else 0
 
-    milestones = (
-        db.query(Milestone)
-        .filter(Milestone.week_number == current_week)
-        .order_by(Milestone.category, Milestone.id)
-        .all()
-    )
-    milestone_dicts = [
-        {
-            "category": m.category,
-            "title": m.title,
-            "description": m.description,
-            "is_concern_flag": m.is_concern_flag,
-            "parent_action": m.parent_action,
-        }
-        for m in milestones
-    ]
-
-    # Query ALL tracking data for this subscriber (not just current week)
-    all_tracking = (
-        db.query(MilestoneTracking, Milestone)
-        .join(Milestone, MilestoneTracking.milestone_id == Milestone.id)
-        .filter(MilestoneTracking.subscriber_id == subscriber.id)
-        .order_by(Milestone.week_number, Milestone.category)
-        .all()
-    )
-    tracking_history = [
-        {
-            "week": m.week_number,
-            "category": m.category,
-            "title": m.title,
-            "status": t.status,
-            "notes": t.notes,
-            "achieved_at": t.achieved_at.isoformat() if t.achieved_at else None,
-        }
-        for t, m in all_tracking
-        if t.status or t.notes
-    ]
-
-    system_prompt = build_system_prompt(
-        baby_name=subscriber.baby_name,
-        baby_age_weeks=baby_age,
-        milestones=milestone_dicts,
-        tracking_history=tracking_history,
-    )
+    system_prompt = await prompt_cache.get(db, subscriber, current_week, baby_age)
+    window = await load_window(db, subscriber.id)
+    if window.summary:
+        system_prompt += (summary_block(window.summary),)
+    messages = window.messages + [{"role": "user", "content": text}]
+    await add_message(db, subscriber.id, "user", text)
+    await db.commit()
+    payload_bytes = len(json.dumps({"system": system_prompt, "messages": messages}).encode())
 
     async def event_generator():
+        usage = {}
+        reply = []
+        first_token = None
+        start = perf_counter()
         try:
-            async for chunk in stream_chat_response(messages, system_prompt):
+            async for chunk in stream_chat_response(messages, system_prompt, usage):
+                if first_token is None:
+                    first_token = perf_counter() - start
+                reply.append(chunk)
                 yield f"data: {json.dumps({'text': chunk})}\n\n"
-            yield f"data: {json.dumps({'done': True})}\n\n"
         except Exception as e:
+            chat_stats.count("errors")
             yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            return
+        total = perf_counter() - start
+        chat_stats.record_turn(payload_bytes, first_token or total, total)
+        turn = {
+            "payload_bytes": payload_bytes,
+            "messages": len(messages),
+            "summarized": window.summary is not None,
+            "first_token_ms": round((first_token or total) * 1000, 1),
+            "total_ms": round(total * 1000, 1),
+            **usage,
+        }
+        # Stored before `done`, so a message sent straight after the reply
+        # already has it in its history
+        try:
+            async with AsyncSessionLocal() as session:
+                await add_message(session, subscriber.id, "assistant", "".join(reply))
+                await session.commit()
+        except Exception as e:
+            print(f"CHAT HISTORY ERROR: {type(e).__name__}: {e}")
+        yield f"data: {json.dumps({'done': True, 'turn': turn})}\n\n"
 
-    return StreamingResponse(event_generator(), media_type="text/event-stream")
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        background=BackgroundTask(compact_after_reply, subscriber.id),
+    )
+
+
+@router.get("/my-updates/{token}/chat")
+async def chat_history(token: str, db: AsyncSession = Depends(get_async_db)):
+    subscriber = await subscriber_cache.get(db, token)
+    if not subscriber:
+        return JSONResponse({"error": "Subscriber not found"}, status_code=404)
+    window = await load_window(db, subscriber.id)
+    return {"messages": window.messages, "summarized": window.summary is not None}
+
+
+@router.delete("/my-updates/{token}/chat")
+async def clear_chat(token: str, db: AsyncSession = Depends(get_async_db)):
+    subscriber = await subscriber_cache.get(db, token)
+    if not subscriber:
+        return JSONResponse({"error": "Subscriber not found"}, status_code=404)
+    await clear_conversation(db, subscriber.id)
+    await db.commit()
+    return {"cleared": True}
 
 
 @router.get("/unsubscribe/{token}", response_class=HTMLResponse)
-async def unsubscribe(request: Request, token: str, db: Session = Depends(get_db)):
-    subscriber = (
-        db.query(Subscriber).filter(Subscriber.unsubscribe_token == token).first()
+async def unsubscribe(request: Request, token: str, db: AsyncSession = Depends(get_async_db)):
+    subscriber = await db.scalar(
+        select(Subscriber).where(Subscriber.unsubscribe_token == token)
     )
     if subscriber:
         subscriber.is_active = False
-        db.commit()
+        await db.commit()
+        subscriber_cache.invalidate(token)
         return templates.TemplateResponse(
             "public/unsubscribed.html",
             {"request": request, "found": True},
@@ -510,20 +504,17 @@ NEIGHBORHOODS = [
 ]
 
 
-def _get_subscriber_or_404(token: str, db: Session):
-    subscriber = (
-        db.query(Subscriber).filter(Subscriber.unsubscribe_token == token).first()
-    )
-    return subscriber
+async def _get_subscriber_or_404(token: str, db: AsyncSession):
+    return await subscriber_cache.get(db, token)
 
 
 @router.get("/my-updates/{token}/local-resources", response_class=HTMLResponse)
 async def local_resources(
     request: Request,
     token: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    subscriber = _get_subscriber_or_404(token, db)
+    subscriber = await _get_subscriber_or_404(token, db)
     if not subscriber:
         return templates.TemplateResponse(
             "error.html",
@@ -532,10 +523,12 @@ async def local_resources(
         )
 
     neighborhood = subscriber.neighborhood or ""
-    query = db.query(LocalResource)
+    query = select(LocalResource)
     if neighborhood:
-        query = query.filter(LocalResource.neighborhood == neighborhood)
-    resources = query.order_by(LocalResource.category, LocalResource.name).all()
+        query = query.where(LocalResource.neighborhood == neighborhood)
+    resources = (
+        await db.scalars(query.order_by(LocalResource.category, LocalResource.name))
+    ).all()
 
     return templates.TemplateResponse(
         "public/local_resources.html",
@@ -557,18 +550,20 @@ async def local_resources_filter(
     token: str,
     neighborhood: str = Query(""),
     category: str = Query("all"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    subscriber = _get_subscriber_or_404(token, db)
+    subscriber = await _get_subscriber_or_404(token, db)
     if not subscriber:
         return HTMLResponse("Not found", status_code=404)
 
-    query = db.query(LocalResource)
+    query = select(LocalResource)
     if neighborhood:
-        query = query.filter(LocalResource.neighborhood == neighborhood)
+        query = query.where(LocalResource.neighborhood == neighborhood)
     if category and category != "all":
-        query = query.filter(LocalResource.category == category)
-    resources = query.order_by(LocalResource.category, LocalResource.name).all()
+        query = query.where(LocalResource.category == category)
+    resources = (
+        await db.scalars(query.order_by(LocalResource.category, LocalResource.name))
+    ).all()
 
     return templates.TemplateResponse(
         "public/partials/resource_cards.html",
@@ -584,14 +579,19 @@ async def save_neighborhood(
     request: Request,
     token: str,
     neighborhood: str = Form(""),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    subscriber = _get_subscriber_or_404(token, db)
+    subscriber = await _get_subscriber_or_404(token, db)
     if not subscriber:
         return HTMLResponse("Not found", status_code=404)
 
-    subscriber.neighborhood = neighborhood or None
-    db.commit()
+    await db.execute(
+        update(Subscriber)
+        .where(Subscriber.id == subscriber.id)
+        .values(neighborhood=neighborhood or None)
+    )
+    await db.commit()
+    subscriber_cache.invalidate(token)
     return HTMLResponse(
         '<span class="text-green-600 text-sm font-medium">Saved!</span>'
     )
@@ -625,9 +625,9 @@ async def family_calendar(
     token: str,
     year: int | None = Query(None),
     month: int | None = Query(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    subscriber = _get_subscriber_or_404(token, db)
+    subscriber = await _get_subscriber_or_404(token, db)
     if not subscriber:
         return templates.TemplateResponse(
             "error.html",
@@ -651,15 +651,16 @@ async def family_calendar(
     end_date = last_of_month + timedelta(days=7)
 
     events = (
-        db.query(CalendarEvent)
-        .filter(
-            CalendarEvent.subscriber_id == subscriber.id,
-            CalendarEvent.event_date >= start_date,
-            CalendarEvent.event_date <= end_date,
+        await db.scalars(
+            select(CalendarEvent)
+            .where(
+                CalendarEvent.subscriber_id == subscriber.id,
+                CalendarEvent.event_date >= start_date,
+                CalendarEvent.event_date <= end_date,
+            )
+            .order_by(CalendarEvent.event_date, CalendarEvent.event_time)
         )
-        .order_by(CalendarEvent.event_date, CalendarEvent.event_time)
-        .all()
-    )
+    ).all()
 
     events_by_date = {}
     for event in events:
@@ -669,16 +670,17 @@ async def family_calendar(
 
     # Upcoming events (next 30 days)
     upcoming_events = (
-        db.query(CalendarEvent)
-        .filter(
-            CalendarEvent.subscriber_id == subscriber.id,
-            CalendarEvent.event_date >= today,
-            CalendarEvent.event_date <= today + timedelta(days=30),
+        await db.scalars(
+            select(CalendarEvent)
+            .where(
+                CalendarEvent.subscriber_id == subscriber.id,
+                CalendarEvent.event_date >= today,
+                CalendarEvent.event_date <= today + timedelta(days=30),
+            )
+            .order_by(CalendarEvent.event_date, CalendarEvent.event_time)
+            .limit(10)
         )
-        .order_by(CalendarEvent.event_date, CalendarEvent.event_time)
-        .limit(10)
-        .all()
-    )
+    ).all()
 
     month_names = [
         "", "January", "February", "March", "April", "May", "June",
@@ -704,16 +706,16 @@ async def family_calendar(
 async def get_calendar_event(
     token: str,
     event_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    subscriber = _get_subscriber_or_404(token, db)
+    subscriber = await _get_subscriber_or_404(token, db)
     if not subscriber:
         return JSONResponse({"error": "Not found"}, status_code=404)
 
-    event = (
-        db.query(CalendarEvent)
-        .filter(CalendarEvent.id == event_id, CalendarEvent.subscriber_id == subscriber.id)
-        .first()
+    event = await db.scalar(
+        select(CalendarEvent).where(
+            CalendarEvent.id == event_id, CalendarEvent.subscriber_id == subscriber.id
+        )
     )
     if not event:
         return JSONResponse({"error": "Event not found"}, status_code=404)
@@ -737,9 +739,9 @@ async def add_calendar_event(
     event_time: str = Form(""),
     category: str = Form("other"),
     description: str = Form(""),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    subscriber = _get_subscriber_or_404(token, db)
+    subscriber = await _get_subscriber_or_404(token, db)
     if not subscriber:
         return HTMLResponse("Not found", status_code=404)
 
@@ -757,7 +759,7 @@ async def add_calendar_event(
         category=category,
     )
     db.add(event)
-    db.commit()
+    await db.commit()
 
     return HTMLResponse("OK")
 
@@ -772,16 +774,16 @@ async def edit_calendar_event(
     event_time: str = Form(""),
     category: str = Form("other"),
     description: str = Form(""),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    subscriber = _get_subscriber_or_404(token, db)
+    subscriber = await _get_subscriber_or_404(token, db)
     if not subscriber:
         return HTMLResponse("Not found", status_code=404)
 
-    event = (
-        db.query(CalendarEvent)
-        .filter(CalendarEvent.id == event_id, CalendarEvent.subscriber_id == subscriber.id)
-        .first()
+    event = await db.scalar(
+        select(CalendarEvent).where(
+            CalendarEvent.id == event_id, CalendarEvent.subscriber_id == subscriber.id
+        )
     )
     if not event:
         return HTMLResponse("Event not found", status_code=404)
@@ -791,7 +793,7 @@ async def edit_calendar_event(
     event.event_time = datetime.strptime(event_time, "%H:%M").time() if event_time else None
     event.category = category
     event.description = description or None
-    db.commit()
+    await db.commit()
 
     return HTMLResponse("OK")
 
@@ -800,19 +802,19 @@ async def edit_calendar_event(
 async def delete_calendar_event(
     token: str,
     event_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    subscriber = _get_subscriber_or_404(token, db)
+    subscriber = await _get_subscriber_or_404(token, db)
     if not subscriber:
         return HTMLResponse("Not found", status_code=404)
 
-    event = (
-        db.query(CalendarEvent)
-        .filter(CalendarEvent.id == event_id, CalendarEvent.subscriber_id == subscriber.id)
-        .first()
+    event = await db.scalar(
+        select(CalendarEvent).where(
+            CalendarEvent.id == event_id, CalendarEvent.subscriber_id == subscriber.id
+        )
     )
     if event:
-        db.delete(event)
-        db.commit()
+        await db.delete(event)
+        await db.commit()
 
     return HTMLResponse("OK")
@@ -0,0 +1,60 @@
+"""
+Reader for the seed data files in app/seed/data/.
+
+Each dataset is a JSON Lines file: a header line
+{"format": 1, "dataset": ..., "records": N} followed by one record per
+line. Files are memory-mapped rather than read into a buffer, and only
+parsed when a caller asks for the records, so importing a seed module
+costs nothing and `file_checksum` can tell whether a dataset changed
+without parsing it.
+
+To change seed data, edit the .jsonl file and run `python -m app.bootstrap`.
+"""
+
+import hashlib
+import json
+import mmap
+from pathlib import Path
+
+DATA_DIR = Path(__file__).parent / "data"
+FORMAT_VERSION = 1
+
+
+class SeedDataError(ValueError):
+    pass
+
+
+def _path(dataset: str) -> Path:
+    return DATA_DIR / f"{dataset}.jsonl"
+
+
+def _mapped(dataset: str) -> mmap.mmap:
+    with open(_path(dataset), "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def read_records(dataset: str) -> list[dict]:
+    with _mapped(dataset) as data:
+        header = json.loads(data.readline())
+        if header.get("format") != FORMAT_VERSION or header.get("dataset") != dataset:
+            raise SeedDataError(f"{_path(dataset)}: unsupported header {header}")
+        records = [json.loads(line) for line in iter(data.readline, b"") if line.strip()]
+    if len(records) != header["records"]:
+        raise SeedDataError(
+            f"{_path(dataset)}: header says {header['records']} records, found {len(records)}"
+        )
+    return records
+
+
+def file_checksum(dataset: str) -> str:
+    with _mapped(dataset) as data:
+        return hashlib.sha256(data).hexdigest()
+
+
+def write_records(dataset: str, records: list[dict]) -> None:
+    """Rewrite a dataset file, e.g. after generating records from another source."""
+    with open(_path(dataset), "w", encoding="utf-8") as f:
+        header = {"format": FORMAT_VERSION, "dataset": dataset, "records": len(records)}
+        f.write(json.dumps(header) + "\n")
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
@@ -0,0 +1,136 @@
+"""
+Diff-based seeding: make a table match a list of seed records.
+
+Records are matched to rows by a key (a natural key, or for milestones a
+slug, so a milestone keeps its row when its title is edited) and compared
+by a hash of their remaining fields, so a re-seed only writes what changed:
+
+    new keys        -> one executemany INSERT
+    changed hashes  -> one executemany UPDATE by primary key
+    missing keys    -> one DELETE, except rows other tables still point at
+
+Row ids of unchanged and updated records are kept, so foreign keys such
+as milestone_tracking.milestone_id stay valid. All writes happen in the
+caller's transaction. Rows seeded before their key column existed have
+no key yet; they are matched on `legacy_key_fields` and the key filled in.
+"""
+
+import hashlib
+import json
+from typing import Callable, NamedTuple
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+
+SKIPPED_COLUMNS = {"id", "created_at", "updated_at"}
+
+
+class SeedReport(NamedTuple):
+    inserted: int
+    updated: int
+    deleted: int
+    unchanged: int
+    retained: int  # no longer in the seed data but still referenced
+
+    def __str__(self) -> str:
+        text = (
+            f"{self.inserted} inserted, {self.updated} updated, "
+            f"{self.deleted} deleted, {self.unchanged} unchanged"
+        )
+        if self.retained:
+            text += f", {self.retained} kept because they are still referenced"
+        return text
+
+
+def seed_fields(model) -> list[str]:
+    return [c.name for c in model.__table__.columns if c.name not in SKIPPED_COLUMNS]
+
+
+def normalize(model, record: dict) -> dict:
+    """The record with every seeded column present, using column defaults."""
+    row = {}
+    for column in model.__table__.columns:
+        if column.name in SKIPPED_COLUMNS:
+            continue
+        if column.name in record:
+            row[column.name] = record[column.name]
+        elif column.default is not None and column.default.is_scalar:
+            row[column.name] = column.default.arg
+        else:
+            row[column.name] = None
+    return row
+
+
+def record_hash(row: dict, fields: list[str]) -> str:
+    payload = json.dumps([row[f] for f in fields], default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def sync_records(
+    db: Session,
+    model,
+    records: list[dict],
+    key_fields: tuple[str, ...],
+    referenced_ids: Callable[[Session, list[int]], set[int]] | None = None,
+    legacy_key_fields: tuple[str, ...] = (),
+) -> SeedReport:
+    """Insert, update and delete rows of `model` so they match `records`."""
+    fields = seed_fields(model)
+    content_fields = [f for f in fields if f not in key_fields]
+    wanted = {}
+    for record in records:
+        row = normalize(model, record)
+        wanted[tuple(row[f] for f in key_fields)] = row
+
+    columns = [model.__table__.c[f] for f in fields]
+    existing = {}
+    legacy = {}  # legacy key -> id, for rows with no key yet
+    duplicate_ids = []
+    for db_row in db.execute(select(model.id, *columns).order_by(model.id)):
+        row = db_row._asdict()
+        key = tuple(row[f] for f in key_fields)
+        if legacy_key_fields and None in key:
+            key = tuple(row[f] for f in legacy_key_fields)
+            if key in legacy:
+                duplicate_ids.append(row["id"])
+            else:
+                legacy[key] = row["id"]
+        elif key in existing:
+            duplicate_ids.append(row["id"])
+        else:
+            existing[key] = (row["id"], record_hash(row, content_fields))
+
+    inserts, updates, unchanged = [], [], 0
+    for key, row in wanted.items():
+        if key not in existing:
+            legacy_id = legacy.pop(tuple(row[f] for f in legacy_key_fields), None)
+            if legacy_id is not None:
+                updates.append({"id": legacy_id, **row})
+            else:
+                inserts.append(row)
+            continue
+        row_id, current_hash = existing[key]
+        if current_hash == record_hash(row, content_fields):
+            unchanged += 1
+        else:
+            updates.append({"id": row_id, **{f: row[f] for f in content_fields}})
+
+    stale_ids = [row_id for key, (row_id, _) in existing.items() if key not in wanted]
+    stale_ids += list(legacy.values()) + duplicate_ids
+    keep = referenced_ids(db, stale_ids) if referenced_ids and stale_ids else set()
+    delete_ids = [i for i in stale_ids if i not in keep]
+
+    if inserts:
+        db.execute(insert(model), inserts)
+    if updates:
+        db.execute(update(model), updates)
+    if delete_ids:
+        db.execute(delete(model).where(model.id.in_(delete_ids)))
+
+    return SeedReport(
+        inserted=len(inserts),
+        updated=len(updates),
+        deleted=len(delete_ids),
+        unchanged=unchanged,
+        retained=len(keep),
+    )
@@ -7,49 +7,22 @@ from app.config import settings
 client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
 
 
-def build_system_prompt(
-    baby_name: str | None,
-    baby_age_weeks: int | None,
-    milestones: list[dict],
-    tracking_history: list[dict] | None = None,
-) -> str:
-    name = baby_name or "the baby"
-    age_line = (
-        f"{name} is currently {baby_age_weeks} weeks old."
-        if baby_age_weeks is not None
-        else f"The baby's age is unknown."
-    )
-
-    milestone_lines = ""
-    if milestones:
-        milestone_lines = "\n\nCurrent week's milestones:\n"
-        for m in milestones:
-            concern = " [CONCERN FLAG - suggest talking to pediatrician]" if m.get("is_concern_flag") else ""
-            milestone_lines += f"- [{m['category']}] {m['title']}: {m['description']}{concern}\n"
-            if m.get("parent_action"):
-                milestone_lines += f"  Try this: {m['parent_action']}\n"
-
-    tracking_lines = ""
-    if tracking_history:
-        tracking_lines = "\n\nParent's tracking notes and progress:\n"
-        for t in tracking_history:
-            status_label = "ACHIEVED" if t["status"] == "achieved" else "CONCERN FLAGGED" if t["status"] == "concern" else "noted"
-            tracking_lines += f"- Week {t['week']} [{t['category']}] {t['title']} — {status_label}"
-            if t.get("notes"):
-                tracking_lines += f" | Parent note: \"{t['notes']}\""
-            tracking_lines += "\n"
-        tracking_lines += "\nUse this tracking information to personalize your responses. Reference milestones the parent has tracked, acknowledge achievements, and be sensitive to any concerns they've flagged.\n"
-
-    return f"""You are the Baby Navigator Assistant, a warm and supportive guide for new parents navigating their baby's first 16 weeks.
-
-{age_line}
-{milestone_lines}
-{tracking_lines}
+# The system prompt is sent as ordered blocks, most widely shared first, each
+# ending in a cache breakpoint. The provider caches a prompt by prefix, so:
+#   1. rules        identical for every subscriber
+#   2. milestones   identical for everyone viewing the same week
+#   3. personal     identical across one subscriber's conversation
+# A repeat chatter's request reads all three from the cache; a first-time
+# chatter still reads the rules and usually the week. Nothing personal may
+# go into the first two blocks, or they stop being shared.
+CACHE_CONTROL = {"type": "ephemeral"}
+
+RULES = """You are the Baby Navigator Assistant, a warm and supportive guide for new parents navigating their baby's first 16 weeks.
 
 Guidelines:
 - Be warm, encouraging, and concise. Keep responses to 2-3 short paragraphs unless more detail is asked for.
-- Reference the baby by name ("{name}") and relate answers to age-appropriate milestones when relevant.
-- When discussing milestones, reference the specific ones listed above for the current week.
+- Reference the baby by name (given below) and relate answers to age-appropriate milestones when relevant.
+- When discussing milestones, reference the specific ones listed below for the current week.
 - Use simple, reassuring language — avoid clinical jargon unless explaining a term.
 
 Medical safety rules (NEVER violate these):
@@ -64,19 +37,114 @@ Identity rules:
 - If asked who made you, say you are part of the NewbornAI Navigator platform.
 - Do not discuss your underlying technology or training."""
 
+STATUS_LABELS = {"achieved": "ACHIEVED", "concern": "CONCERN FLAGGED"}
+
+
+def _block(text: str) -> dict:
+    return {"type": "text", "text": text, "cache_control": CACHE_CONTROL}
+
+
+def _milestone_text(milestones: list[dict]) -> str:
+    lines = ["Current week's milestones:"]
+    for m in milestones:
+        concern = " [CONCERN FLAG - suggest talking to pediatrician]" if m.get("is_concern_flag") else ""
+        lines.append(f"- [{m['category']}] {m['title']}: {m['description']}{concern}")
+        if m.get("parent_action"):
+            lines.append(f"  Try this: {m['parent_action']}")
+    return "\n".join(lines)
+
+
+def _personal_text(
+    baby_name: str | None, baby_age_weeks: int | None, tracking_history: list[dict] | None
+) -> str:
+    name = baby_name or "the baby"
+    lines = [
+        f"The baby's name is {baby_name}." if baby_name else "The baby's name is unknown.",
+        f"{name} is currently {baby_age_weeks} weeks old."
+        if baby_age_weeks is not None
+        else "The baby's age is unknown.",
+    ]
+    if tracking_history:
+        lines += ["", "Parent's tracking notes and progress:"]
+        for t in tracking_history:
+            line = f"- Week {t['week']} [{t['category']}] {t['title']} — {STATUS_LABELS.get(t['status'], 'noted')}"
+            if t.get("notes"):
+                line += f" | Parent note: \"{t['notes']}\""
+            lines.append(line)
+        lines += [
+            "",
+            "Use this tracking information to personalize your responses. Reference milestones the parent has tracked, acknowledge achievements, and be sensitive to any concerns they've flagged.",
+        ]
+    return "\n".join(lines)
+
+
+RULES_BLOCK = _block(RULES)
+
+
+def build_system_prompt(
+    baby_name: str | None,
+    baby_age_weeks: int | None,
+    milestones: list[dict],
+    tracking_history: list[dict] | None = None,
+) -> tuple[dict, ...]:
+    """The chat system prompt as cacheable text blocks; app.services.chat_prompt
+    caches the result."""
+    blocks = [RULES_BLOCK]
+    if milestones:
+        blocks.append(_block(_milestone_text(milestones)))
+    blocks.append(_block(_personal_text(baby_name, baby_age_weeks, tracking_history)))
+    return tuple(blocks)
+
+
+def summary_block(summary: str) -> dict:
+    """The compacted earlier conversation, sent after the personal block."""
+    return _block(f"Summary of your earlier conversation with this parent:\n{summary}")
+
 
 async def stream_chat_response(
     messages: list[dict],
-    system_prompt: str,
+    system_prompt: tuple[dict, ...],
+    usage: dict | None = None,
 ) -> AsyncGenerator[str, None]:
+    """Stream the reply's text; fills `usage` with the token counts once done."""
     async with client.messages.stream(
         model="claude-sonnet-4-20250514",
         max_tokens=1024,
-        system=system_prompt,
+        system=list(system_prompt),
         messages=messages,
     ) as stream:
         async for text in stream.text_stream:
             yield text
+        if usage is not None:
+            final = (await stream.get_final_message()).usage
+            usage.update(
+                input_tokens=final.input_tokens,
+                cache_read_input_tokens=final.cache_read_input_tokens or 0,
+                cache_creation_input_tokens=final.cache_creation_input_tokens or 0,
+                output_tokens=final.output_tokens,
+            )
+
+
+async def summarize_conversation(summary: str | None, messages: list[dict]) -> str:
+    """Fold older chat turns into the running conversation summary."""
+    transcript = "\n".join(
+        f"{'Parent' if m['role'] == 'user' else 'Assistant'}: {m['content']}" for m in messages
+    )
+    previous = f"Summary so far:\n{summary}\n\n" if summary else ""
+
+    response = await client.messages.create(
+        model="claude-sonnet-4-20250514",
+        max_tokens=settings.CHAT_SUMMARY_MAX_TOKENS,
+        system=(
+            "You maintain a running summary of a chat between a parent and the Baby Navigator "
+            "Assistant. Rewrite the summary to include the new messages. Keep what later answers "
+            "need: facts about the baby, the parent's questions and concerns, and advice already "
+            "given. Plain prose, no preamble, under 200 words."
+        ),
+        messages=[{"role": "user", "content": f"{previous}New messages:\n{transcript}"}],
+    )
+
+    return response.content[0].text
 
 
 async def generate_milestone_response(
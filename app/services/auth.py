@@ -1,11 +1,20 @@
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import bcrypt
 from fastapi import HTTPException, Request, status
 from fastapi.responses import RedirectResponse
 from jose import JWTError, jwt
+from sqlalchemy import delete
 
 from app.config import settings
+from app.database import SessionLocal
+from app.models import RevokedToken
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -18,6 +27,76 @@ def hash_password(password: str) -> str:
     return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
 
 
+class PasswordHasher:
+    """Runs bcrypt on a small dedicated thread pool instead of the event loop.
+
+    A bcrypt check at cost 12 takes ~250 ms of CPU. Done inline in an async
+    handler it stalls every other request on the worker; here it only ties
+    up one of PASSWORD_HASH_WORKERS threads. At most max_pending checks wait
+    or run at once, so a login flood cannot queue unbounded work.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+
+    def _run(self, fn, *args):
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self.completed += 1
+                self.seconds += time.perf_counter() - start
+
+    async def submit(self, fn, *args):
+        """Run fn(*args) on the pool; None when max_pending checks are already in flight."""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                return None
+            self._pending += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="bcrypt")
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._run, fn, *args
+            )
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool | None:
+        return await self.submit(verify_password, plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str | None:
+        return await self.submit(hash_password, password)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "pending": self._pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "mean_ms": round(self.seconds / self.completed * 1000, 1) if self.completed else None,
+            }
+
+
+password_hasher = PasswordHasher(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_PENDING)
+
+
 def create_access_token(data: dict) -> str:
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(minutes=settings.JWT_EXPIRE_MINUTES)
@@ -34,6 +113,129 @@ def decode_access_token(token: str) -> dict | None:
         return None
 
 
+class VerifiedTokenCache:
+    """Admin JWTs that passed signature verification, until they expire.
+
+    Every admin request, including each HTMX post from the newsletter
+    editor, carries the session cookie. A token verified once is trusted
+    from this LRU until its exp claim, so only new tokens pay for
+    jwt.decode. Logging out records the token in the revoked_tokens table,
+    which every worker reads: on a cache miss, and again for a cached token
+    once `recheck` seconds have passed since it was last checked.
+    """
+
+    def __init__(self, maxsize: int, recheck: float):
+        self.maxsize = maxsize
+        self.recheck = recheck
+        # token -> (exp, payload, when it was last checked for revocation)
+        self._tokens: OrderedDict[str, tuple[float, dict, float]] = OrderedDict()
+        self._revoked: dict[str, float] = {}
+        self.hits = 0
+        self.decodes = 0
+        self.revocation_checks = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def verify(self, token: str) -> dict | None:
+        """The token's payload if it is valid and not revoked, else None."""
+        now = time.time()
+        with self._lock:
+            if token in self._revoked:
+                self.rejected += 1
+                return None
+            entry = self._tokens.get(token)
+            if entry and entry[0] <= now:
+                del self._tokens[token]
+                entry = None
+            if entry and now - entry[2] < self.recheck:
+                self._tokens.move_to_end(token)
+                self.hits += 1
+                return entry[1]
+            if entry is None:
+                self.decodes += 1
+        # A new token is decoded; a cached one only needs its revocation re-checked
+        payload = entry[1] if entry else decode_access_token(token)
+        if payload is None:
+            with self._lock:
+                self.rejected += 1
+            return None
+        revoked = is_revoked(token)
+        with self._lock:
+            self.revocation_checks += 1
+            if revoked:
+                self._tokens.pop(token, None)
+                self._remember_revoked(token, _expiry(payload, now), now)
+            if token in self._revoked:
+                self.rejected += 1
+                return None
+            if "exp" in payload:
+                self._tokens[token] = (float(payload["exp"]), payload, now)
+                self._tokens.move_to_end(token)
+                while len(self._tokens) > self.maxsize:
+                    self._tokens.popitem(last=False)
+        return payload
+
+    def revoke(self, token: str) -> None:
+        payload = decode_access_token(token)
+        if payload is None:
+            return  # already unusable
+        now = time.time()
+        expires = _expiry(payload, now)
+        record_revocation(token, expires)
+        with self._lock:
+            self._tokens.pop(token, None)
+            self._remember_revoked(token, expires, now)
+
+    def _remember_revoked(self, token: str, expires: float, now: float) -> None:
+        self._revoked = {t: exp for t, exp in self._revoked.items() if exp > now}
+        self._revoked[token] = expires
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.decodes
+            return {
+                "size": len(self._tokens),
+                "revoked": len(self._revoked),
+                "hits": self.hits,
+                "decodes": self.decodes,
+                "revocation_checks": self.revocation_checks,
+                "rejected": self.rejected,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+def _expiry(payload: dict, now: float) -> float:
+    return float(payload.get("exp", now + settings.JWT_EXPIRE_MINUTES * 60))
+
+
+def _token_hash(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def is_revoked(token: str) -> bool:
+    with SessionLocal() as db:
+        return db.get(RevokedToken, _token_hash(token)) is not None
+
+
+def record_revocation(token: str, expires: float) -> None:
+    """Store a logged-out token for every worker, dropping ones that have expired."""
+    with SessionLocal() as db:
+        db.execute(delete(RevokedToken).where(RevokedToken.expires_at < datetime.utcnow()))
+        if db.get(RevokedToken, _token_hash(token)) is None:
+            db.add(
+                RevokedToken(
+                    token_hash=_token_hash(token),
+                    expires_at=datetime.utcfromtimestamp(expires),
+                )
+            )
+        db.commit()
+
+
+admin_tokens = VerifiedTokenCache(
+    settings.ADMIN_TOKEN_CACHE_SIZE, settings.ADMIN_TOKEN_RECHECK_SECONDS
+)
+
+
 def get_current_admin(request: Request) -> str:
     token = request.cookies.get("access_token")
     if not token:
@@ -41,7 +243,7 @@ def get_current_admin(request: Request) -> str:
             status_code=status.HTTP_303_SEE_OTHER,
             headers={"Location": "/auth/login"},
         )
-    payload = decode_access_token(token)
+    payload = admin_tokens.verify(token)
     if payload is None:
         raise HTTPException(
             status_code=status.HTTP_303_SEE_OTHER,
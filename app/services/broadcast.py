@@ -0,0 +1,166 @@
+from datetime import date, datetime, timedelta
+from typing import Iterator
+
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import Broadcast, NewsletterIssue, OutboxMessage, Subscriber
+from app.services.outbox import outbox_worker
+
+
+def birth_date_range(week_number: int, today: date | None = None) -> tuple[date, date]:
+    """Birth dates for which a baby is exactly `week_number` weeks old today."""
+    today = today or date.today()
+    newest = today - timedelta(days=week_number * 7)
+    oldest = newest - timedelta(days=6)
+    return oldest, newest
+
+
+def iter_recipient_batches(
+    db: Session, week_number: int, batch_size: int
+) -> Iterator[list]:
+    """Stream active subscribers in the issue's week, keyset-paginated by id."""
+    oldest, newest = birth_date_range(week_number)
+    last_id = 0
+    while True:
+        rows = (
+            db.query(Subscriber.id)
+            .filter(
+                Subscriber.is_active == True,
+                Subscriber.baby_birth_date >= oldest,
+                Subscriber.baby_birth_date <= newest,
+                Subscriber.id > last_id,
+            )
+            .order_by(Subscriber.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1].id
+
+
+def start_broadcast(db: Session, newsletter: NewsletterIssue) -> Broadcast | None:
+    """Create a pending broadcast, or None if one is already in flight."""
+    in_flight = (
+        db.query(Broadcast)
+        .filter(
+            Broadcast.newsletter_id == newsletter.id,
+            Broadcast.status.in_(["pending", "enqueuing"]),
+        )
+        .first()
+    )
+    if in_flight:
+        return None
+    broadcast = Broadcast(newsletter_id=newsletter.id, status="pending")
+    db.add(broadcast)
+    db.commit()
+    db.refresh(broadcast)
+    return broadcast
+
+
+def outbox_insert(db: Session):
+    """Dialect-specific INSERT for email_outbox, so callers can use ON CONFLICT."""
+    dialect = postgresql if db.bind.dialect.name == "postgresql" else sqlite
+    return dialect.insert(OutboxMessage)
+
+
+def enqueue_outbox(
+    db: Session, newsletter_id: int, subscriber_ids: list[int], broadcast_id: int | None = None
+) -> int:
+    """Insert pending outbox rows, skipping subscribers already queued for the issue."""
+    if not subscriber_ids:
+        return 0
+    stmt = (
+        outbox_insert(db)
+        .values([
+            {
+                "newsletter_id": newsletter_id,
+                "subscriber_id": sid,
+                "broadcast_id": broadcast_id,
+                "status": "pending",
+                "attempts": 0,
+                "next_attempt_at": datetime.utcnow(),
+            }
+            for sid in subscriber_ids
+        ])
+        .on_conflict_do_nothing(index_elements=["newsletter_id", "subscriber_id"])
+    )
+    return db.execute(stmt).rowcount
+
+
+def enqueue_broadcast(broadcast_id: int) -> None:
+    """Queue an issue for every matching subscriber; delivery happens in the outbox workers."""
+    db = SessionLocal()
+    broadcast = db.get(Broadcast, broadcast_id)
+    if not broadcast:
+        db.close()
+        return
+    try:
+        newsletter = db.get(NewsletterIssue, broadcast.newsletter_id)
+        broadcast.status = "enqueuing"
+        broadcast.started_at = datetime.utcnow()
+        db.commit()
+
+        for batch in iter_recipient_batches(
+            db, newsletter.week_number, settings.BROADCAST_BATCH_SIZE
+        ):
+            broadcast.enqueued_count += enqueue_outbox(
+                db, newsletter.id, [r.id for r in batch], broadcast.id
+            )
+            db.commit()
+            outbox_worker.wake()
+
+        broadcast.status = "queued"
+        broadcast.finished_at = datetime.utcnow()
+        # A scheduled issue stays scheduled, for babies reaching its week later
+        if newsletter.status != "scheduled":
+            newsletter.status = "sent"
+            newsletter.sent_at = broadcast.finished_at
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        broadcast.status = "failed"
+        broadcast.error = f"{type(e).__name__}: {e}"
+        broadcast.finished_at = datetime.utcnow()
+        db.commit()
+        print(f"BROADCAST ERROR: {broadcast.error}")
+    finally:
+        db.close()
+
+
+def retry_failed(db: Session, newsletter_id: int) -> int:
+    """Put permanently failed deliveries for an issue back in the queue."""
+    count = (
+        db.query(OutboxMessage)
+        .filter(
+            OutboxMessage.newsletter_id == newsletter_id,
+            OutboxMessage.status == "failed",
+        )
+        .update(
+            {
+                "status": "pending",
+                "attempts": 0,
+                "next_attempt_at": datetime.utcnow(),
+                "error": None,
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    outbox_worker.wake()
+    return count
+
+
+def outbox_counts(db: Session, newsletter_id: int) -> dict[str, int]:
+    rows = (
+        db.query(OutboxMessage.status, func.count(OutboxMessage.id))
+        .filter(OutboxMessage.newsletter_id == newsletter_id)
+        .group_by(OutboxMessage.status)
+        .all()
+    )
+    return dict(rows)
@@ -0,0 +1,192 @@
+"""
+Server-side chat conversations with a sliding window and a running summary.
+
+The browser sends only the new message; turns are stored in
+chat_messages. A request to the model carries the conversation summary
+plus the messages not yet summarized, at most CHAT_WINDOW_MESSAGES +
+CHAT_COMPACT_EVERY of them, so its size stays flat however long a parent
+keeps chatting instead of growing with every turn.
+
+Once CHAT_COMPACT_EVERY messages beyond the window have built up, the
+oldest ones are folded into the summary with one model call, after the
+reply has been sent, and deleted. Compaction only applies if
+summarized_through_id is unchanged and the summarized messages are still
+there, so overlapping compactions for one subscriber cannot both land and
+a conversation cleared meanwhile stays cleared.
+"""
+
+import threading
+from typing import NamedTuple
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models import ChatConversation, ChatMessage
+from app.services.ai_chat import summarize_conversation
+
+
+class ChatWindow(NamedTuple):
+    summary: str | None
+    messages: list[dict]
+
+
+async def load_window(db: AsyncSession, subscriber_id: int) -> ChatWindow:
+    limit = settings.CHAT_WINDOW_MESSAGES + settings.CHAT_COMPACT_EVERY
+    summary = await db.scalar(
+        select(ChatConversation.summary).where(ChatConversation.subscriber_id == subscriber_id)
+    )
+    rows = (
+        await db.execute(
+            select(ChatMessage.role, ChatMessage.content)
+            .where(ChatMessage.subscriber_id == subscriber_id)
+            .order_by(ChatMessage.id.desc())
+            .limit(limit)
+        )
+    ).all()
+    messages = [{"role": row.role, "content": row.content} for row in reversed(rows)]
+    # The model expects the conversation to open with the parent
+    while messages and messages[0]["role"] != "user":
+        messages.pop(0)
+    return ChatWindow(summary, messages)
+
+
+async def add_message(db: AsyncSession, subscriber_id: int, role: str, content: str) -> None:
+    await db.execute(
+        insert(ChatMessage).values(subscriber_id=subscriber_id, role=role, content=content)
+    )
+
+
+async def clear_conversation(db: AsyncSession, subscriber_id: int) -> None:
+    await db.execute(delete(ChatMessage).where(ChatMessage.subscriber_id == subscriber_id))
+    await db.execute(
+        delete(ChatConversation).where(ChatConversation.subscriber_id == subscriber_id)
+    )
+
+
+async def unsummarized_count(db: AsyncSession, subscriber_id: int) -> int:
+    return await db.scalar(
+        select(func.count(ChatMessage.id)).where(ChatMessage.subscriber_id == subscriber_id)
+    )
+
+
+async def compact_conversation(subscriber_id: int) -> bool:
+    """Fold all but the last CHAT_WINDOW_MESSAGES messages into the summary.
+
+    Runs after a reply has been sent, in its own sessions, so no connection
+    is held while the model writes the summary. Returns whether it compacted.
+    """
+    async with AsyncSessionLocal() as db:
+        if await unsummarized_count(db, subscriber_id) < (
+            settings.CHAT_WINDOW_MESSAGES + settings.CHAT_COMPACT_EVERY
+        ):
+            return False
+        conversation = await db.get(ChatConversation, subscriber_id)
+        rows = (
+            await db.execute(
+                select(ChatMessage.id, ChatMessage.role, ChatMessage.content)
+                .where(ChatMessage.subscriber_id == subscriber_id)
+                .order_by(ChatMessage.id.desc())
+                .offset(settings.CHAT_WINDOW_MESSAGES)
+            )
+        ).all()
+    if not rows:
+        return False
+
+    previous_through = conversation.summarized_through_id if conversation else 0
+    summarized_through = rows[0].id
+    summary = await summarize_conversation(
+        conversation.summary if conversation else None,
+        [{"role": row.role, "content": row.content} for row in reversed(rows)],
+    )
+
+    async with AsyncSessionLocal() as db:
+        # Deleting the summarized messages first also checks they are still
+        # there, so a "New chat" pressed during the summary call is not undone
+        result = await db.execute(
+            delete(ChatMessage).where(
+                ChatMessage.subscriber_id == subscriber_id,
+                ChatMessage.id <= summarized_through,
+            )
+        )
+        if result.rowcount != len(rows):
+            await db.rollback()
+            return False
+        if conversation:
+            result = await db.execute(
+                update(ChatConversation)
+                .where(
+                    ChatConversation.subscriber_id == subscriber_id,
+                    ChatConversation.summarized_through_id == previous_through,
+                )
+                .values(summary=summary, summarized_through_id=summarized_through)
+            )
+            if result.rowcount == 0:
+                await db.rollback()
+                return False  # another compaction got there first
+        else:
+            db.add(
+                ChatConversation(
+                    subscriber_id=subscriber_id,
+                    summary=summary,
+                    summarized_through_id=summarized_through,
+                )
+            )
+        try:
+            await db.commit()
+        except IntegrityError:
+            return False  # a concurrent first compaction created the row
+    return True
+
+
+class ChatStats:
+    """Per-process counters for chat turns, reported at /admin/metrics."""
+
+    def __init__(self):
+        self.turns = 0
+        self.errors = 0
+        self.compactions = 0
+        self.payload_bytes = 0
+        self.max_payload_bytes = 0
+        self.first_token_seconds = 0.0
+        self.total_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record_turn(self, payload_bytes: int, first_token: float, total: float) -> None:
+        with self._lock:
+            self.turns += 1
+            self.payload_bytes += payload_bytes
+            self.max_payload_bytes = max(self.max_payload_bytes, payload_bytes)
+            self.first_token_seconds += first_token
+            self.total_seconds += total
+
+    def count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self) -> dict:
+        with self._lock:
+            turns = self.turns
+            return {
+                "turns": turns,
+                "errors": self.errors,
+                "compactions": self.compactions,
+                "mean_payload_bytes": round(self.payload_bytes / turns) if turns else None,
+                "max_payload_bytes": self.max_payload_bytes,
+                "mean_first_token_ms": round(self.first_token_seconds / turns * 1000, 1) if turns else None,
+                "mean_turn_ms": round(self.total_seconds / turns * 1000, 1) if turns else None,
+            }
+
+
+chat_stats = ChatStats()
+
+
+async def compact_after_reply(subscriber_id: int) -> None:
+    """Background task for the chat route; a failed compaction is retried next turn."""
+    try:
+        if await compact_conversation(subscriber_id):
+            chat_stats.count("compactions")
+    except Exception as e:
+        print(f"CHAT COMPACTION ERROR: {type(e).__name__}: {e}")
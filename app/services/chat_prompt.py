@@ -0,0 +1,158 @@
+"""
+System prompts for the /my-updates chat, cached between messages.
+
+A chat prompt depends on the baby, the week being viewed and the parent's
+milestone tracking, all of which change far less often than parents send
+messages. Each prompt is cached per (subscriber, week) together with the
+tracking version it was built from: the count and latest updated_at of
+the subscriber's tracking rows, which every tracking write bumps. A
+message then costs one indexed aggregate query; the tracking rows are
+only read again when that version changes.
+
+The prompt includes at most CHAT_TRACKING_HISTORY_LIMIT tracked
+milestones (concerns first, then the most recently updated) and each
+note is clipped, so prompt size and per-message tokens stay flat however
+many weeks of notes a parent logs. Returning the same blocks for an
+unchanged prompt also keeps the provider's prompt cache warm (see
+app.services.ai_chat).
+"""
+
+import threading
+from collections import OrderedDict
+
+from sqlalchemy import case, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import MilestoneTracking
+from app.services.ai_chat import build_system_prompt
+from app.services.milestone_catalog import milestone_catalog
+from app.services.subscriber_cache import SubscriberSnapshot
+
+NOTE_MAX_CHARS = 300
+
+
+async def tracking_version(db: AsyncSession, subscriber_id: int) -> tuple:
+    row = (
+        await db.execute(
+            select(func.count(MilestoneTracking.id), func.max(MilestoneTracking.updated_at)).where(
+                MilestoneTracking.subscriber_id == subscriber_id
+            )
+        )
+    ).one()
+    return tuple(row)
+
+
+def _clip(note: str | None) -> str | None:
+    if note and len(note) > NOTE_MAX_CHARS:
+        return note[: NOTE_MAX_CHARS - 1].rstrip() + "…"
+    return note
+
+
+async def tracking_history(db: AsyncSession, subscriber_id: int, limit: int) -> list[dict]:
+    """The subscriber's `limit` most relevant tracked milestones, in week order."""
+    rows = (
+        await db.execute(
+            select(MilestoneTracking.milestone_id, MilestoneTracking.status, MilestoneTracking.notes)
+            .where(
+                MilestoneTracking.subscriber_id == subscriber_id,
+                or_(MilestoneTracking.status.is_not(None), MilestoneTracking.notes.is_not(None)),
+            )
+            .order_by(
+                case((MilestoneTracking.status == "concern", 0), else_=1),
+                MilestoneTracking.updated_at.desc(),
+            )
+            .limit(limit)
+        )
+    ).all()
+    tracked = [(row, milestone_catalog.get(row.milestone_id)) for row in rows]
+    tracked = sorted(
+        ((row, m) for row, m in tracked if m),
+        key=lambda rm: (rm[1].week_number, rm[1].category),
+    )
+    return [
+        {
+            "week": m.week_number,
+            "category": m.category,
+            "title": m.title,
+            "status": row.status,
+            "notes": _clip(row.notes),
+        }
+        for row, m in tracked
+    ]
+
+
+def _week_milestones(week: int) -> list[dict]:
+    return [
+        {
+            "category": m.category,
+            "title": m.title,
+            "description": m.description,
+            "is_concern_flag": m.is_concern_flag,
+            "parent_action": m.parent_action,
+        }
+        for m in milestone_catalog.for_week(week)
+    ]
+
+
+class PromptCache:
+    def __init__(self, maxsize: int, history_limit: int):
+        self.maxsize = maxsize
+        self.history_limit = history_limit
+        self._entries: OrderedDict[tuple[int, int], tuple[tuple, tuple[dict, ...]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    async def get(
+        self,
+        db: AsyncSession,
+        subscriber: SubscriberSnapshot,
+        week: int,
+        baby_age_weeks: int | None,
+    ) -> tuple[dict, ...]:
+        key = (subscriber.id, week)
+        fingerprint = (
+            subscriber.baby_name,
+            baby_age_weeks,
+            await tracking_version(db, subscriber.id),
+        )
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == fingerprint:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        prompt = build_system_prompt(
+            baby_name=subscriber.baby_name,
+            baby_age_weeks=baby_age_weeks,
+            milestones=_week_milestones(week),
+            tracking_history=await tracking_history(db, subscriber.id, self.history_limit),
+        )
+        with self._lock:
+            self._entries[key] = (fingerprint, prompt)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return prompt
+
+    def invalidate(self) -> None:
+        """Drop every prompt, e.g. after the milestone catalog changes."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            size = len(self._entries)
+        lookups = self.hits + self.misses
+        return {
+            "size": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+prompt_cache = PromptCache(settings.CHAT_PROMPT_CACHE_SIZE, settings.CHAT_TRACKING_HISTORY_LIMIT)
@@ -0,0 +1,227 @@
+"""
+Append-only store for logged emails.
+
+Instead of a .json + .html file per recipient, records are appended to
+size-rotated segment files in email_logs/. Each record is a small frame:
+
+    kind (1 byte) | header length (4 bytes) | payload length (4 bytes)
+    header (JSON) | payload (zlib)
+
+Message records ("M") hold the metadata and point at a body by its
+SHA-256. Body records ("B") are written once per distinct HTML in a
+segment. Since recipients of an issue get near-identical bodies, a new
+body is compressed against the first body seen for the same subject
+(zlib preset dictionary), so only the per-recipient differences take up
+space.
+
+Every writer process owns its own segments (named after its pid), so
+gunicorn workers never interleave writes. Each segment has its own index
+file, and a message id names the segment it is in, so reading a message
+back loads only that segment's index. Bodies are deduplicated and
+delta-compressed within a segment, never across, so one segment's index
+is all a read needs. A writer holds the index of the segment it is
+writing; a reader keeps the last few it loaded.
+"""
+
+import hashlib
+import json
+import os
+import re
+import struct
+import threading
+import uuid
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+
+_FRAME = struct.Struct(">cII")
+_MESSAGE = b"M"
+_BODY = b"B"
+# zlib only looks back 32 KB, so a longer dictionary is wasted
+_ZDICT_LIMIT = 32 * 1024
+_SEGMENT_NAME = re.compile(r"w\d+-\d{6}")
+
+
+class _SegmentIndex:
+    """Offsets of the messages and bodies in one segment."""
+
+    def __init__(self):
+        self.messages: dict[str, int] = {}
+        self.bodies: dict[str, int] = {}
+        self.zdicts: dict[str, bytes] = {}
+        self.loaded_bytes = 0  # how much of the index file has been read
+
+
+class EmailLogStore:
+    def __init__(
+        self,
+        directory: Path,
+        segment_bytes: int = 64 * 1024 * 1024,
+        cached_segments: int = 8,
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.cached_segments = cached_segments
+        self.writer_id = f"w{os.getpid()}"
+        self._lock = threading.Lock()
+        # Indexes of segments read back, least recently used dropped first
+        self._indexes: OrderedDict[str, _SegmentIndex] = OrderedDict()
+
+        own = sorted(self.directory.glob(f"{self.writer_id}-*.seg"))
+        self._seq = int(own[-1].stem.rsplit("-", 1)[1]) if own else 1
+        self._segment = None
+        self._index_file = None
+        self._current: _SegmentIndex | None = None
+        # subject -> hash of the body used as compression dictionary
+        self._base_bodies: dict[str, str] = {}
+
+    # ── Segments and their indexes ───────────────────────────────────────
+
+    def _segment_name(self) -> str:
+        return f"{self.writer_id}-{self._seq:06d}"
+
+    def _open_segment(self) -> None:
+        """Open the segment to write to, starting a new one when it is full."""
+        if self._segment is not None and self._segment.tell() >= self.segment_bytes:
+            self._close_segment()
+            self._seq += 1
+        if self._segment is None:
+            name = self._segment_name()
+            self._segment = open(self.directory / f"{name}.seg", "ab")
+            self._index_file = open(self.directory / f"{name}.idx", "ab")
+            # Picks up what this writer stored before a restart
+            self._current = self._indexes.pop(name, None) or _SegmentIndex()
+            self._refresh(name, self._current)
+            self._base_bodies.clear()
+
+    def _close_segment(self) -> None:
+        if self._segment is not None:
+            self._segment.close()
+            self._index_file.close()
+            self._segment = self._index_file = self._current = None
+
+    def _segment_index(self, name: str) -> _SegmentIndex:
+        if self._current is not None and name == self._segment_name():
+            return self._current
+        index = self._indexes.get(name)
+        if index is None:
+            index = self._indexes[name] = _SegmentIndex()
+            while len(self._indexes) > self.cached_segments:
+                self._indexes.popitem(last=False)
+        else:
+            self._indexes.move_to_end(name)
+        return index
+
+    def _refresh(self, name: str, index: _SegmentIndex) -> None:
+        """Read index lines written since `index` was last loaded."""
+        try:
+            f = open(self.directory / f"{name}.idx", "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            f.seek(index.loaded_bytes)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # still being written, or torn by a crashed writer
+                index.loaded_bytes += len(line)
+                parts = line.decode("utf-8").rstrip("\n").split("\t")
+                if len(parts) != 3:
+                    continue
+                kind, key, offset = parts
+                target = index.messages if kind == "M" else index.bodies
+                target[key] = int(offset)
+
+    def _append(self, kind: bytes, key: str, header: dict, payload: bytes = b"") -> int:
+        offset = self._segment.tell()
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        self._segment.write(_FRAME.pack(kind, len(header_bytes), len(payload)) + header_bytes + payload)
+        self._segment.flush()
+        self._index_file.write(f"{kind.decode()}\t{key}\t{offset}\n".encode("utf-8"))
+        self._index_file.flush()
+        target = self._current.messages if kind == _MESSAGE else self._current.bodies
+        target[key] = offset
+        self._current.loaded_bytes = self._index_file.tell()
+        return offset
+
+    def _read(self, name: str, offset: int) -> tuple[dict, bytes]:
+        with open(self.directory / f"{name}.seg", "rb") as f:
+            f.seek(offset)
+            _, header_len, payload_len = _FRAME.unpack(f.read(_FRAME.size))
+            header = json.loads(f.read(header_len))
+            return header, f.read(payload_len)
+
+    # ── Bodies ───────────────────────────────────────────────────────────
+
+    def _store_body(self, html: str, subject: str) -> str:
+        index = self._current
+        body_hash = hashlib.sha256(html.encode("utf-8")).hexdigest()
+        if body_hash in index.bodies:
+            return body_hash
+
+        ref = self._base_bodies.get(subject)
+        if ref in index.bodies:
+            compressor = zlib.compressobj(level=6, zdict=self._zdict(self._segment_name(), index, ref))
+        else:
+            ref = None
+            self._base_bodies[subject] = body_hash
+            compressor = zlib.compressobj(level=6)
+        payload = compressor.compress(html.encode("utf-8")) + compressor.flush()
+        self._append(_BODY, body_hash, {"hash": body_hash, "ref": ref}, payload)
+        return body_hash
+
+    def _zdict(self, name: str, index: _SegmentIndex, body_hash: str) -> bytes:
+        zdict = index.zdicts.get(body_hash)
+        if zdict is None:
+            zdict = self._body(name, index, body_hash).encode("utf-8")[-_ZDICT_LIMIT:]
+            index.zdicts[body_hash] = zdict
+        return zdict
+
+    def _body(self, name: str, index: _SegmentIndex, body_hash: str) -> str:
+        header, payload = self._read(name, index.bodies[body_hash])
+        if header["ref"]:
+            decompressor = zlib.decompressobj(zdict=self._zdict(name, index, header["ref"]))
+        else:
+            decompressor = zlib.decompressobj()
+        return (decompressor.decompress(payload) + decompressor.flush()).decode("utf-8")
+
+    # ── Public API ───────────────────────────────────────────────────────
+
+    def append(self, message: dict, extra: dict | None = None) -> tuple[str, str]:
+        """Log a message; returns (message id, segment file name)."""
+        with self._lock:
+            self._open_segment()
+            name = self._segment_name()
+            message_id = f"{name}.{uuid.uuid4().hex}"
+            body_hash = self._store_body(message["html"], message["subject"])
+            header = {
+                "id": message_id,
+                "to": message["to"],
+                "from": message["from"],
+                "subject": message["subject"],
+                "timestamp": datetime.utcnow().isoformat(),
+                "body": body_hash,
+                **(extra or {}),
+            }
+            self._append(_MESSAGE, message_id, header)
+        return message_id, f"{name}.seg"
+
+    def get(self, message_id: str) -> dict | None:
+        """Metadata plus the full HTML body for a logged message."""
+        name, _, _ = message_id.partition(".")
+        if not _SEGMENT_NAME.fullmatch(name):
+            return None
+        with self._lock:
+            index = self._segment_index(name)
+            if message_id not in index.messages:
+                self._refresh(name, index)  # may have been written since
+            offset = index.messages.get(message_id)
+            if offset is None:
+                return None
+            header, _ = self._read(name, offset)
+            return {**header, "html": self._body(name, index, header["body"])}
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_segment()
@@ -0,0 +1,286 @@
+"""
+Pluggable async email transports.
+
+Messages are plain dicts in Resend's payload shape:
+    {"from": ..., "to": ..., "subject": ..., "html": ...}
+plus an optional "idempotency_key", which backends that support it honour
+and the others ignore.
+
+A message the provider rejects raises DeliveryError, marked retryable for
+temporary failures (connection drops, 4xx SMTP replies, HTTP 429 and 5xx)
+and permanent otherwise. send_batch returns one entry per message, in
+order, with the DeliveryError in place of the result of a message that
+was not sent.
+
+Pick a backend with EMAIL_TRANSPORT=file|smtp|resend (default: file).
+"""
+
+import asyncio
+import hashlib
+import smtplib
+import ssl
+from email.message import EmailMessage
+from email.utils import make_msgid
+
+import httpx
+
+from app.config import BASE_DIR, settings
+from app.services.email_log import EmailLogStore
+
+EMAIL_LOG_DIR = BASE_DIR / "email_logs"
+
+
+class DeliveryError(Exception):
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class EmailTransport:
+    """Base class for async email delivery backends."""
+
+    # Largest number of messages a backend can hand off in one call
+    max_batch_size: int = 1
+
+    async def send(self, message: dict) -> dict:
+        raise NotImplementedError
+
+    async def send_batch(self, messages: list[dict]) -> list[dict | DeliveryError]:
+        results = []
+        for m in messages:
+            try:
+                results.append(await self.send(m))
+            except DeliveryError as e:
+                results.append(e)
+        return results
+
+    async def close(self) -> None:
+        pass
+
+
+class FileTransport(EmailTransport):
+    """Stubbed sender — appends messages to the email_logs/ log store instead of sending."""
+
+    max_batch_size = 100
+
+    def __init__(self, log_dir=EMAIL_LOG_DIR):
+        self.store = EmailLogStore(log_dir, segment_bytes=settings.EMAIL_LOG_SEGMENT_BYTES)
+
+    def _write(self, message: dict) -> dict:
+        message_id, segment = self.store.append(
+            message, {"api_key_configured": bool(settings.RESEND_API_KEY)}
+        )
+        return {
+            "id": message_id,
+            "status": "logged",
+            "path": str(self.store.directory / segment),
+        }
+
+    async def send(self, message: dict) -> dict:
+        return await asyncio.to_thread(self._write, message)
+
+    async def send_batch(self, messages: list[dict]) -> list[dict | DeliveryError]:
+        return await asyncio.to_thread(lambda: [self._write(m) for m in messages])
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self.store.close)
+
+
+class SMTPTransport(EmailTransport):
+    """Delivers over a single SMTP connection that is kept open between messages."""
+
+    max_batch_size = 100
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str = "",
+        password: str = "",
+        starttls: bool = False,
+        timeout: float = 30.0,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self._conn: smtplib.SMTP | None = None
+        self._lock = asyncio.Lock()
+        self.connections_opened = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        conn = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.starttls:
+            conn.starttls(context=ssl.create_default_context())
+        if self.username:
+            conn.login(self.username, self.password)
+        self.connections_opened += 1
+        return conn
+
+    def _deliver(self, message: dict) -> dict:
+        msg = EmailMessage()
+        msg["From"] = message["from"]
+        msg["To"] = message["to"]
+        msg["Subject"] = message["subject"]
+        msg["Message-ID"] = make_msgid()
+        msg.set_content(message["html"], subtype="html")
+
+        try:
+            for attempt in range(2):
+                if self._conn is None:
+                    self._conn = self._connect()
+                try:
+                    self._conn.send_message(msg)
+                    break
+                except smtplib.SMTPServerDisconnected:
+                    # Server dropped an idle connection — reconnect once and retry
+                    self._conn = None
+                    if attempt:
+                        raise
+        except smtplib.SMTPRecipientsRefused as e:
+            codes = [code for code, _ in e.recipients.values()]
+            raise DeliveryError(f"SMTP recipient refused: {e.recipients}", _smtp_retryable(min(codes)))
+        except smtplib.SMTPResponseException as e:
+            raise DeliveryError(f"SMTP {e.smtp_code}: {e.smtp_error!r}", _smtp_retryable(e.smtp_code))
+        except (smtplib.SMTPException, OSError) as e:
+            self._conn = None
+            raise DeliveryError(f"SMTP {type(e).__name__}: {e}")
+        return {"id": msg["Message-ID"], "status": "sent"}
+
+    def _deliver_all(self, messages: list[dict]) -> list[dict | DeliveryError]:
+        results = []
+        for m in messages:
+            try:
+                results.append(self._deliver(m))
+            except DeliveryError as e:
+                results.append(e)
+        return results
+
+    async def send(self, message: dict) -> dict:
+        async with self._lock:
+            return await asyncio.to_thread(self._deliver, message)
+
+    async def send_batch(self, messages: list[dict]) -> list[dict | DeliveryError]:
+        async with self._lock:
+            return await asyncio.to_thread(self._deliver_all, messages)
+
+    def _quit(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.quit()
+            except smtplib.SMTPException:
+                pass
+            self._conn = None
+
+    async def close(self) -> None:
+        async with self._lock:
+            await asyncio.to_thread(self._quit)
+
+
+def _smtp_retryable(code: int) -> bool:
+    """4xx replies are temporary; 5xx ones will fail the same way again."""
+    return code < 500
+
+
+class ResendTransport(EmailTransport):
+    """Resend-compatible HTTP API client with a pooled keep-alive connection."""
+
+    # Resend's /emails/batch endpoint accepts up to 100 messages per call
+    max_batch_size = 100
+
+    def __init__(self, api_key: str, base_url: str = "https://api.resend.com", max_connections: int = 10):
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            headers={"Authorization": f"Bearer {api_key}"},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            timeout=httpx.Timeout(30.0),
+        )
+
+    async def send(self, message: dict) -> dict:
+        payload = dict(message)
+        headers = {}
+        if "idempotency_key" in payload:
+            headers["Idempotency-Key"] = payload.pop("idempotency_key")
+        response = await self._post("/emails", json=payload, headers=headers)
+        return {"id": response.json().get("id"), "status": "sent"}
+
+    async def send_batch(self, messages: list[dict]) -> list[dict | DeliveryError]:
+        results = []
+        for i in range(0, len(messages), self.max_batch_size):
+            chunk = [
+                {k: v for k, v in m.items() if k != "idempotency_key"}
+                for m in messages[i:i + self.max_batch_size]
+            ]
+            headers = {}
+            keys = [m.get("idempotency_key") for m in messages[i:i + self.max_batch_size]]
+            if all(keys):
+                # The batch endpoint takes one key per request, so only an
+                # exact repeat of the batch is dropped
+                digest = hashlib.sha256("\n".join(keys).encode()).hexdigest()
+                headers["Idempotency-Key"] = f"batch-{digest}"
+            try:
+                response = await self._post("/emails/batch", json=chunk, headers=headers)
+            except DeliveryError as e:
+                # The batch endpoint accepts or rejects a chunk as a whole
+                results.extend([e] * len(chunk))
+                continue
+            results.extend(
+                {"id": item.get("id"), "status": "sent"}
+                for item in response.json().get("data", [])
+            )
+        return results
+
+    async def _post(self, path: str, **kwargs) -> httpx.Response:
+        try:
+            response = await self.client.post(path, **kwargs)
+        except httpx.TransportError as e:
+            raise DeliveryError(f"Resend {type(e).__name__}: {e}")
+        if response.is_error:
+            status = response.status_code
+            raise DeliveryError(
+                f"Resend {status}: {response.text[:200]}",
+                retryable=status == 429 or status >= 500,
+            )
+        return response
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+def create_transport(name: str | None = None) -> EmailTransport:
+    name = (name or settings.EMAIL_TRANSPORT).lower()
+    if name == "smtp":
+        return SMTPTransport(
+            host=settings.SMTP_HOST,
+            port=settings.SMTP_PORT,
+            username=settings.SMTP_USERNAME,
+            password=settings.SMTP_PASSWORD,
+            starttls=settings.SMTP_STARTTLS,
+        )
+    if name == "resend":
+        return ResendTransport(
+            api_key=settings.RESEND_API_KEY, base_url=settings.RESEND_API_URL
+        )
+    return FileTransport()
+
+
+_transport: EmailTransport | None = None
+
+
+def get_transport() -> EmailTransport:
+    global _transport
+    if _transport is None:
+        _transport = create_transport()
+    return _transport
+
+
+async def close_transport() -> None:
+    global _transport
+    if _transport is not None:
+        await _transport.close()
+        _transport = None
@@ -0,0 +1,103 @@
+"""
+Per-process throttling of admin login attempts.
+
+Each attempt is recorded against the client IP and the submitted username
+before its password is checked. Once an IP has LOGIN_MAX_ATTEMPTS_PER_IP
+attempts inside the last LOGIN_THROTTLE_WINDOW_SECONDS, its further
+attempts are refused without touching bcrypt until the oldest one ages
+out. A username is never locked out, since anyone could then lock the
+admin out by guessing wrong: beyond LOGIN_MAX_ATTEMPTS_PER_USERNAME, each
+attempt on it is held for a delay that doubles from one second up to
+LOGIN_USERNAME_MAX_DELAY_SECONDS before the password is checked. A
+successful login clears both. Counts live in memory, so each web worker
+throttles on its own; at most LOGIN_THROTTLE_MAX_KEYS IPs and usernames
+are tracked, least recently seen dropped first.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import NamedTuple
+
+from app.config import settings
+
+
+class Verdict(NamedTuple):
+    retry_after: int  # seconds until the IP may try again; 0 if allowed
+    delay: float  # seconds to hold an allowed attempt before checking it
+
+
+class LoginThrottle:
+    def __init__(
+        self,
+        max_per_ip: int,
+        max_per_username: int,
+        window: float,
+        max_keys: int,
+        max_delay: float = 30.0,
+    ):
+        self.max_per_ip = max_per_ip
+        self.max_per_username = max_per_username
+        self.window = window
+        self.max_keys = max_keys
+        self.max_delay = max_delay
+        self._attempts: OrderedDict[tuple[str, str], deque[float]] = OrderedDict()
+        self.allowed = 0
+        self.delayed = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+
+    def _recent(self, key: tuple[str, str], now: float) -> deque[float]:
+        attempts = self._attempts.get(key)
+        if attempts is None:
+            attempts = self._attempts[key] = deque()
+            while len(self._attempts) > self.max_keys:
+                self._attempts.popitem(last=False)
+        else:
+            self._attempts.move_to_end(key)
+        while attempts and attempts[0] <= now - self.window:
+            attempts.popleft()
+        return attempts
+
+    def attempt(self, ip: str, username: str) -> Verdict:
+        """Record a login attempt and say whether, and when, to check it."""
+        now = time.monotonic()
+        with self._lock:
+            by_ip = self._recent(("ip", ip), now)
+            by_username = self._recent(("username", username.lower()), now)
+            if len(by_ip) >= self.max_per_ip:
+                self.throttled += 1
+                wait = by_ip[0] + self.window - now
+                return Verdict(max(1, math.ceil(wait)), 0.0)
+            by_ip.append(now)
+            by_username.append(now)
+            excess = len(by_username) - self.max_per_username
+            if excess > 0:
+                self.delayed += 1
+                return Verdict(0, min(self.max_delay, 2.0 ** (excess - 1)))
+            self.allowed += 1
+            return Verdict(0, 0.0)
+
+    def succeeded(self, ip: str, username: str) -> None:
+        with self._lock:
+            self._attempts.pop(("ip", ip), None)
+            self._attempts.pop(("username", username.lower()), None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "tracked_keys": len(self._attempts),
+                "allowed": self.allowed,
+                "delayed": self.delayed,
+                "throttled": self.throttled,
+            }
+
+
+login_throttle = LoginThrottle(
+    settings.LOGIN_MAX_ATTEMPTS_PER_IP,
+    settings.LOGIN_MAX_ATTEMPTS_PER_USERNAME,
+    settings.LOGIN_THROTTLE_WINDOW_SECONDS,
+    settings.LOGIN_THROTTLE_MAX_KEYS,
+    settings.LOGIN_USERNAME_MAX_DELAY_SECONDS,
+)
@@ -0,0 +1,108 @@
+"""
+Read-only, in-process cache of the milestone seed data.
+
+Milestones only change when the seed data changes, so each worker loads
+them once into immutable records indexed by id, by week and by
+(week, category), and subscriber pages read from memory instead of
+querying. Call `milestone_catalog.invalidate()` after editing milestones;
+the next read reloads from the database.
+"""
+
+import threading
+from typing import NamedTuple
+
+from app.database import SessionLocal
+from app.models import Milestone
+
+
+class MilestoneRecord(NamedTuple):
+    id: int
+    week_number: int
+    category: str
+    title: str
+    description: str
+    source: str | None
+    parent_action: str | None
+    is_concern_flag: bool
+
+
+class _Index(NamedTuple):
+    by_id: dict[int, MilestoneRecord]
+    by_week: dict[int, tuple[MilestoneRecord, ...]]
+    by_week_category: dict[tuple[int, str], tuple[MilestoneRecord, ...]]
+
+
+class MilestoneCatalog:
+    def __init__(self):
+        self._index: _Index | None = None
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        db = SessionLocal()
+        try:
+            rows = (
+                db.query(
+                    Milestone.id,
+                    Milestone.week_number,
+                    Milestone.category,
+                    Milestone.title,
+                    Milestone.description,
+                    Milestone.source,
+                    Milestone.parent_action,
+                    Milestone.is_concern_flag,
+                )
+                .order_by(Milestone.week_number, Milestone.category, Milestone.id)
+                .all()
+            )
+        finally:
+            db.close()
+
+        records = [
+            MilestoneRecord(*row[:7], is_concern_flag=bool(row.is_concern_flag))
+            for row in rows
+        ]
+        by_week: dict[int, list] = {}
+        by_week_category: dict[tuple[int, str], list] = {}
+        for r in records:
+            by_week.setdefault(r.week_number, []).append(r)
+            by_week_category.setdefault((r.week_number, r.category), []).append(r)
+
+        # Swap in a fully built index so readers never see a partial one
+        self._index = _Index(
+            by_id={r.id: r for r in records},
+            by_week={k: tuple(v) for k, v in by_week.items()},
+            by_week_category={k: tuple(v) for k, v in by_week_category.items()},
+        )
+
+    def _get_index(self) -> _Index:
+        index = self._index
+        if index is None:
+            with self._lock:
+                if self._index is None:
+                    self.load()
+                index = self._index
+        return index
+
+    def invalidate(self) -> None:
+        self._index = None
+
+    def get(self, milestone_id: int) -> MilestoneRecord | None:
+        return self._get_index().by_id.get(milestone_id)
+
+    def for_week(self, week: int) -> tuple[MilestoneRecord, ...]:
+        """A week's milestones, ordered by category then id."""
+        return self._get_index().by_week.get(week, ())
+
+    def for_week_category(self, week: int, category: str) -> tuple[MilestoneRecord, ...]:
+        return self._get_index().by_week_category.get((week, category), ())
+
+    def categories(self, week: int) -> dict[str, tuple[MilestoneRecord, ...]]:
+        """Category -> milestones for a week, in category order."""
+        index = self._get_index()
+        return {
+            category: index.by_week_category[(week, category)]
+            for category in dict.fromkeys(m.category for m in index.by_week.get(week, ()))
+        }
+
+
+milestone_catalog = MilestoneCatalog()
@@ -0,0 +1,131 @@
+import re
+import threading
+from collections import OrderedDict
+
+from markupsafe import escape
+
+from app.templating import templates
+
+# Per-recipient fields are rendered as private-use code points so they pass
+# through autoescaping untouched and can be split back out of the HTML.
+_SLOT_RE = re.compile("\ue000(\\w+)\ue001")
+
+
+def _slot(name: str) -> str:
+    return f"\ue000{name}\ue001"
+
+
+class EmailSkeleton:
+    """A rendered newsletter with holes for the per-recipient fields."""
+
+    def __init__(self, html: str):
+        parts = _SLOT_RE.split(html)
+        self._literals = parts[0::2]
+        self._slots = parts[1::2]
+
+    def fill(self, fields: dict[str, str]) -> str:
+        out = [self._literals[0]]
+        for slot, literal in zip(self._slots, self._literals[1:]):
+            out.append(fields[slot])
+            out.append(literal)
+        return "".join(out)
+
+
+def sections_for_tier(newsletter, tier: str) -> list:
+    if tier == "paid":
+        return list(newsletter.sections)
+    return [s for s in newsletter.sections if not s.is_paid_only]
+
+
+def render_skeleton(newsletter, milestones: list, tier: str) -> EmailSkeleton:
+    """Render the full newsletter once for every recipient on a tier."""
+    html = templates.get_template("email/newsletter.html").render(
+        newsletter=newsletter,
+        sections=sections_for_tier(newsletter, tier),
+        milestones=milestones,
+        subscriber_name=_slot("subscriber_name"),
+        baby_name=_slot("baby_name"),
+        baby_age_weeks=newsletter.week_number,
+        unsubscribe_url=_slot("unsubscribe_url"),
+        is_preview=False,
+    )
+    return EmailSkeleton(html)
+
+
+def recipient_fields(
+    subscriber_name: str | None, baby_name: str | None, unsubscribe_url: str
+) -> dict[str, str]:
+    """Escaped slot values, mirroring the fallbacks in email/newsletter.html."""
+    return {
+        "subscriber_name": str(escape(subscriber_name or "there")),
+        "baby_name": (
+            str(escape(baby_name))
+            if baby_name and baby_name != "Baby"
+            else "your little one"
+        ),
+        "unsubscribe_url": str(escape(unsubscribe_url)),
+    }
+
+
+def _fingerprint(newsletter, milestones: list, tier: str) -> int:
+    """Hash of everything the skeleton depends on, so stale entries never match."""
+    return hash((
+        tier,
+        newsletter.subject_line,
+        newsletter.week_number,
+        tuple(
+            (s.id, s.title, s.body, s.sort_order, s.is_paid_only)
+            for s in newsletter.sections
+        ),
+        tuple(
+            (m.id, m.category, m.title, m.description, m.parent_action, m.is_concern_flag)
+            for m in milestones
+        ),
+    ))
+
+
+class RenderCache:
+    """LRU of rendered skeletons keyed by (issue, tier).
+
+    Each entry carries a fingerprint of the issue's sections and the week's
+    milestones, so edits made through another worker process are picked up
+    on the next lookup. `invalidate` frees entries eagerly after local edits.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[int, str], tuple[int, EmailSkeleton]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        # Outbox workers render from threads as well as the event loop
+        self._lock = threading.Lock()
+
+    def get(self, newsletter, milestones: list, tier: str) -> EmailSkeleton:
+        key = (newsletter.id, tier)
+        fingerprint = _fingerprint(newsletter, milestones, tier)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == fingerprint:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        skeleton = render_skeleton(newsletter, milestones, tier)
+        with self._lock:
+            self._entries[key] = (fingerprint, skeleton)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return skeleton
+
+    def invalidate(self, newsletter_id: int | None = None) -> None:
+        with self._lock:
+            if newsletter_id is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[0] == newsletter_id]:
+                del self._entries[key]
+
+
+render_cache = RenderCache()
@@ -0,0 +1,208 @@
+"""
+Per-process cache of AI replies to milestone notes.
+
+Parents write many near-identical notes on the same milestone ("she did
+it today!" on the social smile), and each would otherwise cost a model
+call. Replies are cached under (milestone_id, status, baby's age in
+weeks, normalized note), where normalizing lowercases the note, drops
+punctuation and replaces the baby's name with a placeholder. The age is
+part of the key because the model is told it and may mention it. The
+baby's name in the reply is replaced with a placeholder when it is stored
+and filled back in for each reader, so one reply serves every family
+(see `reply_template` for names that are also words). Entries are evicted least recently used beyond
+NOTE_CACHE_SIZE and expire after NOTE_CACHE_TTL_SECONDS.
+
+With NOTE_CACHE_SIMILARITY set (0-1), a miss on the exact key falls back
+to the most similar cached note for the same milestone, status and age, by
+cosine similarity of character-trigram vectors, if it reaches that
+threshold. It is off by default: notes that differ by one word ("did" /
+"didn't") can score highly, so pick the threshold with care.
+"""
+
+import math
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import NamedTuple
+
+from app.config import settings
+
+NAME_PLACEHOLDER = "\x00baby\x00"
+CAPITALIZED_NAME_PLACEHOLDER = "\x00Baby\x00"  # "Your baby" at the start of a sentence
+NOTE_NAME = "<baby>"
+DEFAULT_NAME = "your baby"  # what generate_milestone_response calls a nameless baby
+
+
+def normalize_note(note: str, baby_name: str | None) -> str:
+    text = note.lower()
+    if baby_name:
+        text = re.sub(rf"\b{re.escape(baby_name.lower())}\b", NOTE_NAME, text)
+    text = re.sub(r"[^\w<>']+", " ", text)
+    return " ".join(text.split())
+
+
+def reply_template(reply: str, baby_name: str | None) -> str | None:
+    """The reply with each mention of the baby's name replaced, or None.
+
+    Only the capitalized name counts as a mention, matched case-sensitively,
+    since many names are also words ("Will", "Joy", "Hope"). A reply that
+    uses the name in lower case as well can't be told apart safely, so it
+    gets no template and is not cached.
+    """
+    if not baby_name:
+        template = re.sub(rf"\b{DEFAULT_NAME}\b", NAME_PLACEHOLDER, reply)
+        return re.sub(
+            rf"\b{DEFAULT_NAME.capitalize()}\b", CAPITALIZED_NAME_PLACEHOLDER, template
+        )
+    if re.search(rf"\b{re.escape(baby_name.lower())}\b", reply):
+        return None
+    capitalized = baby_name[:1].upper() + baby_name[1:]
+    return re.sub(rf"\b{re.escape(capitalized)}\b", CAPITALIZED_NAME_PLACEHOLDER, reply)
+
+
+def fill_reply(template: str, baby_name: str | None) -> str:
+    name = baby_name or DEFAULT_NAME
+    return template.replace(NAME_PLACEHOLDER, name).replace(
+        CAPITALIZED_NAME_PLACEHOLDER, name[:1].upper() + name[1:]
+    )
+
+
+def note_vector(normalized: str) -> dict[str, float]:
+    """Unit-length character-trigram counts: a small local text embedding."""
+    padded = f" {normalized} "
+    counts = Counter(padded[i : i + 3] for i in range(len(padded) - 2))
+    norm = math.sqrt(sum(c * c for c in counts.values())) or 1.0
+    return {gram: c / norm for gram, c in counts.items()}
+
+
+def similarity(a: dict[str, float], b: dict[str, float]) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(gram, 0.0) for gram, weight in a.items())
+
+
+class _Entry(NamedTuple):
+    expires: float
+    reply: str  # with name placeholders where the baby's name was
+    vector: dict[str, float] | None
+
+
+class NoteReplyCache:
+    def __init__(self, maxsize: int, ttl: float, min_similarity: float = 0.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.min_similarity = min_similarity
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+        # (milestone_id, status, baby_age_weeks) -> keys, for the similarity fallback
+        self._groups: dict[tuple, set[tuple]] = {}
+        self.hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        milestone_id: int,
+        status: str | None,
+        baby_age_weeks: int | None,
+        note: str,
+        baby_name: str | None,
+        count: bool = True,
+    ) -> str | None:
+        """The cached reply for this note with baby_name filled in, or None.
+
+        count=False leaves the hit/miss counters alone, for a second look at
+        a note whose first lookup was already counted.
+        """
+        normalized = normalize_note(note, baby_name)
+        key = (milestone_id, status, baby_age_weeks, normalized)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry.expires <= now:
+                self._remove(key)
+                entry = None
+            if entry:
+                self._entries.move_to_end(key)
+                counter = "hits"
+            elif self.min_similarity > 0:
+                entry = self._most_similar(key, note_vector(normalized), now)
+                counter = "similar_hits"
+            if not entry:
+                counter = "misses"
+            if count:
+                setattr(self, counter, getattr(self, counter) + 1)
+            if not entry:
+                return None
+        return fill_reply(entry.reply, baby_name)
+
+    def _most_similar(self, key: tuple, vector: dict[str, float], now: float) -> _Entry | None:
+        best, best_score = None, self.min_similarity
+        for other in self._groups.get(key[:3], ()):
+            entry = self._entries[other]
+            if entry.expires <= now:
+                continue
+            score = similarity(vector, entry.vector)
+            if score >= best_score:
+                best, best_score = other, score
+        if best is None:
+            return None
+        self._entries.move_to_end(best)
+        return self._entries[best]
+
+    def put(
+        self,
+        milestone_id: int,
+        status: str | None,
+        baby_age_weeks: int | None,
+        note: str,
+        baby_name: str | None,
+        reply: str,
+    ) -> None:
+        normalized = normalize_note(note, baby_name)
+        key = (milestone_id, status, baby_age_weeks, normalized)
+        template = reply_template(reply, baby_name)
+        if template is None:
+            self.uncacheable += 1
+            return
+        vector = note_vector(normalized) if self.min_similarity > 0 else None
+        with self._lock:
+            self._entries[key] = _Entry(time.monotonic() + self.ttl, template, vector)
+            self._entries.move_to_end(key)
+            self._groups.setdefault(key[:3], set()).add(key)
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: tuple) -> None:
+        del self._entries[key]
+        group = self._groups.get(key[:3])
+        if group is not None:
+            group.discard(key)
+            if not group:
+                del self._groups[key[:3]]
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._groups.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            size = len(self._entries)
+        hits = self.hits + self.similar_hits
+        lookups = hits + self.misses
+        return {
+            "size": size,
+            "hits": self.hits,
+            "similar_hits": self.similar_hits,
+            "misses": self.misses,
+            "uncacheable": self.uncacheable,
+            "hit_rate": round(hits / lookups, 4) if lookups else None,
+        }
+
+
+note_cache = NoteReplyCache(
+    settings.NOTE_CACHE_SIZE, settings.NOTE_CACHE_TTL_SECONDS, settings.NOTE_CACHE_SIMILARITY
+)
@@ -0,0 +1,135 @@
+"""
+Replies to parents' milestone notes, generated off the request path.
+
+Saving a note commits it with ai_status="pending" and hands a NoteJob to
+this process's NoteResponder. NOTE_RESPONSE_WORKERS tasks take jobs from a
+queue bounded at NOTE_RESPONSE_QUEUE_SIZE, call the model and store the
+reply (ai_status "ready", or "failed"). The milestone card polls
+/my-updates/{token}/track/{milestone_id}/response until the reply is in,
+so saving a note never waits on the model. Notes already answered for
+another parent are served from app.services.note_cache instead.
+
+A reply is only stored while the note it answers is still the saved one.
+Jobs are held in memory: a full queue or a stopped worker marks the note
+"failed" straight away, and a note left "pending" by a worker that died is
+treated as failed once NOTE_RESPONSE_TIMEOUT_SECONDS have passed.
+"""
+
+import asyncio
+from typing import NamedTuple
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.services.ai_chat import generate_milestone_response
+from app.services.note_cache import note_cache
+from app.services.tracking import set_ai_response
+
+
+class NoteJob(NamedTuple):
+    subscriber_id: int
+    milestone_id: int
+    note: str
+    status: str | None
+    baby_name: str | None
+    baby_age_weeks: int | None
+    milestone_title: str
+    milestone_description: str
+
+
+class NoteResponder:
+    def __init__(self, workers: int, queue_size: int):
+        self.workers = workers
+        self.queue_size = queue_size
+        self._queue: asyncio.Queue | None = None
+        self._tasks: list[asyncio.Task] = []
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    def start(self) -> None:
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._tasks = [asyncio.create_task(self.run()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    def submit(self, job: NoteJob) -> bool:
+        """Queue a reply; False when the pool is stopped or full."""
+        if self._queue is None:
+            self.rejected += 1
+            return False
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            return False
+        self.submitted += 1
+        return True
+
+    async def run(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self.respond(job)
+            finally:
+                self._queue.task_done()
+
+    async def respond(self, job: NoteJob) -> None:
+        # An identical note may have been answered while this one was queued
+        ai_response = note_cache.get(
+            job.milestone_id,
+            job.status,
+            job.baby_age_weeks,
+            job.note,
+            job.baby_name,
+            count=False,
+        )
+        if ai_response is None:
+            ai_response = await self.generate(job)
+        try:
+            async with AsyncSessionLocal() as db:
+                await set_ai_response(db, job.subscriber_id, job.milestone_id, job.note, ai_response)
+                await db.commit()
+        except Exception as e:
+            print(f"AI RESPONSE ERROR: {type(e).__name__}: {e}")
+
+    async def generate(self, job: NoteJob) -> str | None:
+        try:
+            ai_response = await asyncio.wait_for(
+                generate_milestone_response(
+                    baby_name=job.baby_name,
+                    baby_age_weeks=job.baby_age_weeks,
+                    milestone_title=job.milestone_title,
+                    milestone_description=job.milestone_description,
+                    parent_note=job.note,
+                    status=job.status,
+                ),
+                settings.NOTE_RESPONSE_TIMEOUT_SECONDS,
+            )
+        except Exception as e:
+            print(f"AI RESPONSE ERROR: {type(e).__name__}: {e}")
+            self.failed += 1
+            return None
+        self.completed += 1
+        note_cache.put(
+            job.milestone_id, job.status, job.baby_age_weeks, job.note, job.baby_name, ai_response
+        )
+        return ai_response
+
+    def stats(self) -> dict:
+        return {
+            "workers": len(self._tasks),
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+        }
+
+
+note_responder = NoteResponder(settings.NOTE_RESPONSE_WORKERS, settings.NOTE_RESPONSE_QUEUE_SIZE)
@@ -0,0 +1,300 @@
+"""
+Durable delivery queue for newsletter emails.
+
+Every web worker process runs one OutboxWorker loop. A loop claims a small
+batch of due rows from email_outbox — SELECT ... FOR UPDATE SKIP LOCKED on
+Postgres; SQLite serializes writers, so the conditional UPDATE that marks
+rows as "sending" is enough there — hands them to the configured transport
+in batches of up to its max_batch_size under a token-bucket rate limit, and
+records each outcome.
+
+Temporary failures are retried with exponential backoff up to
+OUTBOX_MAX_ATTEMPTS; a message the provider rejects for good fails at once.
+Rows claimed by a worker that died or stalled are picked up again once
+their lease expires. Each claim gets its own token, and outcomes are only
+recorded on rows still holding it, so a late worker cannot overwrite the
+result of the claim that replaced it. The outbox row id is sent as the
+provider idempotency key, but Resend's batch endpoint takes one key per
+request and the SMTP and file transports have no such check, so a
+re-claimed row that had in fact been delivered can go out twice.
+"""
+
+import asyncio
+import os
+import random
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, or_, select, update
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import NewsletterIssue, OutboxMessage, Subscriber
+from app.services.email import build_message
+from app.services.email_transport import get_transport
+from app.services.milestone_catalog import milestone_catalog
+from app.services.newsletter_render import recipient_fields, render_cache
+
+TIERS = ("free", "paid")
+
+
+class TokenBucket:
+    """Allows `rate` acquisitions per second with bursts of up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def backoff_delay(attempts: int) -> timedelta:
+    """Exponential backoff with jitter: ~base, 2x base, 4x base ... capped at an hour."""
+    delay = min(settings.OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1), 3600)
+    return timedelta(seconds=delay * random.uniform(0.5, 1.0))
+
+
+def _claimable(now: datetime):
+    lease_cutoff = now - timedelta(seconds=settings.OUTBOX_LEASE_SECONDS)
+    return or_(
+        and_(OutboxMessage.status == "pending", OutboxMessage.next_attempt_at <= now),
+        and_(OutboxMessage.status == "sending", OutboxMessage.claimed_at < lease_cutoff),
+    )
+
+
+def due_ids_query(now: datetime, limit: int, dialect: str):
+    """The ids of up to `limit` claimable rows; on Postgres, rows another
+    worker is claiming are skipped rather than waited for."""
+    query = (
+        select(OutboxMessage.id)
+        .where(_claimable(now))
+        .order_by(OutboxMessage.id)
+        .limit(limit)
+    )
+    if dialect == "postgresql":
+        query = query.with_for_update(skip_locked=True)
+    return query
+
+
+def claim_batch(worker_id: str, limit: int) -> tuple[str, list]:
+    """Mark up to `limit` due rows as sending for this worker.
+
+    Returns the claim token and the claimed rows.
+    """
+    db = SessionLocal()
+    try:
+        now = datetime.utcnow()
+        token = f"{worker_id}:{uuid.uuid4().hex[:8]}"
+        ids = db.scalars(due_ids_query(now, limit, db.bind.dialect.name)).all()
+        if not ids:
+            db.rollback()
+            return token, []
+
+        db.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(ids), _claimable(now))
+            .values(
+                status="sending",
+                claimed_by=token,
+                claimed_at=now,
+                attempts=OutboxMessage.attempts + 1,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+
+        return token, (
+            db.query(
+                OutboxMessage.id,
+                OutboxMessage.newsletter_id,
+                OutboxMessage.attempts,
+                Subscriber.email,
+                Subscriber.name,
+                Subscriber.baby_name,
+                Subscriber.tier,
+                Subscriber.unsubscribe_token,
+                Subscriber.is_active,
+            )
+            .join(Subscriber, Subscriber.id == OutboxMessage.subscriber_id)
+            .filter(OutboxMessage.claimed_by == token)
+            .all()
+        )
+    finally:
+        db.close()
+
+
+def load_skeletons(newsletter_ids: set[int]) -> dict:
+    """(newsletter id, tier) -> (subject line, rendered skeleton)."""
+    db = SessionLocal()
+    try:
+        skeletons = {}
+        for newsletter_id in newsletter_ids:
+            newsletter = db.get(NewsletterIssue, newsletter_id)
+            if not newsletter:
+                continue
+            milestones = milestone_catalog.for_week(newsletter.week_number)
+            for tier in TIERS:
+                skeletons[(newsletter_id, tier)] = (
+                    newsletter.subject_line,
+                    render_cache.get(newsletter, milestones, tier),
+                )
+        return skeletons
+    finally:
+        db.close()
+
+
+def record_results(token: str, results: list[dict]) -> None:
+    """Store delivery outcomes on the rows this claim still holds."""
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(OutboxMessage).where(OutboxMessage.claimed_by == token),
+            results,
+            execution_options={"synchronize_session": False},
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+class OutboxWorker:
+    def __init__(self):
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        # Every worker process sends, so each gets its share of the provider limit
+        workers = max(settings.WEB_CONCURRENCY, 1)
+        self.bucket = TokenBucket(
+            settings.EMAIL_RATE_LIMIT / workers, max(settings.EMAIL_RATE_BURST / workers, 1)
+        )
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+
+    def wake(self) -> None:
+        """Start the next claim immediately; safe to call from any thread."""
+        if self._loop is not None and self._wake is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._stopping = False
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        self._stopping = True
+        if self._task is not None:
+            self._wake.set()
+            await self._task
+            self._task = None
+        self._loop = None
+
+    async def run(self) -> None:
+        while not self._stopping:
+            try:
+                processed = await self.run_once()
+            except Exception as e:
+                print(f"OUTBOX ERROR: {type(e).__name__}: {e}")
+                processed = 0
+            if not processed:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), settings.OUTBOX_POLL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def run_once(self) -> int:
+        token, rows = await asyncio.to_thread(
+            claim_batch, self.worker_id, settings.OUTBOX_BATCH_SIZE
+        )
+        if not rows:
+            return 0
+        skeletons = await asyncio.to_thread(load_skeletons, {r.newsletter_id for r in rows})
+
+        results = []
+        deliverable = []
+        for row in rows:
+            tier = "paid" if row.tier == "paid" else "free"
+            entry = skeletons.get((row.newsletter_id, tier))
+            if entry is None or not row.is_active:
+                results.append(_outcome(row, "skipped"))
+                continue
+            subject, skeleton = entry
+            html_body = skeleton.fill(
+                recipient_fields(
+                    row.name,
+                    row.baby_name,
+                    f"{settings.BASE_URL}/unsubscribe/{row.unsubscribe_token}",
+                )
+            )
+            deliverable.append(
+                (row, build_message(row.email, subject, html_body, idempotency_key=f"outbox-{row.id}"))
+            )
+
+        transport = get_transport()
+        size = transport.max_batch_size
+        semaphore = asyncio.Semaphore(settings.BROADCAST_CONCURRENCY)
+
+        async def deliver(chunk: list) -> list[dict]:
+            async with semaphore:
+                for _ in chunk:
+                    await self.bucket.acquire()
+                try:
+                    sent = await transport.send_batch([message for _, message in chunk])
+                except Exception as e:
+                    sent = [e] * len(chunk)
+            return [_delivery_outcome(row, result) for (row, _), result in zip(chunk, sent)]
+
+        for outcomes in await asyncio.gather(
+            *(deliver(deliverable[i:i + size]) for i in range(0, len(deliverable), size))
+        ):
+            results.extend(outcomes)
+        await asyncio.to_thread(record_results, token, results)
+        return len(results)
+
+
+def _outcome(row, status: str, **fields) -> dict:
+    return {
+        "id": row.id,
+        "status": status,
+        "claimed_by": None,
+        "claimed_at": None,
+        "provider_id": None,
+        "error": None,
+        "sent_at": None,
+        "next_attempt_at": datetime.utcnow(),
+        **fields,
+    }
+
+
+def _delivery_outcome(row, sent) -> dict:
+    """Sent, retried with backoff, or failed for good after a permanent error
+    or the last attempt."""
+    if not isinstance(sent, Exception):
+        return _outcome(row, "sent", provider_id=sent.get("id"), sent_at=datetime.utcnow())
+    error = f"{type(sent).__name__}: {sent}"
+    if not getattr(sent, "retryable", True) or row.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+        return _outcome(row, "failed", error=error)
+    return _outcome(
+        row,
+        "pending",
+        error=error,
+        next_attempt_at=datetime.utcnow() + backoff_delay(row.attempts),
+    )
+
+
+outbox_worker = OutboxWorker()
@@ -0,0 +1,62 @@
+from typing import NamedTuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import MilestoneTracking
+from app.services.milestone_catalog import milestone_catalog
+
+
+class WeekProgress(NamedTuple):
+    total_count: int
+    achieved_count: int
+    concern_count: int
+
+    @property
+    def untracked_count(self) -> int:
+        return self.total_count - self.achieved_count - self.concern_count
+
+    def context(self) -> dict:
+        """Template variables for public/partials/milestone_progress.html."""
+        return {
+            "total_count": self.total_count,
+            "achieved_count": self.achieved_count,
+            "concern_count": self.concern_count,
+            "untracked_count": self.untracked_count,
+        }
+
+
+def progress_from_rows(week: int, tracking_rows) -> WeekProgress:
+    """Progress for tracking rows that are already loaded."""
+    statuses = [t.status for t in tracking_rows]
+    return WeekProgress(
+        total_count=len(milestone_catalog.for_week(week)),
+        achieved_count=statuses.count("achieved"),
+        concern_count=statuses.count("concern"),
+    )
+
+
+async def week_progress(db: AsyncSession, subscriber_id: int, week: int) -> WeekProgress:
+    """Progress for a subscriber's week, from one query for just the statuses.
+
+    A week has at most a handful of milestones, so the rows are few and the
+    query's cost is SQLAlchemy's per-statement overhead: selecting the one
+    column measured faster than both a GROUP BY and loading whole rows
+    (benchmarks/bench_toggle.py).
+    """
+    milestone_ids = [m.id for m in milestone_catalog.for_week(week)]
+    statuses = []
+    if milestone_ids:
+        statuses = (
+            await db.scalars(
+                select(MilestoneTracking.status).where(
+                    MilestoneTracking.subscriber_id == subscriber_id,
+                    MilestoneTracking.milestone_id.in_(milestone_ids),
+                )
+            )
+        ).all()
+    return WeekProgress(
+        total_count=len(milestone_ids),
+        achieved_count=statuses.count("achieved"),
+        concern_count=statuses.count("concern"),
+    )
@@ -0,0 +1,183 @@
+"""
+Daily dispatch of scheduled newsletter issues.
+
+A subscriber should get a week's issue on the day their baby turns that
+many weeks old. Those are exactly the subscribers whose birth date is
+today minus a whole number of weeks, so one INSERT ... SELECT over the
+indexed baby_birth_date column queues every due (issue, subscriber) pair
+into the outbox. The cost scales with the number of babies changing week
+today, not with the size of the subscriber list.
+
+Each web worker runs the loop, but a scheduler_runs row per day makes only
+the first one do the work. Days missed while nothing was running, since
+the last finished run, are dispatched on the next run. It can also be run
+from cron:
+
+    python -m app.services.scheduler
+"""
+
+import asyncio
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import DateTime, Integer, String, and_, case, func, literal, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import NewsletterIssue, SchedulerRun, Subscriber
+from app.services.broadcast import outbox_insert
+from app.services.outbox import outbox_worker
+
+JOB_NAME = "dispatch_scheduled_issues"
+MAX_WEEK = 16
+
+
+def week_start_dates(today: date) -> dict[date, int]:
+    """Birth date -> week number, for every baby starting a new week today."""
+    return {today - timedelta(weeks=week): week for week in range(MAX_WEEK + 1)}
+
+
+def dispatch_scheduled_issues(db: Session, today: date | None = None) -> int:
+    """Queue each scheduled issue for subscribers entering its week today."""
+    starts = week_start_dates(today or datetime.utcnow().date())
+    week = case(starts, value=Subscriber.baby_birth_date)
+    due = (
+        select(
+            NewsletterIssue.id,
+            Subscriber.id,
+            literal("pending", String),
+            literal(0, Integer),
+            literal(datetime.utcnow(), DateTime),
+        )
+        .select_from(Subscriber)
+        .join(
+            NewsletterIssue,
+            and_(
+                NewsletterIssue.week_number == week,
+                NewsletterIssue.status == "scheduled",
+            ),
+        )
+        .where(
+            Subscriber.is_active == True,
+            Subscriber.baby_birth_date.in_(list(starts)),
+        )
+    )
+    stmt = (
+        outbox_insert(db)
+        .from_select(
+            ["newsletter_id", "subscriber_id", "status", "attempts", "next_attempt_at"],
+            due,
+        )
+        .on_conflict_do_nothing(index_elements=["newsletter_id", "subscriber_id"])
+    )
+    return db.execute(stmt).rowcount
+
+
+def due_dates(db: Session, today: date) -> list[date]:
+    """Today and any days missed since the last finished run, oldest first."""
+    last = db.scalar(
+        select(func.max(SchedulerRun.run_date)).where(
+            SchedulerRun.job == JOB_NAME, SchedulerRun.finished_at != None
+        )
+    )
+    start = last + timedelta(days=1) if last else today
+    return [start + timedelta(days=n) for n in range((today - start).days + 1)]
+
+
+def run_daily_dispatch(today: date | None = None) -> int | None:
+    """Run each due day's dispatch once across all workers.
+
+    Returns how many deliveries were queued, or None if every due day was
+    already claimed.
+    """
+    today = today or datetime.utcnow().date()
+    db = SessionLocal()
+    try:
+        days = due_dates(db, today)
+    finally:
+        db.close()
+    total = None
+    for run_date in days:
+        count = dispatch_day(run_date)
+        if count is not None:
+            total = (total or 0) + count
+    if total is not None:
+        outbox_worker.wake()
+    return total
+
+
+def dispatch_day(run_date: date) -> int | None:
+    """Run one day's dispatch once across all workers; None if already claimed.
+
+    The claim, the enqueue and the finish commit together, so a worker killed
+    part way through leaves no claim behind and the day is retried. A second
+    worker's claim waits on the unique (job, run_date) key and then fails.
+    """
+    db = SessionLocal()
+    try:
+        # Claims left unfinished before claiming and dispatching shared a transaction
+        db.query(SchedulerRun).filter(
+            SchedulerRun.job == JOB_NAME,
+            SchedulerRun.run_date == run_date,
+            SchedulerRun.finished_at == None,
+        ).delete()
+        run = SchedulerRun(job=JOB_NAME, run_date=run_date)
+        db.add(run)
+        try:
+            db.flush()
+        except IntegrityError:
+            db.rollback()
+            return None
+
+        run.enqueued_count = dispatch_scheduled_issues(db, run_date)
+        run.finished_at = datetime.utcnow()
+        db.commit()
+        return run.enqueued_count
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+class DailyScheduler:
+    def __init__(self):
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def run(self) -> None:
+        while True:
+            if datetime.utcnow().hour >= settings.SCHEDULER_HOUR_UTC:
+                try:
+                    count = await asyncio.to_thread(run_daily_dispatch)
+                    if count is not None:
+                        print(f"SCHEDULER: queued {count} scheduled issue deliveries")
+                except Exception as e:
+                    print(f"SCHEDULER ERROR: {type(e).__name__}: {e}")
+            await asyncio.sleep(settings.SCHEDULER_INTERVAL_SECONDS)
+
+
+daily_scheduler = DailyScheduler()
+
+
+if __name__ == "__main__":
+    from app.bootstrap import check_bootstrap
+
+    check_bootstrap()
+    count = run_daily_dispatch()
+    if count is None:
+        print("Today's dispatch has already run.")
+    else:
+        print(f"Queued {count} scheduled issue deliveries.")
@@ -0,0 +1,101 @@
+"""
+Token -> subscriber lookups for the /my-updates pages.
+
+Every page and HTMX fragment under /my-updates/{token} starts by resolving
+the token, so lookups go through two layers before touching the database:
+the request's own session (db.info) and a small process-wide LRU whose
+entries expire after SUBSCRIBER_CACHE_TTL_SECONDS. Entries are immutable
+snapshots, never ORM objects, so they can be shared across requests.
+
+Writes in this process invalidate the token straight away; the TTL bounds
+how long another worker process can serve a stale snapshot.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import NamedTuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import Subscriber
+
+
+class SubscriberSnapshot(NamedTuple):
+    id: int
+    email: str
+    name: str | None
+    baby_name: str | None
+    baby_birth_date: date | None
+    baby_due_date: date | None
+    neighborhood: str | None
+    tier: str | None
+    is_active: bool
+    unsubscribe_token: str
+
+
+_COLUMNS = [getattr(Subscriber, field) for field in SubscriberSnapshot._fields]
+
+
+class SubscriberCache:
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, SubscriberSnapshot]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    async def get(self, db: AsyncSession, token: str) -> SubscriberSnapshot | None:
+        request_cache = db.info.setdefault("subscriber_snapshots", {})
+        if token in request_cache:
+            return request_cache[token]
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry and entry[0] > now:
+                self._entries.move_to_end(token)
+                self.hits += 1
+                request_cache[token] = entry[1]
+                return entry[1]
+            self.misses += 1
+
+        row = (
+            await db.execute(select(*_COLUMNS).where(Subscriber.unsubscribe_token == token))
+        ).first()
+        snapshot = SubscriberSnapshot(*row) if row else None
+        request_cache[token] = snapshot
+        if snapshot is not None:
+            with self._lock:
+                self._entries[token] = (now + self.ttl, snapshot)
+                self._entries.move_to_end(token)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return snapshot
+
+    def invalidate(self, token: str | None = None) -> None:
+        with self._lock:
+            if token is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(token, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            size = len(self._entries)
+        lookups = self.hits + self.misses
+        return {
+            "size": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+subscriber_cache = SubscriberCache(
+    settings.SUBSCRIBER_CACHE_SIZE, settings.SUBSCRIBER_CACHE_TTL_SECONDS
+)
@@ -0,0 +1,118 @@
+"""
+Milestone tracking writes as single upserts.
+
+A subscriber's row for a milestone is created on first touch, so every
+write is INSERT ... ON CONFLICT (subscriber_id, milestone_id) DO UPDATE.
+The toggle's status cycle (none -> achieved -> concern -> none) is
+computed by the database from the stored row, which makes a toggle one
+statement with no read beforehand; concurrent clicks serialize on the
+row instead of racing to insert it and tripping uq_subscriber_milestone.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import case, null, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import MilestoneTracking
+
+CONFLICT_COLUMNS = ["subscriber_id", "milestone_id"]
+# What the upserts hand back, enough to re-render a milestone card
+RETURNED = (
+    MilestoneTracking.status,
+    MilestoneTracking.notes,
+    MilestoneTracking.ai_response,
+    MilestoneTracking.ai_status,
+)
+
+
+def tracking_insert(db: AsyncSession):
+    """Dialect-specific INSERT for milestone_tracking, so callers can use ON CONFLICT."""
+    dialect = postgresql if db.bind.dialect.name == "postgresql" else sqlite
+    return dialect.insert(MilestoneTracking)
+
+
+async def toggle_status(db: AsyncSession, subscriber_id: int, milestone_id: int):
+    """Advance the milestone's status one step; returns the RETURNED columns."""
+    now = datetime.utcnow()
+    stmt = tracking_insert(db).values(
+        subscriber_id=subscriber_id,
+        milestone_id=milestone_id,
+        status="achieved",
+        achieved_at=now,
+    )
+    next_status = case(
+        (MilestoneTracking.status == "achieved", "concern"),
+        (MilestoneTracking.status == "concern", null()),
+        else_="achieved",
+    )
+    achieved_at = case(
+        (MilestoneTracking.status.in_(["achieved", "concern"]), null()),
+        else_=now,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=CONFLICT_COLUMNS,
+        set_={"status": next_status, "achieved_at": achieved_at, "updated_at": now},
+    ).returning(*RETURNED)
+    return (await db.execute(stmt)).one()
+
+
+async def save_notes(db: AsyncSession, subscriber_id: int, milestone_id: int, notes: str | None):
+    """Store the parent's note and drop the reply to any previous one.
+
+    A new note is marked ai_status="pending" until app.services.note_responses
+    writes its reply. Returns the RETURNED columns after the write.
+    """
+    now = datetime.utcnow()
+    values = {
+        "notes": notes,
+        "ai_response": None,
+        "ai_status": "pending" if notes else None,
+        "updated_at": now,
+    }
+    stmt = (
+        tracking_insert(db)
+        .values(subscriber_id=subscriber_id, milestone_id=milestone_id, **values)
+        .on_conflict_do_update(index_elements=CONFLICT_COLUMNS, set_=values)
+        .returning(*RETURNED)
+    )
+    return (await db.execute(stmt)).one()
+
+
+async def set_ai_response(
+    db: AsyncSession, subscriber_id: int, milestone_id: int, note: str, ai_response: str | None
+) -> bool:
+    """Record the reply to `note`; False if the parent has since changed the note."""
+    result = await db.execute(
+        update(MilestoneTracking)
+        .where(
+            MilestoneTracking.subscriber_id == subscriber_id,
+            MilestoneTracking.milestone_id == milestone_id,
+            MilestoneTracking.notes == note,
+        )
+        .values(
+            ai_response=ai_response,
+            ai_status="ready" if ai_response else "failed",
+            updated_at=datetime.utcnow(),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount > 0
+
+
+async def note_response(db: AsyncSession, subscriber_id: int, milestone_id: int):
+    """(notes, ai_response, ai_status, updated_at) for a milestone, or None."""
+    return (
+        await db.execute(
+            select(
+                MilestoneTracking.notes,
+                MilestoneTracking.ai_response,
+                MilestoneTracking.ai_status,
+                MilestoneTracking.updated_at,
+            ).where(
+                MilestoneTracking.subscriber_id == subscriber_id,
+                MilestoneTracking.milestone_id == milestone_id,
+            )
+        )
+    ).first()
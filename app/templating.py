@@ -0,0 +1,121 @@
+"""
+The one Jinja environment shared by every router and the email renderer.
+
+Compiled templates are written to a filesystem bytecode cache in
+TEMPLATE_CACHE_DIR, so a template is compiled once per deploy rather than
+once per worker. Compile them all ahead of time, at build time:
+
+    python -m app.templating
+
+Workers load every template from that cache on startup (`precompile`), so
+no request pays for parsing. `render_fragment` / `stream_fragment` render
+HTMX fragments straight to strings, and `stream_page` streams a page as
+its queries finish. With TEMPLATE_AUTO_RELOAD off, as in
+production, Jinja never stats template files to check for edits; turn it
+on for local development.
+"""
+
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from pathlib import Path
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from markupsafe import Markup
+
+from app.config import settings
+
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+
+def create_environment(cache_dir: str | None = settings.TEMPLATE_CACHE_DIR) -> Environment:
+    bytecode_cache = None
+    if cache_dir:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(cache_dir)
+    return Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        autoescape=True,
+        auto_reload=settings.TEMPLATE_AUTO_RELOAD,
+        bytecode_cache=bytecode_cache,
+        cache_size=-1,  # keep every template; there are only a few dozen
+    )
+
+
+templates = Jinja2Templates(env=create_environment())
+
+
+def stream_fragment(
+    name: str, context: dict, *, block: str | None = None, oob: str | None = None
+) -> Iterator[str]:
+    """Render a partial, or one named block of a template, as string chunks.
+
+    For HTMX responses that are built from strings rather than returned as
+    a TemplateResponse. `oob` is passed to the template as `hx_oob`, for
+    its root element to render as hx-swap-oob="{{ hx_oob }}", so the same
+    partial serves as the main swap target or as an out-of-band update.
+    """
+    template = templates.env.get_template(name)
+    if oob:
+        context = {**context, "hx_oob": oob}
+    if block is None:
+        return template.generate(context)
+    return template.blocks[block](template.new_context(context))
+
+
+def render_fragment(
+    name: str, context: dict, *, block: str | None = None, oob: str | None = None
+) -> str:
+    return "".join(stream_fragment(name, context, block=block, oob=oob))
+
+
+STREAM_FLUSH = Markup("<!-- stream-flush -->")
+STREAM_ERROR = {"status_code": 500, "detail": "Something went wrong"}
+
+
+async def stream_page(
+    name: str, context: dict, loaders: list[Callable[[], Awaitable[None]]]
+) -> AsyncIterator[str]:
+    """Render a page in pieces, sending each as soon as the data it needs is in.
+
+    Wherever the template outputs {{ stream_flush }}, everything rendered so
+    far is yielded and the next loader is awaited before rendering goes on.
+    Jinja's generate() is lazy, so the template reads what a loader stored
+    (on an object in `context`, not the context itself, which is copied up
+    front) only after that loader has run.
+
+    If a loader fails, the page is finished with the error page's body in
+    place of the rest: the status line has gone out, so it cannot become
+    a 500.
+    """
+    template = templates.env.get_template(name)
+    pending = iter(loaders)
+    buffer: list[str] = []
+    for chunk in template.generate({**context, "stream_flush": STREAM_FLUSH}):
+        if chunk != STREAM_FLUSH:
+            buffer.append(chunk)
+            continue
+        yield "".join(buffer)
+        buffer.clear()
+        loader = next(pending, None)
+        if loader is not None:
+            try:
+                await loader()
+            except Exception as e:
+                print(f"PAGE STREAM ERROR: {type(e).__name__}: {e}")
+                yield render_fragment("error.html", STREAM_ERROR, block="body")
+                yield "\n</body>\n</html>\n"
+                return
+    yield "".join(buffer)
+
+
+def precompile() -> int:
+    """Load every template into the environment; returns how many."""
+    names = templates.env.list_templates(extensions=["html"])
+    for name in names:
+        templates.env.get_template(name)
+    return len(names)
+
+
+if __name__ == "__main__":
+    count = precompile()
+    print(f"Compiled {count} templates into {settings.TEMPLATE_CACHE_DIR or 'memory only'}.")
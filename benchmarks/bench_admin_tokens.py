@@ -0,0 +1,82 @@
+"""
+Benchmark admin session checks: jwt.decode on every request (the old
+behaviour) vs. the verified-token cache, for one admin clicking through
+the newsletter editor.
+
+Calls get_current_admin directly with the session cookie, then runs the
+same number of authenticated requests through the app to show the
+decodes and revocation lookups per request left.
+
+Run with:
+    python -m benchmarks.bench_admin_tokens
+"""
+
+import os
+import tempfile
+import time
+
+_tmp = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/tokens.db"
+os.environ.setdefault("OUTBOX_ENABLED", "false")
+os.environ.setdefault("SCHEDULER_ENABLED", "false")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+
+from app.bootstrap import bootstrap  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.main import app  # noqa: E402
+from app.services import auth  # noqa: E402
+
+CHECKS = 20000
+REQUESTS = 200
+
+
+def _request(token: str) -> Request:
+    cookie = f"access_token={token}".encode()
+    return Request({"type": "http", "headers": [(b"cookie", cookie)]})
+
+
+def check_cost(label: str, token: str, check) -> None:
+    request = _request(token)
+    start = time.perf_counter()
+    for _ in range(CHECKS):
+        check(request)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<16} {elapsed / CHECKS * 1e6:6.1f} us per check")
+
+
+def main() -> None:
+    bootstrap()
+    token = auth.create_access_token({"sub": settings.ADMIN_USERNAME})
+    print(f"get_current_admin, {CHECKS:,} checks of one session:")
+
+    check_cost(
+        "jwt.decode", token, lambda r: auth.decode_access_token(r.cookies["access_token"])
+    )
+    check_cost("verified cache", token, auth.get_current_admin)
+
+    with TestClient(app) as client:
+        client.post(
+            "/auth/login",
+            data={"username": settings.ADMIN_USERNAME, "password": "admin123"},
+            follow_redirects=False,
+        )
+        session = client.cookies["access_token"]
+        before = auth.admin_tokens.stats()
+        for _ in range(REQUESTS):
+            client.get("/admin/metrics").raise_for_status()
+        after = auth.admin_tokens.stats()
+        client.get("/auth/logout", follow_redirects=False)
+        client.cookies.set("access_token", session)
+        replayed = client.get("/admin/metrics", follow_redirects=False).status_code
+    print(
+        f"  {REQUESTS} admin requests after login: {after['decodes'] - before['decodes']} decode(s), "
+        f"{after['hits'] - before['hits']} cache hits, "
+        f"{after['revocation_checks'] - before['revocation_checks']} revocation lookup(s); "
+        f"session cookie replayed after logout: {replayed}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Benchmark chat prompt caching against the fake Anthropic client: the
+system prompt as one uncached string (the old layout) vs. the cacheable
+blocks built by build_system_prompt.
+
+SUBSCRIBERS parents, spread across the 17 weeks, each hold a
+MESSAGES-turn conversation, with turns interleaved as they would be in
+production. The harness checks that the rules block is byte-identical
+across subscribers and that a parent's follow-up reads the whole system
+prompt from the cache, then reports input tokens by kind, the relative
+input cost and a modelled time to first token.
+
+Run with:
+    python -m benchmarks.bench_chat_prompt_cache
+"""
+
+import asyncio
+import random
+import statistics
+
+from app.seed.seed_milestones import load
+from app.services import ai_chat
+from tests.fake_anthropic import FakeAnthropic
+
+SUBSCRIBERS = 60
+MESSAGES = 4
+TRACKED_PER_SUBSCRIBER = 25
+# Relative price of input tokens: written to / read from the cache
+CACHE_WRITE_PRICE = 1.25
+CACHE_READ_PRICE = 0.1
+# Modelled time to first token
+BASE_LATENCY = 0.25
+SECONDS_PER_UNCACHED_TOKEN = 0.0002
+
+
+def _prompts(rng: random.Random) -> list[tuple[dict, ...]]:
+    milestones = load()
+    prompts = []
+    for i in range(SUBSCRIBERS):
+        week = i % 17
+        tracked = rng.sample(
+            [m for m in milestones if m["week_number"] <= week] or milestones,
+            k=min(TRACKED_PER_SUBSCRIBER, week * 6 + 1),
+        )
+        history = [
+            {
+                "week": m["week_number"],
+                "category": m["category"],
+                "title": m["title"],
+                "status": rng.choice(["achieved", "concern", None]),
+                "notes": rng.choice([None, "She did this twice today while we were at the park."]),
+            }
+            for m in sorted(tracked, key=lambda m: (m["week_number"], m["category"]))
+        ]
+        prompts.append(
+            ai_chat.build_system_prompt(
+                baby_name=f"Baby {i}",
+                baby_age_weeks=week,
+                milestones=[m for m in milestones if m["week_number"] == week],
+                tracking_history=history,
+            )
+        )
+    return prompts
+
+
+def _as_one_string(blocks: tuple[dict, ...]) -> tuple[dict, ...]:
+    return ({"type": "text", "text": "\n\n".join(b["text"] for b in blocks)},)
+
+
+async def _converse(client: FakeAnthropic, prompts: list[tuple[dict, ...]]) -> None:
+    ai_chat.client = client
+    conversations = [[] for _ in prompts]
+    for turn in range(MESSAGES):
+        for system, messages in zip(prompts, conversations):
+            messages.append({"role": "user", "content": f"Question {turn} about sleep and feeding?"})
+            reply = "".join([chunk async for chunk in ai_chat.stream_chat_response(messages, system)])
+            messages.append({"role": "assistant", "content": reply})
+
+
+def _check(client: FakeAnthropic, prompts: list[tuple[dict, ...]]) -> None:
+    assert len({p[0]["text"] for p in prompts}) == 1, "rules block differs between subscribers"
+    follow_up = client.requests[len(prompts)]["usage"]  # subscriber 0's second message
+    system_tokens = client.requests[0]["usage"]
+    assert follow_up.cache_creation_input_tokens == 0
+    assert follow_up.cache_read_input_tokens == (
+        system_tokens.cache_read_input_tokens + system_tokens.cache_creation_input_tokens
+    ), "follow-up did not read the whole system prompt from the cache"
+
+
+def _report(label: str, client: FakeAnthropic) -> None:
+    totals = client.totals()
+    cost = (
+        totals["input_tokens"]
+        + totals["cache_creation_input_tokens"] * CACHE_WRITE_PRICE
+        + totals["cache_read_input_tokens"] * CACHE_READ_PRICE
+    )
+    ttft = sorted(
+        BASE_LATENCY
+        + (r["usage"].input_tokens + r["usage"].cache_creation_input_tokens) * SECONDS_PER_UNCACHED_TOKEN
+        for r in client.requests
+    )
+    print(
+        f"  {label:<16}: {totals['input_tokens']:>8,} uncached"
+        f"  {totals['cache_creation_input_tokens']:>8,} written"
+        f"  {totals['cache_read_input_tokens']:>8,} read"
+        f"  | input cost {cost:>9,.0f}"
+        f"  | TTFT p50 {statistics.median(ttft) * 1000:>4.0f} ms"
+        f"  p95 {ttft[int(len(ttft) * 0.95)] * 1000:>4.0f} ms"
+    )
+    return cost
+
+
+def main() -> None:
+    prompts = _prompts(random.Random(7))
+    sizes = [[len(b["text"]) // 4 for b in p] for p in prompts]
+    print(
+        f"{SUBSCRIBERS} subscribers x {MESSAGES} messages; system prompt ~tokens: "
+        f"rules {sizes[0][0]}, week {statistics.mean(s[1] for s in sizes):.0f}, "
+        f"personal {statistics.mean(s[-1] for s in sizes):.0f} (means)"
+    )
+
+    async def run():
+        plain, blocks = FakeAnthropic(), FakeAnthropic()
+        await _converse(plain, [_as_one_string(p) for p in prompts])
+        await _converse(blocks, prompts)
+        return plain, blocks
+
+    plain, blocks = asyncio.run(run())
+    _check(blocks, prompts)
+    before = _report("one string", plain)
+    after = _report("cached blocks", blocks)
+    print(f"  Input cost      : {after / before:.0%} of the uncached layout")
+
+
+if __name__ == "__main__":
+    main()
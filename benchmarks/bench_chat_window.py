@@ -0,0 +1,124 @@
+"""
+Benchmark chat payloads over a long conversation: the browser's full
+transcript sent on every turn (the old behaviour) vs. the server-side
+window plus running summary.
+
+Runs the chat route in-process on a throwaway SQLite database with the
+fake Anthropic client, whose time to first token grows with uncached
+input, and prints payload size, input tokens and time to first token
+every few turns.
+
+Run with:
+    python -m benchmarks.bench_chat_window
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+
+_tmp = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/chat.db"
+os.environ.setdefault("OUTBOX_ENABLED", "false")
+os.environ.setdefault("SCHEDULER_ENABLED", "false")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.bootstrap import bootstrap  # noqa: E402
+from app.database import AsyncSessionLocal, SessionLocal, async_engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Subscriber  # noqa: E402
+from app.services import ai_chat  # noqa: E402
+from app.services.chat_prompt import prompt_cache  # noqa: E402
+from app.services.subscriber_cache import subscriber_cache  # noqa: E402
+from tests.fake_anthropic import FakeAnthropic  # noqa: E402
+
+TURNS = 40
+REPORT_EVERY = 5
+WEEK = 4
+QUESTION = "Is it normal that she only naps for 30 minutes at a time, and should I try to extend it?"
+REPLY = (
+    "Short naps are very common at this age because sleep cycles are still maturing. "
+    "Try a consistent pre-nap routine and a darker room. " * 4
+)
+
+
+def _client() -> FakeAnthropic:
+    return FakeAnthropic(reply=REPLY, seconds_per_uncached_token=0.0002)
+
+
+def _setup() -> tuple[int, str]:
+    bootstrap()
+    with SessionLocal() as db:
+        subscriber = Subscriber(
+            email="window@example.com",
+            baby_name="Ava",
+            baby_birth_date=date.today() - timedelta(weeks=WEEK),
+        )
+        db.add(subscriber)
+        db.commit()
+        return subscriber.id, subscriber.unsubscribe_token
+
+
+def full_transcript(token: str) -> list[dict]:
+    """Every turn sends the whole conversation, as the browser used to."""
+    ai_chat.client = client = _client()
+    results = []
+
+    async def run():
+        async with AsyncSessionLocal() as db:
+            subscriber = await subscriber_cache.get(db, token)
+            system = await prompt_cache.get(db, subscriber, WEEK, WEEK)
+        messages = []
+        for _ in range(TURNS):
+            messages.append({"role": "user", "content": QUESTION})
+            payload = len(json.dumps({"system": system, "messages": messages}).encode())
+            start = time.perf_counter()
+            first = None
+            reply = []
+            async for chunk in ai_chat.stream_chat_response(messages, system):
+                first = first or time.perf_counter() - start
+                reply.append(chunk)
+            messages.append({"role": "assistant", "content": "".join(reply)})
+            usage = client.requests[-1]["usage"]
+            results.append(
+                {"payload_bytes": payload, "input_tokens": usage.input_tokens, "first_token_ms": first * 1000}
+            )
+        await async_engine.dispose()
+
+    asyncio.run(run())
+    return results
+
+
+def windowed(token: str) -> list[dict]:
+    ai_chat.client = _client()
+    results = []
+    with TestClient(app) as http:
+        for _ in range(TURNS):
+            response = http.post(f"/my-updates/{token}/chat", json={"message": QUESTION, "week": WEEK})
+            done = json.loads(response.text.strip().split("\n")[-1][len("data: "):])
+            results.append(done["turn"])
+    return results
+
+
+def main() -> None:
+    _, token = _setup()
+    before = full_transcript(token)
+    after = windowed(token)
+    print(f"{TURNS}-turn conversation, week {WEEK}:")
+    print(f"  {'turn':>4}  {'full transcript':>32}  {'window + summary':>32}")
+    for i in range(REPORT_EVERY - 1, TURNS, REPORT_EVERY):
+        b, a = before[i], after[i]
+        print(
+            f"  {i + 1:>4}  {b['payload_bytes']:>8,} B {b['input_tokens']:>6,} tok {b['first_token_ms']:>5.0f} ms"
+            f"  {a['payload_bytes']:>8,} B {a['input_tokens']:>6,} tok {a['first_token_ms']:>5.0f} ms"
+        )
+    total_before = sum(r["input_tokens"] for r in before)
+    total_after = sum(r["input_tokens"] for r in after)
+    print(f"  Input tokens over the conversation: {total_before:,} -> {total_after:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark newsletter email rendering: full Jinja render per recipient vs.
+a cached skeleton with per-recipient slot substitution.
+
+Run with:
+    python -m benchmarks.bench_email_render
+"""
+
+import time
+from types import SimpleNamespace
+
+from starlette.requests import Request
+
+from app.seed.seed_milestones import MILESTONES
+from app.services.newsletter_render import recipient_fields, render_cache, templates
+
+RECIPIENTS = 2000
+
+
+def _fixture(week: int = 4):
+    sections = [
+        SimpleNamespace(
+            id=i,
+            section_type="custom",
+            title=f"Section {i}",
+            body="A paragraph of advice for this week.\n" * 6,
+            sort_order=i * 10,
+            is_paid_only=i == 3,
+        )
+        for i in range(5)
+    ]
+    newsletter = SimpleNamespace(
+        id=1, subject_line="Your week 4 update", week_number=week, sections=sections
+    )
+    milestones = sorted(
+        (
+            SimpleNamespace(id=i, **m)
+            for i, m in enumerate(MILESTONES)
+            if m["week_number"] == week
+        ),
+        key=lambda m: m.category,
+    )
+    return newsletter, milestones
+
+
+def bench_template_response(newsletter, milestones) -> float:
+    request = Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+    start = time.perf_counter()
+    for i in range(RECIPIENTS):
+        templates.TemplateResponse(
+            "email/newsletter.html",
+            {
+                "request": request,
+                "newsletter": newsletter,
+                "sections": newsletter.sections,
+                "milestones": milestones,
+                "subscriber_name": f"Parent {i}",
+                "baby_name": "Ava",
+                "baby_age_weeks": newsletter.week_number,
+                "unsubscribe_url": f"https://example.com/unsubscribe/{i:032x}",
+                "is_preview": False,
+            },
+        ).body.decode()
+    return RECIPIENTS / (time.perf_counter() - start)
+
+
+def bench_skeleton(newsletter, milestones) -> float:
+    render_cache.invalidate()
+    start = time.perf_counter()
+    for i in range(RECIPIENTS):
+        render_cache.get(newsletter, milestones, "paid").fill(
+            recipient_fields(
+                f"Parent {i}", "Ava", f"https://example.com/unsubscribe/{i:032x}"
+            )
+        )
+    return RECIPIENTS / (time.perf_counter() - start)
+
+
+def main():
+    newsletter, milestones = _fixture()
+    print(f"{len(milestones)} milestones, {len(newsletter.sections)} sections, {RECIPIENTS} recipients")
+    before = bench_template_response(newsletter, milestones)
+    after = bench_skeleton(newsletter, milestones)
+    print(f"  TemplateResponse per recipient : {before:>10,.0f} renders/s")
+    print(f"  Cached skeleton + slot fill    : {after:>10,.0f} renders/s")
+    print(f"  Speedup                        : {after / before:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
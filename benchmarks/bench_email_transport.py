@@ -0,0 +1,93 @@
+"""
+Benchmark email transport throughput against the local fake SMTP and
+Resend servers, comparing a fresh connection per message with the pooled /
+reused connection transports.
+
+Run with:
+    python -m benchmarks.bench_email_transport
+"""
+
+import asyncio
+import smtplib
+import time
+from email.message import EmailMessage
+
+import httpx
+
+from app.services.email_transport import ResendTransport, SMTPTransport
+from tests.fake_mail import FakeResendServer, FakeSMTPServer
+
+MESSAGES = 500
+HTML = "<html><body>" + "<p>Week 4 milestones and tips.</p>" * 300 + "</body></html>"
+
+
+def _messages(n: int = MESSAGES) -> list[dict]:
+    return [
+        {"from": "hello@example.com", "to": f"parent{i}@example.com", "subject": "Week 4", "html": HTML}
+        for i in range(n)
+    ]
+
+
+def _report(label: str, elapsed: float, server) -> None:
+    print(
+        f"  {label:<34}: {MESSAGES / elapsed:>8,.0f} msg/s"
+        f"  ({server.connections} connections, {server.requests} requests)"
+    )
+
+
+async def bench_smtp() -> None:
+    async with FakeSMTPServer() as server:
+        def one_connection_per_message():
+            for m in _messages():
+                msg = EmailMessage()
+                msg["From"], msg["To"], msg["Subject"] = m["from"], m["to"], m["subject"]
+                msg.set_content(m["html"], subtype="html")
+                with smtplib.SMTP(server.host, server.port) as conn:
+                    conn.send_message(msg)
+
+        start = time.perf_counter()
+        await asyncio.to_thread(one_connection_per_message)
+        _report("SMTP, connection per message", time.perf_counter() - start, server)
+
+    async with FakeSMTPServer() as server:
+        transport = SMTPTransport(server.host, server.port)
+        start = time.perf_counter()
+        await asyncio.gather(*(transport.send(m) for m in _messages()))
+        elapsed = time.perf_counter() - start
+        await transport.close()
+        _report("SMTPTransport (reused connection)", elapsed, server)
+
+
+async def bench_resend() -> None:
+    async with FakeResendServer() as server:
+        start = time.perf_counter()
+        for m in _messages():
+            async with httpx.AsyncClient(base_url=server.url) as client:
+                (await client.post("/emails", json=m)).raise_for_status()
+        _report("HTTP, client per message", time.perf_counter() - start, server)
+
+    async with FakeResendServer() as server:
+        transport = ResendTransport("test", base_url=server.url)
+        start = time.perf_counter()
+        await asyncio.gather(*(transport.send(m) for m in _messages()))
+        elapsed = time.perf_counter() - start
+        await transport.close()
+        _report("ResendTransport.send (pooled)", elapsed, server)
+
+    async with FakeResendServer() as server:
+        transport = ResendTransport("test", base_url=server.url)
+        start = time.perf_counter()
+        await transport.send_batch(_messages())
+        elapsed = time.perf_counter() - start
+        await transport.close()
+        _report("ResendTransport.send_batch", elapsed, server)
+
+
+async def main():
+    print(f"{MESSAGES} messages of {len(HTML) // 1024} KB each")
+    await bench_smtp()
+    await bench_resend()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,91 @@
+"""
+Benchmark building the milestone toggle response: two TemplateResponses
+decoded back to text plus a str.replace to mark the progress bar
+out-of-band (the old way) vs. render_fragment with oob=.
+
+Both build the same HTML from the same context; only the rendering
+differs.
+
+Run with:
+    python -m benchmarks.bench_fragments
+"""
+
+import time
+
+from fastapi.responses import HTMLResponse
+from starlette.requests import Request
+
+from app.seed.seed_milestones import MILESTONES
+from app.templating import precompile, render_fragment, templates
+
+ITERATIONS = 5000
+WEEK = 4
+
+
+class _Milestone:
+    def __init__(self, id: int, fields: dict):
+        self.id = id
+        self.__dict__.update(fields)
+
+
+class _Track:
+    status = "achieved"
+    notes = "She did it today!"
+    ai_status = "ready"
+    ai_response = "How wonderful, what a lovely moment!"
+
+
+def _contexts() -> tuple[dict, dict]:
+    fields = next(m for m in MILESTONES if m["week_number"] == WEEK)
+    milestone = _Milestone(1, fields)
+    card = {"m": milestone, "token": "t" * 32, "tracking": {1: _Track()}, "show_feedback": True}
+    progress = {
+        "week": WEEK,
+        "achieved_count": 3,
+        "concern_count": 1,
+        "untracked_count": 5,
+        "total_count": 9,
+        "baby_name": "Ava",
+    }
+    return card, progress
+
+
+def template_responses(request: Request, card: dict, progress: dict) -> HTMLResponse:
+    card_html = templates.TemplateResponse(
+        "public/partials/milestone_card.html", {"request": request, **card}
+    ).body.decode()
+    progress_html = templates.TemplateResponse(
+        "public/partials/milestone_progress.html", {"request": request, **progress}
+    ).body.decode()
+    oob_progress = progress_html.replace(
+        'id="milestone-progress"', 'id="milestone-progress" hx-swap-oob="outerHTML"', 1
+    )
+    return HTMLResponse(card_html + oob_progress)
+
+
+def fragments(request: Request, card: dict, progress: dict) -> HTMLResponse:
+    return HTMLResponse(
+        render_fragment("public/partials/milestone_card.html", card)
+        + render_fragment("public/partials/milestone_progress.html", progress, oob="outerHTML")
+    )
+
+
+def main() -> None:
+    precompile()
+    request = Request({"type": "http", "headers": []})
+    card, progress = _contexts()
+    old = template_responses(request, card, progress).body
+    new = fragments(request, card, progress).body
+    assert old == new, "the two ways must build the same response"
+
+    print(f"Milestone toggle response ({len(new):,} bytes), {ITERATIONS:,} renders:")
+    for label, build in [("TemplateResponse + replace", template_responses), ("render_fragment", fragments)]:
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            build(request, card, progress)
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<28} {elapsed / ITERATIONS * 1e6:7.1f} us per response")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Benchmark time to first byte on the my-updates page: rendered in full
+before sending (the old behaviour) vs. streamed as its queries finish.
+
+Starts the app under uvicorn on a throwaway SQLite database and adds
+QUERY_LATENCY to each of the page's queries, as a database across the
+network would. Prints time to first byte and to the last byte.
+
+Run with:
+    python -m benchmarks.bench_my_updates_stream
+"""
+
+import asyncio
+import os
+import socket
+import statistics
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+_tmp = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/page.db"
+os.environ.setdefault("OUTBOX_ENABLED", "false")
+os.environ.setdefault("SCHEDULER_ENABLED", "false")
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+
+import app.routes.public as public_routes  # noqa: E402
+from app.bootstrap import bootstrap  # noqa: E402
+from app.database import AsyncSessionLocal, SessionLocal  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Subscriber  # noqa: E402
+from app.templating import stream_page  # noqa: E402
+
+REQUESTS = 30
+QUERY_LATENCY = 0.03
+WEEK = 4
+
+
+class SlowSession:
+    """An AsyncSession whose queries take QUERY_LATENCY longer."""
+
+    def __init__(self):
+        self._session = AsyncSessionLocal()
+
+    async def __aenter__(self):
+        await self._session.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc):
+        return await self._session.__aexit__(*exc)
+
+    async def scalar(self, *args, **kwargs):
+        await asyncio.sleep(QUERY_LATENCY)
+        return await self._session.scalar(*args, **kwargs)
+
+    async def scalars(self, *args, **kwargs):
+        await asyncio.sleep(QUERY_LATENCY)
+        return await self._session.scalars(*args, **kwargs)
+
+
+async def buffered_page(name, context, loaders):
+    """Render everything, then send it in one piece."""
+    yield "".join([chunk async for chunk in stream_page(name, context, loaders)])
+
+
+def _setup() -> str:
+    bootstrap()
+    with SessionLocal() as db:
+        subscriber = Subscriber(
+            email="stream@example.com",
+            baby_name="Ava",
+            baby_birth_date=date.today() - timedelta(weeks=WEEK),
+        )
+        db.add(subscriber)
+        db.commit()
+        return subscriber.unsubscribe_token
+
+
+def _start_server() -> tuple[uvicorn.Server, str]:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, f"http://127.0.0.1:{port}"
+
+
+async def run(base_url: str, token: str, label: str) -> None:
+    first_byte, last_byte = [], []
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        await client.get(f"/my-updates/{token}")  # warm the subscriber cache
+        for _ in range(REQUESTS):
+            start = time.perf_counter()
+            async with client.stream("GET", f"/my-updates/{token}") as r:
+                first = None
+                size = 0
+                async for chunk in r.aiter_raw():
+                    first = first or time.perf_counter() - start
+                    size += len(chunk)
+            first_byte.append(first)
+            last_byte.append(time.perf_counter() - start)
+    print(
+        f"  {label:<10} first byte p50 {statistics.median(first_byte) * 1000:6.1f} ms   "
+        f"last byte p50 {statistics.median(last_byte) * 1000:6.1f} ms   ({size:,} bytes)"
+    )
+
+
+def main():
+    token = _setup()
+    public_routes.AsyncSessionLocal = SlowSession
+    server, base_url = _start_server()
+    try:
+        print(f"my-updates page, {REQUESTS} requests, +{QUERY_LATENCY * 1000:.0f} ms per query:")
+        public_routes.stream_page = buffered_page
+        asyncio.run(run(base_url, token, "buffered"))
+        public_routes.stream_page = stream_page
+        asyncio.run(run(base_url, token, "streamed"))
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
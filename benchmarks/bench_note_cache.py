@@ -0,0 +1,101 @@
+"""
+Benchmark the note reply cache on a stream of notes from many families.
+
+Parents pick from a handful of phrasings per milestone, with their own
+baby's name, capitalisation and punctuation, at one of a few baby ages.
+Each note is answered the way NoteResponder does it, against the fake
+Anthropic client with a fixed model latency, with the cache off,
+exact-match only, and with the trigram similarity fallback. Prints model calls, hit rate and mean time
+to a reply.
+
+Run with:
+    python -m benchmarks.bench_note_cache
+"""
+
+import asyncio
+import random
+import time
+
+from app.services import ai_chat
+from app.services.note_cache import NoteReplyCache
+from tests.fake_anthropic import FakeAnthropic
+
+NOTES = 2000
+MILESTONES = 10
+MODEL_LATENCY = 0.05
+SIMILARITY = 0.8
+AGES = [7, 8, 9]
+NAMES = ["Ava", "Noah", "Mia", "Leo", "Zara", "Finn", None]
+PHRASINGS = [
+    "{name} did it today!",
+    "{name} did it today",
+    "She did it today!!",
+    "He did it today!",
+    "{name} did it for the first time today!",
+    "Not yet, should I be worried?",
+    "not yet - should I be worried",
+    "Only on one side so far",
+    "{name} does this all the time now",
+    "We saw it at bath time, so proud of {name}",
+]
+
+
+def _notes() -> list[tuple[int, int, str, str | None]]:
+    rng = random.Random(7)
+    notes = []
+    for _ in range(NOTES):
+        name = rng.choice(NAMES)
+        text = rng.choice(PHRASINGS).format(name=name or "the baby")
+        if rng.random() < 0.3:
+            text = text.lower()
+        notes.append((rng.randrange(MILESTONES), rng.choice(AGES), text, name))
+    return notes
+
+
+async def answer(
+    cache: NoteReplyCache | None, milestone_id: int, age: int, note: str, name: str | None
+) -> str:
+    reply = cache.get(milestone_id, "done", age, note, name) if cache else None
+    if reply is None:
+        reply = await ai_chat.generate_milestone_response(
+            baby_name=name,
+            baby_age_weeks=age,
+            milestone_title=f"Milestone {milestone_id}",
+            milestone_description="A milestone",
+            parent_note=note,
+            status="done",
+        )
+        if cache:
+            cache.put(milestone_id, "done", age, note, name, reply)
+    return reply
+
+
+def run(label: str, cache: NoteReplyCache | None) -> None:
+    ai_chat.client = client = FakeAnthropic(
+        reply="How wonderful, what a lovely moment to see!", base_latency=MODEL_LATENCY
+    )
+    notes = _notes()
+
+    async def go():
+        start = time.perf_counter()
+        for milestone_id, age, note, name in notes:
+            await answer(cache, milestone_id, age, note, name)
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(go())
+    hit_rate = cache.stats()["hit_rate"] if cache else 0
+    print(
+        f"  {label:<22} {len(client.requests):>5} model calls  hit rate {hit_rate:>6.1%}  "
+        f"mean reply {elapsed / len(notes) * 1000:>5.1f} ms"
+    )
+
+
+def main() -> None:
+    print(f"{NOTES} notes over {MILESTONES} milestones, {MODEL_LATENCY * 1000:.0f} ms per model call:")
+    run("no cache", None)
+    run("exact match", NoteReplyCache(5000, 3600))
+    run(f"similarity >= {SIMILARITY}", NoteReplyCache(5000, 3600, SIMILARITY))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark loading the seed data: the JSON Lines files in app/seed/data/
+vs. the same records as Python literals in a module (how the seed modules
+used to ship them).
+
+Each measurement runs in a fresh interpreter, reporting wall time and the
+RSS growth for importing the module and for materialising the records.
+The literal module is written to a temp dir and measured both on its
+first import (compiling to .pyc) and from the cached .pyc.
+
+Run with:
+    python -m benchmarks.bench_seed_load
+"""
+
+import json
+import pprint
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from app.seed.data import DATA_DIR, read_records
+
+DATASETS = {"milestones": "MILESTONES", "local_resources": "RESOURCES"}
+RUNS = 5
+
+# Runs in the child interpreter; prints {"import_ms", "load_ms", "import_kb", "load_kb"}
+PROBE = """
+import json, os, sys, time
+
+def rss_kb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+
+sys.path.insert(0, {path!r})
+import app.config, app.database, app.models  # shared cost, not measured
+rss0, t0 = rss_kb(), time.perf_counter()
+import {module} as seed
+t1, rss1 = time.perf_counter(), rss_kb()
+records = [r for name in {names!r} for r in getattr(seed, name)]
+t2, rss2 = time.perf_counter(), rss_kb()
+print(json.dumps({{
+    "import_ms": (t1 - t0) * 1000, "load_ms": (t2 - t1) * 1000,
+    "import_kb": rss1 - rss0, "load_kb": rss2 - rss1, "records": len(records),
+}}))
+"""
+
+
+def _write_literal_module(directory: Path) -> str:
+    # Same imports as the seed modules, so only the data handling differs
+    lines = [
+        '"""Seed records as Python literals."""',
+        "from app.database import SessionLocal",
+        "from app.seed.sync import SeedReport, sync_records",
+        "",
+    ]
+    for dataset, name in DATASETS.items():
+        lines.append(f"{name} = {pprint.pformat(read_records(dataset), width=100, sort_dicts=False)}")
+        lines.append("")
+    (directory / "literal_seed.py").write_text("\n".join(lines))
+    return "literal_seed"
+
+
+def _write_lazy_module(directory: Path) -> str:
+    # Both datasets behind one module, so the two variants load the same records
+    (directory / "lazy_seed.py").write_text(
+        "from app.seed import seed_local_resources, seed_milestones\n"
+        "def __getattr__(name):\n"
+        "    module = seed_milestones if name == 'MILESTONES' else seed_local_resources\n"
+        "    return getattr(module, name)\n"
+    )
+    return "lazy_seed"
+
+
+def _probe(directory: Path, module: str, no_bytecode: bool = False) -> dict:
+    code = PROBE.format(path=str(directory), module=module, names=tuple(DATASETS.values()))
+    cmd = [sys.executable] + (["-B"] if no_bytecode else []) + ["-c", code]
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True, cwd=Path.cwd())
+    return json.loads(out.stdout)
+
+
+def _median(results: list[dict], key: str) -> float:
+    values = sorted(r[key] for r in results)
+    return values[len(values) // 2]
+
+
+def _report(label: str, results: list[dict]) -> None:
+    print(
+        f"  {label:<30}: import {_median(results, 'import_ms'):>7.2f} ms"
+        f" / {_median(results, 'import_kb'):>6,.0f} KB RSS,"
+        f" records {_median(results, 'load_ms'):>6.2f} ms"
+        f" / {_median(results, 'load_kb'):>6,.0f} KB RSS"
+        f"  ({results[0]['records']} records)"
+    )
+
+
+def main() -> None:
+    data_bytes = sum(p.stat().st_size for p in DATA_DIR.glob("*.jsonl"))
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        literal = _write_literal_module(directory)
+        lazy = _write_lazy_module(directory)
+        literal_bytes = (directory / f"{literal}.py").stat().st_size
+        print(f"Seed data: {literal_bytes:,} B as Python source, {data_bytes:,} B as JSON Lines")
+        print(f"Median of {RUNS} fresh interpreters:")
+
+        _report("literals, compiled on import", [_probe(directory, literal, no_bytecode=True) for _ in range(RUNS)])
+        _probe(directory, literal)  # write the .pyc
+        _report("literals, cached .pyc", [_probe(directory, literal) for _ in range(RUNS)])
+        _report("JSON Lines, lazy + mmap", [_probe(directory, lazy) for _ in range(RUNS)])
+
+
+if __name__ == "__main__":
+    main()
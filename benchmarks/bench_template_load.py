@@ -0,0 +1,60 @@
+"""
+Benchmark what the first request for each template pays to load it.
+
+For every template, times get_template in a fresh environment:
+
+  - compile: parse and compile from source, as each router's own
+    Jinja2Templates did in every worker
+  - bytecode cache: load the code `python -m app.templating` compiled at
+    deploy from the filesystem bytecode cache
+  - precompiled: already loaded by the worker at startup, so a dict lookup
+
+Run with:
+    python -m benchmarks.bench_template_load
+"""
+
+import tempfile
+import time
+
+from app.templating import create_environment
+
+
+def load_times(env) -> dict[str, float]:
+    times = {}
+    for name in env.list_templates(extensions=["html"]):
+        start = time.perf_counter()
+        env.get_template(name)
+        times[name] = time.perf_counter() - start
+    return times
+
+
+def main() -> None:
+    cache_dir = tempfile.mkdtemp()
+    compiled = load_times(create_environment(None))
+    load_times(create_environment(cache_dir))  # fill the bytecode cache, as at deploy
+    cached = load_times(create_environment(cache_dir))
+    warm = create_environment(cache_dir)
+    load_times(warm)
+    precompiled = load_times(warm)
+
+    print(f"First load per template ({len(compiled)} templates), ms:")
+    print(f"  {'template':<42} {'compile':>8} {'bytecode':>9} {'precompiled':>12}")
+    for name in sorted(compiled, key=compiled.get, reverse=True):
+        print(
+            f"  {name:<42} {compiled[name] * 1000:>8.2f} {cached[name] * 1000:>9.2f} "
+            f"{precompiled[name] * 1000:>12.4f}"
+        )
+    total_compile, total_cached = sum(compiled.values()), sum(cached.values())
+    print(
+        f"  {'total':<42} {total_compile * 1000:>8.1f} {total_cached * 1000:>9.1f} "
+        f"{sum(precompiled.values()) * 1000:>12.3f}"
+    )
+    print(
+        f"Per worker: {total_compile * 1000:.0f} ms of compiling spread over first requests "
+        f"(repeated for templates, like base.html, loaded by more than one router's "
+        f"environment) -> {total_cached * 1000:.0f} ms at startup, none on requests."
+    )
+
+
+if __name__ == "__main__":
+    main()
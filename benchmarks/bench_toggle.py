@@ -0,0 +1,161 @@
+"""
+Benchmark milestone toggles: progress counting on its own, and end-to-end
+toggle latency with many subscribers clicking at once.
+
+Every subscriber's baby is WEEK weeks old and has tracked each milestone
+up to that week, most with a note and an AI reply, as an engaged parent
+would have by then.
+
+Runs against a throwaway SQLite database:
+    python -m benchmarks.bench_toggle
+"""
+
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+
+_tmp = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/bench.db"
+os.environ.setdefault("OUTBOX_ENABLED", "false")
+os.environ.setdefault("SCHEDULER_ENABLED", "false")
+
+import httpx  # noqa: E402
+from sqlalchemy import insert, select  # noqa: E402
+
+from app.bootstrap import bootstrap  # noqa: E402
+from app.main import app  # noqa: E402
+from app.database import AsyncSessionLocal, SessionLocal, async_engine  # noqa: E402
+from app.models import MilestoneTracking, Subscriber  # noqa: E402
+from app.services.milestone_catalog import milestone_catalog  # noqa: E402
+from app.services.progress import week_progress  # noqa: E402
+
+SUBSCRIBERS = 2000
+CONCURRENT_SUBSCRIBERS = 50
+CLICKS_PER_SUBSCRIBER = 20
+WEEK = 4
+NOTE = "She held her head up for a few seconds during tummy time today. " * 3
+REPLY = "That is a wonderful milestone to see! " * 20
+STATUSES = ("achieved", "achieved", "concern", None)
+
+
+def _setup() -> list[str]:
+    bootstrap()
+    db = SessionLocal()
+    subscribers = [
+        Subscriber(
+            email=f"bench{i}@example.com",
+            baby_name="Ava",
+            baby_birth_date=date.today() - timedelta(weeks=WEEK),
+        )
+        for i in range(SUBSCRIBERS)
+    ]
+    db.add_all(subscribers)
+    db.commit()
+    milestone_ids = [m.id for week in range(WEEK + 1) for m in milestone_catalog.for_week(week)]
+    db.execute(
+        insert(MilestoneTracking),
+        [
+            {
+                "subscriber_id": s.id,
+                "milestone_id": milestone_id,
+                "status": STATUSES[(s.id + milestone_id) % len(STATUSES)],
+                "notes": NOTE if milestone_id % 3 else None,
+                "ai_response": REPLY if milestone_id % 3 else None,
+                "ai_status": "ready" if milestone_id % 3 else None,
+            }
+            for s in subscribers
+            for milestone_id in milestone_ids
+        ],
+    )
+    db.commit()
+    tokens = [s.unsubscribe_token for s in subscribers]
+    db.close()
+    return tokens
+
+
+async def _legacy_progress(db, subscriber_id: int, week: int) -> tuple[int, int, int]:
+    """The old approach: load every tracking row for the week and count in Python."""
+    ids = [m.id for m in milestone_catalog.for_week(week)]
+    rows = (
+        await db.scalars(
+            select(MilestoneTracking).where(
+                MilestoneTracking.subscriber_id == subscriber_id,
+                MilestoneTracking.milestone_id.in_(ids),
+            )
+        )
+    ).all()
+    achieved = sum(1 for t in rows if t.status == "achieved")
+    concern = sum(1 for t in rows if t.status == "concern")
+    return len(ids), achieved, concern
+
+
+async def bench_counting(iterations: int = 2000, rounds: int = 5) -> None:
+    # Interleaved rounds over the same subscribers; the best round of each is
+    # reported, as this is a shared single-core box
+    variants = [
+        ("load rows + count in Python", _legacy_progress),
+        ("statuses only (week_progress)", week_progress),
+    ]
+    best = {label: float("inf") for label, _ in variants}
+    for _ in range(rounds):
+        for label, progress in variants:
+            async with AsyncSessionLocal() as db:
+                start = time.perf_counter()
+                for i in range(iterations):
+                    await progress(db, (i % SUBSCRIBERS) + 1, WEEK)
+                    db.expunge_all()
+                best[label] = min(best[label], time.perf_counter() - start)
+    for label, elapsed in best.items():
+        _report(label, elapsed, iterations)
+
+
+def _report(label: str, elapsed: float, iterations: int) -> None:
+    print(f"  {label:<31}: {elapsed / iterations * 1e6:>8.0f} µs/call")
+
+
+async def bench_toggles(tokens: list[str]) -> None:
+    milestone_ids = [m.id for m in milestone_catalog.for_week(WEEK)]
+    latencies: list[float] = []
+
+    async def clicker(client: httpx.AsyncClient, token: str) -> None:
+        for i in range(CLICKS_PER_SUBSCRIBER):
+            milestone_id = milestone_ids[i % len(milestone_ids)]
+            start = time.perf_counter()
+            r = await client.post(f"/my-updates/{token}/track/{milestone_id}")
+            latencies.append(time.perf_counter() - start)
+            r.raise_for_status()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(clicker(client, t) for t in tokens))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    pct = lambda p: latencies[int(p * (len(latencies) - 1))] * 1000
+    subscribers = f"{len(tokens)} concurrent subscriber{'s' if len(tokens) != 1 else ''}"
+    print(f"  {len(latencies)} toggles from {subscribers}: {len(latencies) / elapsed:,.0f} req/s")
+    print(
+        f"  latency p50 {pct(0.50):.1f} ms  p95 {pct(0.95):.1f} ms  "
+        f"p99 {pct(0.99):.1f} ms  mean {statistics.mean(latencies) * 1000:.1f} ms"
+    )
+
+
+async def run(tokens: list[str]) -> None:
+    print(f"Progress counting, {SUBSCRIBERS} subscribers tracking weeks 0-{WEEK}")
+    await bench_toggles(tokens[:1])  # warm up templates and catalog
+    await bench_counting()
+    print("Concurrent toggles")
+    await bench_toggles(tokens[:CONCURRENT_SUBSCRIBERS])
+    await async_engine.dispose()
+
+
+def main():
+    asyncio.run(run(_setup()))
+
+
+if __name__ == "__main__":
+    main()
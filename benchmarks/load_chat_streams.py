@@ -0,0 +1,266 @@
+"""
+Load test: do chat SSE streams keep flowing while other subscribers write?
+
+Starts the app under uvicorn on a throwaway SQLite database, replaces the
+model with a fake that emits a token every TOKEN_INTERVAL seconds, then
+opens CHAT_STREAMS chat streams while WRITERS clients hammer milestone
+toggles and calendar writes. A handler that blocks the event loop shows
+up as gaps between tokens far above TOKEN_INTERVAL.
+
+The load runs twice. The baseline writers hit copies of the write
+handlers as they were before the routes moved to AsyncSession: async def,
+with the sync Session blocking the loop on every query. The second run
+uses the app's own routes, which also render templates, so the
+comparison favours the baseline. The run fails unless the app's p99
+token gap stays under STALL_THRESHOLD with at most MAX_STALL_SHARE of
+gaps over it.
+
+Run with:
+    python -m benchmarks.load_chat_streams
+"""
+
+import asyncio
+import os
+import socket
+import statistics
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+from fastapi import APIRouter, Form
+from fastapi.responses import PlainTextResponse
+
+_tmp = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/load.db"
+os.environ.setdefault("OUTBOX_ENABLED", "false")
+os.environ.setdefault("SCHEDULER_ENABLED", "false")
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+
+import app.routes.public as public_routes  # noqa: E402
+from app.bootstrap import bootstrap  # noqa: E402
+from app.database import SessionLocal, pool_metrics  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import CalendarEvent, MilestoneTracking, Subscriber  # noqa: E402
+from app.services.milestone_catalog import milestone_catalog  # noqa: E402
+
+CHAT_STREAMS = 20
+TOKENS_PER_STREAM = 100
+TOKEN_INTERVAL = 0.02
+WRITERS = 8
+WEEK = 4
+STALL_THRESHOLD = 0.1
+MAX_STALL_SHARE = 0.01
+
+
+async def fake_stream_chat_response(messages, system_prompt, usage=None):
+    for _ in range(TOKENS_PER_STREAM):
+        await asyncio.sleep(TOKEN_INTERVAL)
+        yield "word "
+
+
+# The write handlers before the port to AsyncSession
+sync_routes = APIRouter(prefix="/sync-baseline")
+
+
+def _subscriber(db, token: str) -> Subscriber:
+    return db.query(Subscriber).filter(Subscriber.unsubscribe_token == token).one()
+
+
+@sync_routes.post("/{token}/track/{milestone_id}")
+async def sync_toggle(token: str, milestone_id: int):
+    with SessionLocal() as db:
+        subscriber = _subscriber(db, token)
+        track = (
+            db.query(MilestoneTracking)
+            .filter(
+                MilestoneTracking.subscriber_id == subscriber.id,
+                MilestoneTracking.milestone_id == milestone_id,
+            )
+            .first()
+        )
+        if track is None:
+            db.add(MilestoneTracking(subscriber_id=subscriber.id, milestone_id=milestone_id, status="achieved"))
+        else:
+            track.status = {"achieved": "concern", "concern": None}.get(track.status, "achieved")
+        db.commit()
+        week_ids = [m.id for m in milestone_catalog.for_week(WEEK)]
+        rows = (
+            db.query(MilestoneTracking)
+            .filter(
+                MilestoneTracking.subscriber_id == subscriber.id,
+                MilestoneTracking.milestone_id.in_(week_ids),
+            )
+            .all()
+        )
+        return PlainTextResponse(str(sum(1 for t in rows if t.status == "achieved")))
+
+
+@sync_routes.post("/{token}/calendar/add")
+async def sync_calendar_add(token: str, title: str = Form(...), event_date: date = Form(...)):
+    with SessionLocal() as db:
+        subscriber = _subscriber(db, token)
+        db.add(CalendarEvent(subscriber_id=subscriber.id, title=title, event_date=event_date))
+        db.commit()
+    return PlainTextResponse("ok")
+
+
+@sync_routes.get("/{token}/calendar")
+async def sync_calendar(token: str):
+    today = date.today()
+    with SessionLocal() as db:
+        subscriber = _subscriber(db, token)
+        events = (
+            db.query(CalendarEvent)
+            .filter(
+                CalendarEvent.subscriber_id == subscriber.id,
+                CalendarEvent.event_date >= today.replace(day=1) - timedelta(days=7),
+                CalendarEvent.event_date <= today.replace(day=28) + timedelta(days=14),
+            )
+            .order_by(CalendarEvent.event_date, CalendarEvent.event_time)
+            .all()
+        )
+    return PlainTextResponse(str(len(events)))
+
+
+def _setup(count: int) -> list[str]:
+    bootstrap()
+    with SessionLocal() as db:
+        subscribers = [
+            Subscriber(
+                email=f"load{i}@example.com",
+                baby_name="Ava",
+                baby_birth_date=date.today() - timedelta(weeks=WEEK),
+            )
+            for i in range(count)
+        ]
+        db.add_all(subscribers)
+        db.commit()
+        return [s.unsubscribe_token for s in subscribers]
+
+
+def _start_server() -> tuple[uvicorn.Server, str]:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(
+        # The baseline's "database is locked" errors are counted, not logged
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="critical")
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, f"http://127.0.0.1:{port}"
+
+
+async def chat_stream(
+    client: httpx.AsyncClient, token: str, gaps: list[float], counts: dict
+) -> None:
+    payload = {"message": "Is this normal?", "week": WEEK}
+    try:
+        async with client.stream("POST", f"/my-updates/{token}/chat", json=payload) as r:
+            # Time between tokens; the wait for the first one includes request setup
+            last = None
+            async for line in r.aiter_lines():
+                if line.startswith("data:"):
+                    now = time.perf_counter()
+                    if last is not None:
+                        gaps.append(now - last)
+                    last = now
+    except httpx.HTTPError:
+        counts["broken_streams"] += 1
+
+
+async def writer(
+    client: httpx.AsyncClient, prefix: str, token: str, stop: asyncio.Event, counts: dict
+) -> None:
+    milestone_ids = [m.id for m in milestone_catalog.for_week(WEEK)]
+    i = 0
+    while not stop.is_set():
+        for request in (
+            client.post(f"{prefix}/{token}/track/{milestone_ids[i % len(milestone_ids)]}"),
+            client.post(
+                f"{prefix}/{token}/calendar/add",
+                data={"title": f"Checkup {i}", "event_date": date.today().isoformat()},
+            ),
+            client.get(f"{prefix}/{token}/calendar"),
+        ):
+            counts["requests"] += 1
+            try:
+                if (await request).is_error:
+                    counts["errors"] += 1
+            except httpx.HTTPError:
+                counts["errors"] += 1
+        i += 1
+
+
+async def run(base_url: str, prefix: str, tokens: list[str]) -> tuple[float, float]:
+    """Print one run's token gaps; returns (p99 gap, share of gaps over STALL_THRESHOLD)."""
+    chat_tokens, writer_tokens = tokens[:CHAT_STREAMS], tokens[CHAT_STREAMS:]
+    gaps: list[float] = []
+    counts = {"requests": 0, "errors": 0, "broken_streams": 0}
+    stop = asyncio.Event()
+    limits = httpx.Limits(max_connections=CHAT_STREAMS + WRITERS)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        writers = [
+            asyncio.create_task(writer(client, prefix, t, stop, counts)) for t in writer_tokens
+        ]
+        start = time.perf_counter()
+        await asyncio.gather(*(chat_stream(client, t, gaps, counts) for t in chat_tokens))
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await asyncio.gather(*writers)
+
+    gaps.sort()
+    pct = lambda p: gaps[int(p * (len(gaps) - 1))] * 1000
+    stalls = sum(1 for g in gaps if g > STALL_THRESHOLD)
+    print(
+        f"  {WRITERS} writers: {counts['requests']} toggle/calendar requests "
+        f"({counts['requests'] / elapsed:,.0f} req/s, {counts['errors']} errors)"
+    )
+    print(
+        f"  token gap p50 {pct(0.50):.1f} ms  p99 {pct(0.99):.1f} ms  max {gaps[-1] * 1000:.1f} ms  "
+        f"mean {statistics.mean(gaps) * 1000:.1f} ms"
+    )
+    print(
+        f"  gaps over {STALL_THRESHOLD * 1000:.0f} ms: {stalls} of {len(gaps)}, "
+        f"{counts['broken_streams']} of {CHAT_STREAMS} streams broken off"
+    )
+    if counts["broken_streams"]:
+        return float("inf"), 1.0
+    return pct(0.99) / 1000, stalls / len(gaps)
+
+
+def main():
+    public_routes.stream_chat_response = fake_stream_chat_response
+    app.include_router(sync_routes)
+    per_run = CHAT_STREAMS + WRITERS
+    tokens = _setup(2 * per_run)
+    server, base_url = _start_server()
+    try:
+        print(f"{CHAT_STREAMS} chat streams x {TOKENS_PER_STREAM} tokens every {TOKEN_INTERVAL * 1000:.0f} ms")
+        print("Sync Session in async handlers (baseline)")
+        asyncio.run(run(base_url, "/sync-baseline", tokens[per_run:]))
+        print("AsyncSession (app routes)")
+        p99, stall_share = asyncio.run(run(base_url, "/my-updates", tokens[:per_run]))
+        pool = pool_metrics()["async"]
+        print(
+            f"  async pool over both runs: {pool['connects']} connections, {pool['checkouts']} checkouts, "
+            f"mean wait {pool['mean_wait_ms']} ms, max wait {pool['max_wait_ms']} ms, "
+            f"{pool['timeouts']} timeouts"
+        )
+    finally:
+        server.should_exit = True
+    if p99 > STALL_THRESHOLD or stall_share > MAX_STALL_SHARE:
+        raise SystemExit(
+            f"FAIL: p99 token gap {p99 * 1000:.1f} ms, {stall_share:.1%} of gaps over "
+            f"{STALL_THRESHOLD * 1000:.0f} ms (limits {STALL_THRESHOLD * 1000:.0f} ms, "
+            f"{MAX_STALL_SHARE:.0%})"
+        )
+    print(f"PASS: p99 token gap under {STALL_THRESHOLD * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Load test: does a flood of admin logins slow down everyone else?
+
+Starts the app under uvicorn, in a process of its own, on a throwaway
+SQLite database and measures landing-page latency from PROBES clients,
+first on its own, then while
+FLOODERS clients each post a wrong admin password every FLOOD_INTERVAL
+seconds (or as soon as the previous attempt returns, if slower):
+
+  - bcrypt inline in the handler (the old behaviour)
+  - bcrypt on the password hashing thread pool, throttling off
+  - the thread pool plus login throttling
+
+Run with:
+    python -m benchmarks.load_login_flood
+"""
+
+import asyncio
+import multiprocessing
+import os
+import socket
+import tempfile
+import time
+
+_tmp = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/login.db"
+os.environ.setdefault("OUTBOX_ENABLED", "false")
+os.environ.setdefault("SCHEDULER_ENABLED", "false")
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+
+import app.routes.auth as auth_routes  # noqa: E402
+from app.bootstrap import bootstrap  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.main import app  # noqa: E402
+from app.services.auth import verify_password  # noqa: E402
+from app.services.login_throttle import LoginThrottle  # noqa: E402
+
+DURATION = 5.0
+PROBES = 4
+FLOODERS = 10
+FLOOD_INTERVAL = 0.2  # each flooder sends at most 5 logins/s
+
+
+class InlineHasher:
+    """bcrypt on the event loop, as the login handler used to do it."""
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return verify_password(plain_password, hashed_password)
+
+
+def serve(port: int, mode: str) -> None:
+    """Server process, so the load generator does not share its GIL."""
+    if mode == "inline":
+        auth_routes.password_hasher = InlineHasher()
+    if mode != "throttle":
+        auth_routes.login_throttle = LoginThrottle(10**9, 10**9, 60, 10)
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def _start_server(mode: str) -> tuple[multiprocessing.Process, str]:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = multiprocessing.Process(target=serve, args=(port, mode), daemon=True)
+    server.start()
+    base_url = f"http://127.0.0.1:{port}"
+    while True:
+        try:
+            httpx.get(base_url + "/")
+            return server, base_url
+        except httpx.TransportError:
+            time.sleep(0.1)
+
+
+async def probe(client: httpx.AsyncClient, stop: asyncio.Event, latencies: list[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        r = await client.get("/")
+        r.raise_for_status()
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(0.01)
+
+
+async def flood(client: httpx.AsyncClient, stop: asyncio.Event, statuses: dict) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        r = await client.post(
+            "/auth/login", data={"username": settings.ADMIN_USERNAME, "password": "wrong"}
+        )
+        statuses[r.status_code] = statuses.get(r.status_code, 0) + 1
+        await asyncio.sleep(max(0.0, FLOOD_INTERVAL - (time.perf_counter() - start)))
+
+
+async def run(base_url: str, label: str, flooders: int) -> None:
+    latencies: list[float] = []
+    statuses: dict[int, int] = {}
+    stop = asyncio.Event()
+    limits = httpx.Limits(max_connections=PROBES + flooders)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        tasks = [asyncio.create_task(probe(client, stop, latencies)) for _ in range(PROBES)]
+        tasks += [asyncio.create_task(flood(client, stop, statuses)) for _ in range(flooders)]
+        await asyncio.sleep(DURATION)
+        stop.set()
+        await asyncio.gather(*tasks)
+
+    latencies.sort()
+    pct = lambda p: latencies[int(p * (len(latencies) - 1))] * 1000
+    logins = ", ".join(f"{count} x {code}" for code, count in sorted(statuses.items())) or "none"
+    print(
+        f"  {label:<24} landing p50 {pct(0.50):6.1f} ms  p99 {pct(0.99):6.1f} ms  "
+        f"max {latencies[-1] * 1000:6.1f} ms   logins: {logins}"
+    )
+
+
+def main():
+    bootstrap()
+    print(f"Landing page latency, {PROBES} clients, {DURATION:.0f} s per run, {FLOODERS} login flooders:")
+    for label, mode, flooders in [
+        ("no flood", "pool", 0),
+        ("inline bcrypt", "inline", FLOODERS),
+        ("thread pool", "pool", FLOODERS),
+        ("thread pool + throttle", "throttle", FLOODERS),
+    ]:
+        server, base_url = _start_server(mode)
+        try:
+            asyncio.run(run(base_url, label, flooders))
+        finally:
+            server.terminate()
+            server.join()
+
+
+if __name__ == "__main__":
+    main()
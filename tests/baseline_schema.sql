@@ -0,0 +1,112 @@
+-- Schema as created by the original app's create_all(), before schema_version
+CREATE TABLE subscribers (
+	id INTEGER NOT NULL, 
+	email VARCHAR NOT NULL, 
+	name VARCHAR, 
+	baby_name VARCHAR, 
+	baby_birth_date DATE, 
+	baby_due_date DATE, 
+	neighborhood VARCHAR, 
+	tier VARCHAR, 
+	is_active BOOLEAN, 
+	unsubscribe_token VARCHAR NOT NULL, 
+	created_at DATETIME, 
+	updated_at DATETIME, 
+	PRIMARY KEY (id), 
+	UNIQUE (unsubscribe_token)
+);
+CREATE UNIQUE INDEX ix_subscribers_email ON subscribers (email);
+CREATE INDEX ix_subscribers_id ON subscribers (id);
+CREATE TABLE newsletter_issues (
+	id INTEGER NOT NULL, 
+	title VARCHAR NOT NULL, 
+	subject_line VARCHAR NOT NULL, 
+	week_number INTEGER NOT NULL, 
+	status VARCHAR, 
+	sent_at DATETIME, 
+	created_at DATETIME, 
+	updated_at DATETIME, 
+	PRIMARY KEY (id)
+);
+CREATE INDEX ix_newsletter_issues_id ON newsletter_issues (id);
+CREATE TABLE milestones (
+	id INTEGER NOT NULL, 
+	week_number INTEGER NOT NULL, 
+	category VARCHAR NOT NULL, 
+	title VARCHAR NOT NULL, 
+	description TEXT NOT NULL, 
+	source VARCHAR, 
+	parent_action TEXT, 
+	is_concern_flag BOOLEAN, 
+	created_at DATETIME, 
+	PRIMARY KEY (id)
+);
+CREATE INDEX ix_milestones_id ON milestones (id);
+CREATE INDEX ix_milestones_week_number ON milestones (week_number);
+CREATE TABLE local_resources (
+	id INTEGER NOT NULL, 
+	name VARCHAR NOT NULL, 
+	category VARCHAR NOT NULL, 
+	neighborhood VARCHAR NOT NULL, 
+	address VARCHAR NOT NULL, 
+	phone VARCHAR, 
+	website VARCHAR, 
+	hours VARCHAR, 
+	description TEXT, 
+	rating FLOAT, 
+	accepts_insurance BOOLEAN, 
+	age_range VARCHAR, 
+	latitude FLOAT, 
+	longitude FLOAT, 
+	created_at DATETIME, 
+	PRIMARY KEY (id)
+);
+CREATE INDEX ix_local_resources_id ON local_resources (id);
+CREATE INDEX ix_local_resources_neighborhood ON local_resources (neighborhood);
+CREATE TABLE content_sections (
+	id INTEGER NOT NULL, 
+	newsletter_id INTEGER NOT NULL, 
+	section_type VARCHAR NOT NULL, 
+	title VARCHAR, 
+	body TEXT NOT NULL, 
+	sort_order INTEGER, 
+	is_paid_only BOOLEAN, 
+	created_at DATETIME, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(newsletter_id) REFERENCES newsletter_issues (id)
+);
+CREATE INDEX ix_content_sections_id ON content_sections (id);
+CREATE TABLE milestone_tracking (
+	id INTEGER NOT NULL, 
+	subscriber_id INTEGER NOT NULL, 
+	milestone_id INTEGER NOT NULL, 
+	status VARCHAR, 
+	notes TEXT, 
+	ai_response TEXT, 
+	achieved_at DATETIME, 
+	created_at DATETIME, 
+	updated_at DATETIME, 
+	PRIMARY KEY (id), 
+	CONSTRAINT uq_subscriber_milestone UNIQUE (subscriber_id, milestone_id), 
+	FOREIGN KEY(subscriber_id) REFERENCES subscribers (id), 
+	FOREIGN KEY(milestone_id) REFERENCES milestones (id)
+);
+CREATE INDEX ix_milestone_tracking_milestone_id ON milestone_tracking (milestone_id);
+CREATE INDEX ix_milestone_tracking_id ON milestone_tracking (id);
+CREATE INDEX ix_milestone_tracking_subscriber_id ON milestone_tracking (subscriber_id);
+CREATE TABLE calendar_events (
+	id INTEGER NOT NULL, 
+	subscriber_id INTEGER NOT NULL, 
+	title VARCHAR NOT NULL, 
+	description TEXT, 
+	event_date DATE NOT NULL, 
+	event_time TIME, 
+	category VARCHAR, 
+	created_at DATETIME, 
+	updated_at DATETIME, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(subscriber_id) REFERENCES subscribers (id)
+);
+CREATE INDEX ix_calendar_events_id ON calendar_events (id);
+CREATE INDEX ix_calendar_events_event_date ON calendar_events (event_date);
+CREATE INDEX ix_calendar_events_subscriber_id ON calendar_events (subscriber_id);
@@ -0,0 +1,11 @@
+import os
+import tempfile
+
+# The app binds its engines at import time, so point them at a scratch
+# database before any test imports it
+_tmp = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/test.db"
+os.environ["OUTBOX_ENABLED"] = "false"
+os.environ["SCHEDULER_ENABLED"] = "false"
+os.environ["AUTO_BOOTSTRAP"] = "false"
+os.environ["TEMPLATE_CACHE_DIR"] = ""
@@ -0,0 +1,138 @@
+"""
+Local stand-in for the Anthropic client used by app.services.ai_chat.
+
+It implements the two calls the app makes, messages.create and
+messages.stream, records every request, and models the provider's prompt
+caching: a system block carrying cache_control marks a breakpoint, and
+the prefix up to that block is read from the cache when an identical
+prefix was written within CACHE_TTL seconds. Tokens are estimated from
+characters, and time to first token grows with the uncached input, so
+prompt layouts can be compared without touching the network:
+
+    client = FakeAnthropic()
+    ai_chat.client = client
+    ...
+    assert client.requests[-1]["usage"].cache_read_input_tokens > 0
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from types import SimpleNamespace
+
+CHARS_PER_TOKEN = 4
+CACHE_TTL = 300.0
+# Shorter prefixes are not cached, as with Sonnet models
+MIN_CACHEABLE_TOKENS = 1024
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+def _system_blocks(system) -> list[dict]:
+    if system is None:
+        return []
+    if isinstance(system, str):
+        return [{"type": "text", "text": system}]
+    return list(system)
+
+
+class _Messages:
+    def __init__(self, client: "FakeAnthropic"):
+        self._client = client
+
+    async def create(self, **request):
+        usage = self._client._account(request)
+        await asyncio.sleep(self._client.first_token_delay(usage))
+        text = " ".join(self._client.reply_tokens)
+        return SimpleNamespace(
+            content=[SimpleNamespace(type="text", text=text)], usage=usage, stop_reason="end_turn"
+        )
+
+    def stream(self, **request):
+        return _Stream(self._client, request)
+
+
+class _Stream:
+    def __init__(self, client: "FakeAnthropic", request: dict):
+        self._client = client
+        self._request = request
+        self.usage = None
+
+    async def __aenter__(self):
+        self.usage = self._client._account(self._request)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        pass
+
+    @property
+    async def text_stream(self):
+        await asyncio.sleep(self._client.first_token_delay(self.usage))
+        for i, token in enumerate(self._client.reply_tokens):
+            if i:
+                await asyncio.sleep(self._client.token_interval)
+            yield token + " "
+
+    async def get_final_message(self):
+        text = " ".join(self._client.reply_tokens)
+        return SimpleNamespace(content=[SimpleNamespace(type="text", text=text)], usage=self.usage)
+
+
+class FakeAnthropic:
+    def __init__(
+        self,
+        reply: str = "Thanks for asking!",
+        base_latency: float = 0.0,
+        seconds_per_uncached_token: float = 0.0,
+        token_interval: float = 0.0,
+    ):
+        self.reply_tokens = reply.split()
+        # Simulated time to first token: base_latency plus prefill of uncached input
+        self.base_latency = base_latency
+        self.seconds_per_uncached_token = seconds_per_uncached_token
+        self.token_interval = token_interval
+        self.requests: list[dict] = []
+        self.messages = _Messages(self)
+        self._cache: dict[str, float] = {}  # prefix digest -> expiry
+
+    def first_token_delay(self, usage) -> float:
+        uncached = usage.input_tokens + usage.cache_creation_input_tokens
+        return self.base_latency + uncached * self.seconds_per_uncached_token
+
+    def _account(self, request: dict):
+        """Work out the request's usage, updating the simulated prompt cache."""
+        now = time.monotonic()
+        blocks = _system_blocks(request.get("system"))
+        digest = hashlib.sha256()
+        tokens = 0
+        cached_upto = 0  # tokens covered by the longest cached prefix
+        written_upto = 0  # tokens covered by the longest newly cached prefix
+        for block in blocks:
+            digest.update(block["text"].encode())
+            digest.update(b"\0")
+            tokens += estimate_tokens(block["text"])
+            if "cache_control" not in block or tokens < MIN_CACHEABLE_TOKENS:
+                continue
+            key = digest.hexdigest()
+            if self._cache.get(key, 0) > now:
+                cached_upto = tokens
+            else:
+                written_upto = tokens
+            self._cache[key] = now + CACHE_TTL  # a hit refreshes the TTL
+        message_tokens = estimate_tokens(json.dumps(request.get("messages", [])))
+        creation = max(written_upto - cached_upto, 0)
+        usage = SimpleNamespace(
+            input_tokens=tokens - cached_upto - creation + message_tokens,
+            cache_creation_input_tokens=creation,
+            cache_read_input_tokens=cached_upto,
+            output_tokens=len(self.reply_tokens),
+        )
+        self.requests.append({**request, "usage": usage})
+        return usage
+
+    def totals(self) -> dict:
+        fields = ("input_tokens", "cache_creation_input_tokens", "cache_read_input_tokens")
+        return {f: sum(getattr(r["usage"], f) for r in self.requests) for f in fields}
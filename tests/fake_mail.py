@@ -0,0 +1,184 @@
+"""
+Local stand-ins for an SMTP relay and the Resend HTTP API.
+
+They accept everything unless told to reject, keep delivered messages in
+memory and count connections, so transports can be exercised and
+benchmarked without touching the network:
+
+    async with FakeResendServer() as server:
+        transport = ResendTransport(api_key="test", base_url=server.url)
+        ...
+        assert len(server.messages) == 1
+"""
+
+import asyncio
+import json
+import uuid
+
+
+class _FakeServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0):
+        self.host = host
+        self.port = port
+        # Simulated provider processing time per request / message
+        self.latency = latency
+        self.messages: list[dict] = []
+        self.connections = 0
+        self.requests = 0
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._on_connect, self.host, self.port, limit=2**24
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    async def _on_connect(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            await self._handle(reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        raise NotImplementedError
+
+
+class FakeSMTPServer(_FakeServer):
+    """Minimal ESMTP server: EHLO/HELO, MAIL, RCPT, DATA, RSET, NOOP, QUIT.
+
+    `reject` maps recipient addresses to the reply RCPT gets for them,
+    e.g. {"gone@example.com": "550 No such user"}.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reject: dict[str, str] = {}
+
+    async def _reply(self, writer: asyncio.StreamWriter, line: str) -> None:
+        writer.write(f"{line}\r\n".encode())
+        await writer.drain()
+
+    async def _handle(self, reader, writer) -> None:
+        await self._reply(writer, "220 localhost fake ESMTP ready")
+        envelope = {"from": None, "to": []}
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            command = line.decode("utf-8", "replace").strip()
+            verb = command[:4].upper()
+            if verb == "EHLO":
+                await self._reply(writer, "250-localhost\r\n250-8BITMIME\r\n250 SMTPUTF8")
+            elif verb == "HELO":
+                await self._reply(writer, "250 localhost")
+            elif verb == "MAIL":
+                envelope = {"from": command.split(":", 1)[1].strip(), "to": []}
+                await self._reply(writer, "250 OK")
+            elif verb == "RCPT":
+                recipient = command.split(":", 1)[1].strip()
+                if recipient.strip("<>") in self.reject:
+                    await self._reply(writer, self.reject[recipient.strip("<>")])
+                    continue
+                envelope["to"].append(recipient)
+                await self._reply(writer, "250 OK")
+            elif verb == "DATA":
+                await self._reply(writer, "354 End data with <CR><LF>.<CR><LF>")
+                data = await reader.readuntil(b"\r\n.\r\n")
+                self.requests += 1
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                self.messages.append({**envelope, "data": data[:-5].decode("utf-8", "replace")})
+                await self._reply(writer, "250 OK queued")
+            elif verb in ("RSET", "NOOP"):
+                await self._reply(writer, "250 OK")
+            elif verb == "QUIT":
+                await self._reply(writer, "221 Bye")
+                return
+            else:
+                await self._reply(writer, "502 Command not implemented")
+
+
+class FakeResendServer(_FakeServer):
+    """Keep-alive HTTP/1.1 server answering POST /emails and POST /emails/batch.
+
+    Set `status`, e.g. "503 Service Unavailable", to fail every request.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.status: str | None = None
+        self.idempotency_keys: list[str | None] = []
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def _handle(self, reader, writer) -> None:
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except asyncio.IncompleteReadError:
+                return
+            request_line, *header_lines = head.decode("latin-1").split("\r\n")
+            method, path, _ = request_line.split(" ", 2)
+            headers = {}
+            for h in header_lines:
+                if ":" in h:
+                    k, v = h.split(":", 1)
+                    headers[k.strip().lower()] = v.strip()
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+            self.requests += 1
+            self.idempotency_keys.append(headers.get("idempotency-key"))
+
+            if self.status:
+                status, payload = self.status, {"message": self.status}
+            else:
+                status, payload = self._route(method, path, body)
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            data = json.dumps(payload).encode()
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(data)}\r\n"
+                "Connection: keep-alive\r\n\r\n".encode() + data
+            )
+            await writer.drain()
+            if headers.get("connection", "").lower() == "close":
+                return
+
+    def _route(self, method: str, path: str, body: bytes) -> tuple[str, dict]:
+        if method != "POST":
+            return "405 Method Not Allowed", {"message": "Method not allowed"}
+        if path == "/emails":
+            message = json.loads(body)
+            message["id"] = uuid.uuid4().hex
+            self.messages.append(message)
+            return "200 OK", {"id": message["id"]}
+        if path == "/emails/batch":
+            batch = json.loads(body)
+            if len(batch) > 100:
+                return "422 Unprocessable Entity", {"message": "Batch too large"}
+            ids = []
+            for message in batch:
+                message["id"] = uuid.uuid4().hex
+                self.messages.append(message)
+                ids.append({"id": message["id"]})
+            return "200 OK", {"data": ids}
+        return "404 Not Found", {"message": "Not found"}
@@ -0,0 +1,37 @@
+from app.bootstrap import bootstrap
+from app.config import settings
+from app.services.auth import VerifiedTokenCache, create_access_token
+
+
+def _token(session: str) -> str:
+    return create_access_token({"sub": settings.ADMIN_USERNAME, "session": session})
+
+
+def test_logout_on_one_worker_reaches_the_others():
+    bootstrap()
+    token = _token("logout")
+    worker_a = VerifiedTokenCache(16, recheck=0)
+    worker_b = VerifiedTokenCache(16, recheck=0)
+    assert worker_a.verify(token)["sub"] == settings.ADMIN_USERNAME
+    assert worker_b.verify(token)["sub"] == settings.ADMIN_USERNAME
+
+    worker_a.revoke(token)
+
+    assert worker_a.verify(token) is None
+    assert worker_b.verify(token) is None  # was cached, re-checked
+    assert VerifiedTokenCache(16, recheck=30).verify(token) is None  # cache miss
+
+
+def test_cached_token_is_rechecked_only_after_the_interval():
+    bootstrap()
+    token = _token("recheck")
+    worker_a = VerifiedTokenCache(16, recheck=0)
+    worker_b = VerifiedTokenCache(16, recheck=3600)
+    worker_b.verify(token)
+
+    worker_a.revoke(token)
+
+    assert worker_b.verify(token) is not None  # trusted until the next re-check
+    worker_b.recheck = 0
+    assert worker_b.verify(token) is None
+    assert worker_b.stats()["revocation_checks"] == 2
@@ -0,0 +1,116 @@
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import func, inspect, select, text
+
+from app.bootstrap import SCHEMA_VERSION, bootstrap, pending_components
+from app.database import SessionLocal, engine
+from app.models import Milestone
+from app.seed import seed_milestones
+from app.seed.sync import sync_records
+
+BASELINE_SCHEMA = Path(__file__).parent / "baseline_schema.sql"
+
+
+def _create_baseline() -> str:
+    """A database as the original app's create_all() left it; returns a subscriber token."""
+    with engine.begin() as conn:
+        # Start from an empty database, whatever other tests created
+        for table in inspect(conn).get_table_names():
+            conn.execute(text(f"DROP TABLE {table}"))
+        for statement in BASELINE_SCHEMA.read_text().split(";"):
+            if statement.strip():
+                conn.execute(text(statement))
+        conn.execute(
+            text(
+                "INSERT INTO subscribers (email, baby_name, baby_birth_date, tier, is_active, unsubscribe_token) "
+                "VALUES ('old@example.com', 'Ava', date('now', '-28 days'), 'free', 1, 'baseline-token')"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO milestones (id, week_number, category, title, description, is_concern_flag) "
+                "VALUES (1, 0, 'motor', 'Flexed posture at rest', 'Seeded before slugs', 0)"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO milestone_tracking (subscriber_id, milestone_id, status, notes, ai_response) "
+                "VALUES (1, 1, 'achieved', 'First smile!', 'How lovely!'), "
+                "(1, 2, 'achieved', 'Rolled over', NULL)"
+            )
+        )
+    return "baseline-token"
+
+
+def test_bootstrap_upgrades_baseline_database():
+    token = _create_baseline()
+
+    applied = bootstrap()
+
+    assert "schema" in applied
+    with SessionLocal() as db:
+        assert pending_components(db) == []
+        version = db.execute(
+            text("SELECT version FROM schema_version WHERE component = 'schema'")
+        ).scalar()
+    assert version == SCHEMA_VERSION
+    tables = set(inspect(engine).get_table_names())
+    assert {"email_outbox", "scheduler_runs", "chat_messages"} <= tables
+
+    columns = {c["name"] for c in inspect(engine).get_columns("milestone_tracking")}
+    assert "ai_status" in columns
+    with engine.connect() as conn:
+        statuses = conn.execute(
+            text("SELECT milestone_id, ai_status FROM milestone_tracking ORDER BY milestone_id")
+        ).all()
+    assert statuses == [(1, "ready"), (2, "failed")]
+    indexes = {i["name"] for i in inspect(engine).get_indexes("subscribers")}
+    assert "ix_subscribers_baby_birth_date" in indexes
+
+    # The milestone seeded by the old app keeps its id and gets its slug
+    with SessionLocal() as db:
+        assert db.scalar(select(func.count()).select_from(Milestone)) == len(seed_milestones.load())
+        assert db.get(Milestone, 1).slug == seed_milestones.load()[0]["slug"]
+
+    from app.main import app
+    from app.services import ai_chat
+    from app.services.milestone_catalog import milestone_catalog
+    from tests.fake_anthropic import FakeAnthropic
+
+    ai_chat.client = FakeAnthropic(reply="Lovely!")
+    with TestClient(app) as client:
+        response = client.get(f"/my-updates/{token}")
+        assert response.status_code == 200
+        assert "Ava" in response.text
+
+        # Everything that loads MilestoneTracking works on the upgraded table
+        milestone_id = milestone_catalog.for_week(4)[0].id
+        assert client.post(f"/my-updates/{token}/track/{milestone_id}").status_code == 200
+        response = client.post(
+            f"/my-updates/{token}/track/{milestone_id}/notes", data={"notes": "She did it!"}
+        )
+        assert response.status_code == 200
+        response = client.get(f"/my-updates/{token}/track/{milestone_id}/response")
+        assert response.status_code == 200
+
+
+def test_milestone_title_edit_keeps_its_row():
+    bootstrap()
+    records = [dict(r) for r in seed_milestones.load()]
+    records[0]["title"] += " (edited)"
+
+    with SessionLocal() as db:
+        before = db.scalar(select(Milestone.id).where(Milestone.slug == records[0]["slug"]))
+        report = sync_records(
+            db,
+            Milestone,
+            records,
+            seed_milestones.KEY_FIELDS,
+            seed_milestones._tracked_ids,
+            seed_milestones.LEGACY_KEY_FIELDS,
+        )
+        assert (report.inserted, report.updated, report.deleted, report.retained) == (0, 1, 0, 0)
+        edited = db.scalar(select(Milestone).where(Milestone.slug == records[0]["slug"]))
+        assert (edited.id, edited.title) == (before, records[0]["title"])
+        db.rollback()
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+from app.bootstrap import bootstrap
+from app.config import settings
+from app.database import AsyncSessionLocal, SessionLocal, async_engine
+from app.models import ChatConversation, ChatMessage, Subscriber
+from app.services import chat_history
+
+
+@pytest.fixture
+def subscriber_id(monkeypatch):
+    bootstrap()
+    monkeypatch.setattr(settings, "CHAT_WINDOW_MESSAGES", 2)
+    monkeypatch.setattr(settings, "CHAT_COMPACT_EVERY", 2)
+    db = SessionLocal()
+    subscriber = Subscriber(email="chat-history@example.com", baby_name="Mia")
+    db.add(subscriber)
+    db.commit()
+    yield subscriber.id
+    db.query(ChatMessage).filter_by(subscriber_id=subscriber.id).delete()
+    db.query(ChatConversation).filter_by(subscriber_id=subscriber.id).delete()
+    db.delete(subscriber)
+    db.commit()
+    db.close()
+
+
+def _run(coro):
+    async def run():
+        try:
+            return await coro
+        finally:
+            # Pooled aiosqlite connections belong to this event loop
+            await async_engine.dispose()
+
+    return asyncio.run(run())
+
+
+async def _chat(subscriber_id: int, turns: int) -> None:
+    async with AsyncSessionLocal() as db:
+        for n in range(turns):
+            await chat_history.add_message(db, subscriber_id, "user", f"question {n}")
+            await chat_history.add_message(db, subscriber_id, "assistant", f"answer {n}")
+        await db.commit()
+
+
+async def _state(subscriber_id: int) -> tuple[int, ChatConversation | None]:
+    async with AsyncSessionLocal() as db:
+        messages = await chat_history.unsummarized_count(db, subscriber_id)
+        return messages, await db.get(ChatConversation, subscriber_id)
+
+
+def test_compaction_folds_old_messages_into_the_summary(subscriber_id, monkeypatch):
+    async def summarize(summary, messages):
+        return f"{len(messages)} messages"
+
+    monkeypatch.setattr(chat_history, "summarize_conversation", summarize)
+
+    async def run():
+        await _chat(subscriber_id, 2)
+        assert await chat_history.compact_conversation(subscriber_id)
+        return await _state(subscriber_id)
+
+    messages, conversation = _run(run())
+    assert messages == 2
+    assert conversation.summary == "2 messages"
+
+
+def test_new_chat_during_compaction_stays_cleared(subscriber_id, monkeypatch):
+    async def clear_while_summarizing(summary, messages):
+        async with AsyncSessionLocal() as db:
+            await chat_history.clear_conversation(db, subscriber_id)
+            await db.commit()
+        return "the cleared conversation"
+
+    monkeypatch.setattr(chat_history, "summarize_conversation", clear_while_summarizing)
+
+    async def run():
+        await _chat(subscriber_id, 2)
+        assert not await chat_history.compact_conversation(subscriber_id)
+        return await _state(subscriber_id)
+
+    messages, conversation = _run(run())
+    assert messages == 0
+    assert conversation is None
@@ -0,0 +1,119 @@
+import asyncio
+import json
+
+import pytest
+
+from app.bootstrap import bootstrap
+from app.database import AsyncSessionLocal, SessionLocal, async_engine
+from app.models import MilestoneTracking, Subscriber
+from app.services import ai_chat
+from app.services.chat_prompt import PromptCache
+from app.services.milestone_catalog import milestone_catalog
+from app.services.subscriber_cache import SubscriberSnapshot
+from tests import fake_anthropic
+from tests.fake_anthropic import FakeAnthropic
+
+WEEK = 4
+
+
+@pytest.fixture
+def subscriber():
+    bootstrap()
+    db = SessionLocal()
+    row = Subscriber(email="chat-prompt@example.com", baby_name="Ava")
+    db.add(row)
+    db.commit()
+    yield SubscriberSnapshot(*(getattr(row, field) for field in SubscriberSnapshot._fields))
+    db.query(MilestoneTracking).filter_by(subscriber_id=row.id).delete()
+    db.delete(row)
+    db.commit()
+    db.close()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = FakeAnthropic()
+    monkeypatch.setattr(ai_chat, "client", client)
+    return client
+
+
+def _run(coro):
+    async def run():
+        try:
+            return await coro
+        finally:
+            # Pooled aiosqlite connections belong to this event loop
+            await async_engine.dispose()
+
+    return asyncio.run(run())
+
+
+async def _prompt(subscriber: SubscriberSnapshot, cache: PromptCache | None = None) -> tuple:
+    cache = cache or PromptCache(16, 40)
+    async with AsyncSessionLocal() as db:
+        return await cache.get(db, subscriber, WEEK, WEEK)
+
+
+async def _send(system_prompt: tuple) -> None:
+    messages = [{"role": "user", "content": "Is she sleeping enough?"}]
+    async for _ in ai_chat.stream_chat_response(messages, system_prompt):
+        pass
+
+
+def _track(subscriber_id: int, notes: str) -> None:
+    with SessionLocal() as db:
+        db.add(
+            MilestoneTracking(
+                subscriber_id=subscriber_id,
+                milestone_id=milestone_catalog.for_week(WEEK)[0].id,
+                status="achieved",
+                notes=notes,
+            )
+        )
+        db.commit()
+
+
+def test_blocks_are_sent_most_widely_shared_first(subscriber, client):
+    async def run():
+        system_prompt = await _prompt(subscriber)
+        await _send(system_prompt + (ai_chat.summary_block("They talked about naps."),))
+
+    _run(run())
+    rules, week, personal, summary = client.requests[-1]["system"]
+    assert rules == ai_chat.RULES_BLOCK
+    assert week["text"].startswith("Current week's milestones:")
+    assert personal["text"].startswith("The baby's name is Ava.")
+    assert summary["text"].startswith("Summary of your earlier conversation")
+    assert "Ava" not in rules["text"] + week["text"]
+
+
+def test_request_has_at_most_four_cache_breakpoints(subscriber, client):
+    _track(subscriber.id, "She smiled at grandma.")
+
+    async def run():
+        system_prompt = await _prompt(subscriber)
+        await _send(system_prompt + (ai_chat.summary_block("They talked about naps."),))
+
+    _run(run())
+    request = client.requests[-1]
+    assert json.dumps(request["system"]).count('"cache_control"') <= 4
+    assert '"cache_control"' not in json.dumps(request["messages"])
+
+
+def test_cached_prefix_is_byte_identical_across_calls(subscriber, client, monkeypatch):
+    _track(subscriber.id, "She smiled at grandma.")
+    # One week's prompt is below the provider's minimum cacheable length
+    monkeypatch.setattr(fake_anthropic, "MIN_CACHEABLE_TOKENS", 0)
+
+    async def run():
+        # A fresh cache per call, as in two web workers
+        first = await _prompt(subscriber)
+        await _send(first)
+        second = await _prompt(subscriber)
+        await _send(second)
+        return first, second
+
+    first, second = _run(run())
+    assert json.dumps(first).encode() == json.dumps(second).encode()
+    assert client.requests[-1]["usage"].cache_read_input_tokens > 0
+    assert client.requests[-1]["usage"].cache_creation_input_tokens == 0
@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from app.services.email_transport import DeliveryError, ResendTransport, SMTPTransport
+from tests.fake_mail import FakeResendServer, FakeSMTPServer
+
+
+def _messages(n: int, keys: bool = False) -> list[dict]:
+    return [
+        {
+            "from": "hello@example.com",
+            "to": f"parent{i}@example.com",
+            "subject": "Week 4",
+            "html": "<p>Week 4</p>",
+            **({"idempotency_key": f"outbox-{i}"} if keys else {}),
+        }
+        for i in range(n)
+    ]
+
+
+def test_smtp_reuses_one_connection():
+    async def run():
+        async with FakeSMTPServer() as server:
+            transport = SMTPTransport(server.host, server.port)
+            await transport.send(_messages(1)[0])
+            results = await transport.send_batch(_messages(5))
+            await transport.close()
+            return server, transport, results
+
+    server, transport, results = asyncio.run(run())
+    assert [r["status"] for r in results] == ["sent"] * 5
+    assert len(server.messages) == 6
+    assert server.connections == transport.connections_opened == 1
+
+
+@pytest.mark.parametrize(
+    "reply, retryable", [("550 No such user", False), ("451 Try again later", True)]
+)
+def test_smtp_refused_recipient_fails_only_its_message(reply, retryable):
+    async def run():
+        async with FakeSMTPServer() as server:
+            server.reject["parent1@example.com"] = reply
+            transport = SMTPTransport(server.host, server.port)
+            results = await transport.send_batch(_messages(3))
+            await transport.close()
+            return server, results
+
+    server, results = asyncio.run(run())
+    sent, refused, after = results
+    assert sent["status"] == after["status"] == "sent"
+    assert isinstance(refused, DeliveryError)
+    assert refused.retryable is retryable
+    assert len(server.messages) == 2
+
+
+def test_smtp_unreachable_server_is_retryable():
+    async def run():
+        async with FakeSMTPServer() as server:
+            host, port = server.host, server.port
+        return await SMTPTransport(host, port, timeout=1).send_batch(_messages(2))
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, DeliveryError) and r.retryable for r in results)
+
+
+def test_resend_splits_batches_over_one_connection():
+    async def run():
+        async with FakeResendServer() as server:
+            transport = ResendTransport("test", base_url=server.url)
+            results = await transport.send_batch(_messages(250, keys=True))
+            await transport.close()
+            return server, results
+
+    server, results = asyncio.run(run())
+    assert len(results) == len(server.messages) == 250
+    assert (server.requests, server.connections) == (3, 1)
+    assert all(key and key.startswith("batch-") for key in server.idempotency_keys)
+    assert len(set(server.idempotency_keys)) == 3
+    assert all("idempotency_key" not in m for m in server.messages)
+
+
+@pytest.mark.parametrize(
+    "status, retryable",
+    [
+        ("500 Internal Server Error", True),
+        ("503 Service Unavailable", True),
+        ("429 Too Many Requests", True),
+        ("422 Unprocessable Entity", False),
+        ("403 Forbidden", False),
+    ],
+)
+def test_resend_errors_map_to_retryable_or_permanent(status, retryable):
+    async def run():
+        async with FakeResendServer() as server:
+            server.status = status
+            transport = ResendTransport("test", base_url=server.url)
+            with pytest.raises(DeliveryError) as single:
+                await transport.send(_messages(1)[0])
+            batch = await transport.send_batch(_messages(150))
+            await transport.close()
+            return single.value, batch
+
+    single, batch = asyncio.run(run())
+    assert single.retryable is retryable
+    assert len(batch) == 150
+    assert all(isinstance(r, DeliveryError) and r.retryable is retryable for r in batch)
@@ -0,0 +1,45 @@
+import pytest
+
+from app.services.note_cache import NoteReplyCache, reply_template
+
+
+@pytest.mark.parametrize(
+    "name, reply",
+    [
+        ("Will", "Will is doing great, and he will soon start cooing."),
+        ("Joy", "What a joy, Joy! Joy is doing great."),
+        ("Hope", "We hope Hope keeps smiling."),
+        ("Grace", "Grace rolled over with such grace!"),
+    ],
+)
+def test_name_that_is_also_a_word_is_not_cached(name, reply):
+    cache = NoteReplyCache(10, 60)
+    cache.put(1, "achieved", 8, f"{name} did it!", name, reply)
+
+    assert reply_template(reply, name) is None
+    assert cache.get(1, "achieved", 8, "Ava did it!", "Ava") is None
+    assert cache.stats()["uncacheable"] == 1
+
+
+@pytest.mark.parametrize("name", ["Will", "Joy", "Hope", "Grace"])
+def test_capitalized_name_is_replaced(name):
+    cache = NoteReplyCache(10, 60)
+    cache.put(1, "achieved", 8, f"{name} did it!", name, f"Well done, {name}! {name} is thriving.")
+
+    assert cache.get(1, "achieved", 8, "Ava did it!", "Ava") == "Well done, Ava! Ava is thriving."
+
+
+def test_name_is_matched_case_sensitively():
+    cache = NoteReplyCache(10, 60)
+    cache.put(1, "achieved", 8, "Ava did it!", "Ava", "Lovely, Ava! Lavender AVA ava.")
+
+    assert reply_template("Lovely, Ava! Lavender AVA.", "Ava") == "Lovely, \x00Baby\x00! Lavender AVA."
+    assert cache.get(1, "achieved", 8, "Mia did it!", "Mia") is None
+
+
+def test_nameless_baby():
+    cache = NoteReplyCache(10, 60)
+    cache.put(1, "achieved", 8, "She did it!", None, "Your baby is thriving; your baby smiles.")
+
+    assert cache.get(1, "achieved", 8, "She did it!", "Mia") == "Mia is thriving; Mia smiles."
+    assert cache.get(1, "achieved", 9, "She did it!", None) is None
@@ -0,0 +1,196 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.bootstrap import bootstrap
+from app.database import SessionLocal
+from app.models import NewsletterIssue, OutboxMessage, Subscriber
+from app.services import outbox
+from app.services.email_transport import DeliveryError, EmailTransport
+from app.services.broadcast import enqueue_outbox
+from app.services.outbox import (
+    OutboxWorker,
+    backoff_delay,
+    claim_batch,
+    due_ids_query,
+    record_results,
+)
+
+
+class RecordingTransport(EmailTransport):
+    """Sends in pairs, failing the recipients listed in `errors`."""
+
+    max_batch_size = 2
+
+    def __init__(self, errors: dict[str, DeliveryError] | None = None):
+        self.errors = errors or {}
+        self.batches: list[list[str]] = []
+
+    async def send_batch(self, messages: list[dict]) -> list[dict | DeliveryError]:
+        self.batches.append([m["to"] for m in messages])
+        return [self.errors.get(m["to"]) or {"id": f"id-{m['to']}"} for m in messages]
+
+
+@pytest.fixture
+def db():
+    bootstrap()
+    db = SessionLocal()
+    db.query(OutboxMessage).delete()
+    db.commit()
+    yield db
+    db.query(OutboxMessage).delete()
+    db.commit()
+    db.close()
+
+
+@pytest.fixture
+def queue(db):
+    """Five pending deliveries of one issue; returns their recipients."""
+    issue = NewsletterIssue(title="Week 3", subject_line="Week 3", week_number=3)
+    subscribers = [Subscriber(email=f"outbox{i}@example.com") for i in range(5)]
+    db.add_all([issue, *subscribers])
+    db.commit()
+    assert enqueue_outbox(db, issue.id, [s.id for s in subscribers]) == 5
+    db.commit()
+    yield [s.email for s in subscribers]
+    db.query(OutboxMessage).delete()
+    for row in [issue, *subscribers]:
+        db.delete(row)
+    db.commit()
+
+
+def _statuses(db) -> dict[str, OutboxMessage]:
+    db.expire_all()
+    rows = (
+        db.query(Subscriber.email, OutboxMessage)
+        .join(OutboxMessage, OutboxMessage.subscriber_id == Subscriber.id)
+        .all()
+    )
+    return {email: row for email, row in rows}
+
+
+def test_worker_sends_claimed_rows_in_transport_batches(db, queue, monkeypatch):
+    transport = RecordingTransport()
+    monkeypatch.setattr(outbox, "get_transport", lambda: transport)
+
+    assert asyncio.run(OutboxWorker().run_once()) == 5
+
+    assert [len(batch) for batch in transport.batches] == [2, 2, 1]
+    assert sorted(sum(transport.batches, [])) == queue
+    rows = _statuses(db)
+    assert {row.status for row in rows.values()} == {"sent"}
+    assert rows[queue[0]].provider_id == f"id-{queue[0]}"
+    assert rows[queue[0]].claimed_by is None
+
+
+def test_permanent_error_fails_at_once_and_temporary_one_is_retried(db, queue, monkeypatch):
+    transport = RecordingTransport(
+        {
+            queue[1]: DeliveryError("550 No such user", retryable=False),
+            queue[2]: DeliveryError("451 Try again later"),
+        }
+    )
+    monkeypatch.setattr(outbox, "get_transport", lambda: transport)
+
+    asyncio.run(OutboxWorker().run_once())
+
+    rows = _statuses(db)
+    assert (rows[queue[1]].status, rows[queue[1]].attempts) == ("failed", 1)
+    assert "550 No such user" in rows[queue[1]].error
+    assert rows[queue[2]].status == "pending"
+    assert rows[queue[2]].next_attempt_at > datetime.utcnow()
+    assert rows[queue[0]].status == rows[queue[3]].status == "sent"
+
+
+def test_workers_split_the_provider_rate_limit(monkeypatch):
+    monkeypatch.setattr(outbox.settings, "EMAIL_RATE_LIMIT", 10)
+    monkeypatch.setattr(outbox.settings, "EMAIL_RATE_BURST", 20)
+    monkeypatch.setattr(outbox.settings, "WEB_CONCURRENCY", 4)
+
+    bucket = OutboxWorker().bucket
+    assert (bucket.rate, bucket.capacity) == (2.5, 5)
+
+
+def _result(row_id: int, status: str) -> dict:
+    return {
+        "id": row_id,
+        "status": status,
+        "claimed_by": None,
+        "claimed_at": None,
+        "provider_id": None,
+        "error": None,
+        "sent_at": None,
+        "next_attempt_at": datetime.utcnow(),
+    }
+
+
+def test_requeueing_an_issue_adds_no_duplicates(db, queue):
+    row = db.query(OutboxMessage).first()
+    assert enqueue_outbox(db, row.newsletter_id, [row.subscriber_id]) == 0
+    assert db.query(OutboxMessage).count() == 5
+
+
+def test_concurrent_claims_take_disjoint_rows(db, queue):
+    token_a, rows_a = claim_batch("worker-a", 3)
+    token_b, rows_b = claim_batch("worker-b", 3)
+
+    assert (len(rows_a), len(rows_b)) == (3, 2)
+    assert not {r.id for r in rows_a} & {r.id for r in rows_b}
+    assert claim_batch("worker-c", 3)[1] == []
+    rows = _statuses(db).values()
+    assert {(row.status, row.attempts) for row in rows} == {("sending", 1)}
+    assert {row.claimed_by for row in rows} == {token_a, token_b}
+
+
+def test_claim_skips_rows_locked_by_another_worker_on_postgres():
+    query = due_ids_query(datetime.utcnow(), 10, "postgresql")
+    assert "FOR UPDATE SKIP LOCKED" in str(query.compile(dialect=postgresql.dialect()))
+    query = due_ids_query(datetime.utcnow(), 10, "sqlite")
+    assert "FOR UPDATE" not in str(query.compile(dialect=sqlite.dialect()))
+
+
+def test_expired_lease_is_reclaimed_and_the_late_worker_is_ignored(db, queue, monkeypatch):
+    monkeypatch.setattr(outbox.settings, "OUTBOX_LEASE_SECONDS", 60)
+    stalled, rows = claim_batch("stalled", 5)
+    assert claim_batch("other", 5)[1] == []  # still leased
+
+    db.query(OutboxMessage).update({"claimed_at": datetime.utcnow() - timedelta(seconds=61)})
+    db.commit()
+    token, reclaimed = claim_batch("other", 5)
+    assert {r.id for r in reclaimed} == {r.id for r in rows}
+    assert {r.attempts for r in reclaimed} == {2}
+
+    record_results(stalled, [_result(r.id, "sent") for r in rows])
+    assert {row.status for row in _statuses(db).values()} == {"sending"}
+    record_results(token, [_result(r.id, "sent") for r in reclaimed])
+    assert {row.status for row in _statuses(db).values()} == {"sent"}
+
+
+def test_backoff_doubles_with_jitter_up_to_an_hour(monkeypatch):
+    monkeypatch.setattr(outbox.settings, "OUTBOX_RETRY_BASE_SECONDS", 30)
+    for attempts, ceiling in [(1, 30), (2, 60), (4, 240), (20, 3600)]:
+        delay = backoff_delay(attempts).total_seconds()
+        assert ceiling / 2 <= delay <= ceiling
+
+
+def test_temporary_errors_are_retried_until_the_last_attempt(db, queue, monkeypatch):
+    monkeypatch.setattr(outbox.settings, "OUTBOX_MAX_ATTEMPTS", 3)
+    error = DeliveryError("503 Service Unavailable")
+    transport = RecordingTransport({email: error for email in queue})
+    monkeypatch.setattr(outbox, "get_transport", lambda: transport)
+
+    for attempt in range(1, 4):
+        assert asyncio.run(OutboxWorker().run_once()) == 5
+        rows = _statuses(db).values()
+        assert {row.attempts for row in rows} == {attempt}
+        if attempt < 3:
+            assert {row.status for row in rows} == {"pending"}
+            assert all(row.next_attempt_at > datetime.utcnow() for row in rows)
+            assert asyncio.run(OutboxWorker().run_once()) == 0  # backing off
+            db.query(OutboxMessage).update({"next_attempt_at": datetime.utcnow()})
+            db.commit()
+
+    assert {row.status for row in rows} == {"failed"}
+    assert all("503 Service Unavailable" in row.error for row in rows)
@@ -0,0 +1,83 @@
+from datetime import date, timedelta
+
+import pytest
+
+from app.bootstrap import bootstrap
+from app.database import SessionLocal
+from app.models import NewsletterIssue, OutboxMessage, SchedulerRun, Subscriber
+from app.services import scheduler
+from app.services.scheduler import JOB_NAME, dispatch_day, due_dates, run_daily_dispatch
+
+DAY = date(2031, 3, 10)
+
+
+@pytest.fixture
+def db():
+    bootstrap()
+    db = SessionLocal()
+    db.query(SchedulerRun).delete()
+    db.query(OutboxMessage).delete()
+    db.commit()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def week_two(db):
+    """A scheduled week 2 issue and a baby turning two weeks old on DAY."""
+    issue = NewsletterIssue(
+        title="Week 2", subject_line="Week 2", week_number=2, status="scheduled"
+    )
+    baby = Subscriber(
+        email="scheduler-week-two@example.com", baby_birth_date=DAY - timedelta(weeks=2)
+    )
+    db.add_all([issue, baby])
+    db.commit()
+    yield issue, baby
+    db.query(OutboxMessage).delete()
+    db.delete(issue)
+    db.delete(baby)
+    db.commit()
+
+
+def _finish(db, run_date):
+    db.add(SchedulerRun(job=JOB_NAME, run_date=run_date, finished_at=run_date))
+    db.commit()
+
+
+def test_due_dates_catch_up_from_last_finished_run(db):
+    assert due_dates(db, DAY) == [DAY]
+
+    _finish(db, DAY - timedelta(days=3))
+    db.add(SchedulerRun(job=JOB_NAME, run_date=DAY - timedelta(days=1)))  # unfinished
+    db.commit()
+
+    assert due_dates(db, DAY) == [DAY - timedelta(days=2), DAY - timedelta(days=1), DAY]
+
+
+def test_day_is_dispatched_once(db, week_two):
+    assert dispatch_day(DAY) == 1
+    assert dispatch_day(DAY) is None
+    assert db.query(OutboxMessage).count() == 1
+
+
+def test_stale_unfinished_claim_is_taken_over(db, week_two):
+    db.add(SchedulerRun(job=JOB_NAME, run_date=DAY))
+    db.commit()
+
+    assert dispatch_day(DAY) == 1
+    run = db.query(SchedulerRun).filter_by(run_date=DAY).one()
+    assert run.finished_at is not None
+
+
+def test_failed_dispatch_leaves_no_claim(db, week_two, monkeypatch):
+    def killed(db, today):
+        raise RuntimeError("worker killed")
+
+    monkeypatch.setattr(scheduler, "dispatch_scheduled_issues", killed)
+    with pytest.raises(RuntimeError):
+        dispatch_day(DAY)
+    assert db.query(SchedulerRun).count() == 0
+
+    monkeypatch.undo()
+    assert run_daily_dispatch(DAY) == 1
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from app.bootstrap import bootstrap
+from app.database import AsyncSessionLocal, SessionLocal, async_engine
+from app.models import MilestoneTracking, Subscriber
+from app.services import tracking
+from app.services.progress import week_progress
+from app.services.milestone_catalog import milestone_catalog
+
+
+@pytest.fixture
+def ids():
+    bootstrap()
+    db = SessionLocal()
+    subscriber = Subscriber(email="tracking@example.com")
+    db.add(subscriber)
+    db.commit()
+    yield subscriber.id, milestone_catalog.for_week(2)[0].id
+    db.query(MilestoneTracking).filter_by(subscriber_id=subscriber.id).delete()
+    db.delete(subscriber)
+    db.commit()
+    db.close()
+
+
+def _run(write):
+    async def run():
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await write(db)
+                await db.commit()
+                return result
+        finally:
+            # Pooled aiosqlite connections belong to this event loop
+            await async_engine.dispose()
+
+    return asyncio.run(run())
+
+
+def _rows(subscriber_id: int) -> int:
+    with SessionLocal() as db:
+        return db.query(MilestoneTracking).filter_by(subscriber_id=subscriber_id).count()
+
+
+def test_toggle_cycles_status_on_one_row(ids):
+    statuses = [_run(lambda db: tracking.toggle_status(db, *ids)).status for _ in range(4)]
+
+    assert statuses == ["achieved", "concern", None, "achieved"]
+    assert _rows(ids[0]) == 1
+
+
+def test_reply_to_a_replaced_note_is_dropped(ids):
+    saved = _run(lambda db: tracking.save_notes(db, *ids, "First smile"))
+    assert (saved.notes, saved.ai_status) == ("First smile", "pending")
+    _run(lambda db: tracking.save_notes(db, *ids, "First laugh"))
+
+    assert not _run(lambda db: tracking.set_ai_response(db, *ids, "First smile", "Lovely!"))
+    assert _run(lambda db: tracking.set_ai_response(db, *ids, "First laugh", "Wonderful!"))
+    notes, reply, status, _ = _run(lambda db: tracking.note_response(db, *ids))
+    assert (notes, reply, status) == ("First laugh", "Wonderful!", "ready")
+    assert _rows(ids[0]) == 1
+
+
+def test_week_progress_counts_statuses(ids):
+    subscriber_id = ids[0]
+    week = [m.id for m in milestone_catalog.for_week(2)]
+    first, second, third = week[:3]
+    _run(lambda db: tracking.toggle_status(db, subscriber_id, first))
+    for _ in range(2):
+        _run(lambda db: tracking.toggle_status(db, subscriber_id, second))
+    _run(lambda db: tracking.save_notes(db, subscriber_id, third, "Some cooing"))
+
+    progress = _run(lambda db: week_progress(db, subscriber_id, 2))
+    assert progress == (len(week), 1, 1)
+    assert progress.untracked_count == len(week) - 2